@@ -0,0 +1,168 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections import namedtuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# (conexión, lectura) en segundos
+TIMEOUT = (3.05, 10)
+ESTADOS_REINTENTABLES = (429, 500, 502, 503, 504)
+
+Respuesta = namedtuple("Respuesta", ["estado", "datos", "origen"])
+Respuesta.__doc__ = """
+Resultado de ClienteHTTP.obtener_json.
+
+Attributes:
+    estado (int): Código HTTP (200 también cuando se sirve desde la caché)
+    datos: JSON decodificado (None si la petición falló)
+    origen (str): 'red', 'cache' (vigente, sin petición) o 'revalidada' (304)
+"""
+
+
+class CacheDisco:
+    """
+    Caché de respuestas JSON en disco, un archivo por URL.
+
+    Cada entrada guarda los datos, el momento en que se guardó y los
+    validadores (ETag, Last-Modified) para las peticiones condicionales.
+    """
+
+    def __init__(self, directorio=".cache_http"):
+        self.directorio = directorio
+
+    def _ruta(self, clave):
+        nombre = hashlib.sha256(clave.encode("utf-8")).hexdigest()
+        return os.path.join(self.directorio, f"{nombre}.json")
+
+    def leer(self, clave):
+        """Devuelve la entrada guardada o None."""
+        try:
+            with open(self._ruta(clave), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def guardar(self, clave, entrada):
+        """
+        Guarda la entrada de forma atómica (archivo temporal + rename).
+
+        Cada escritura usa su propio temporal, así varios hilos o procesos
+        pueden guardar la misma URL a la vez: gana el último rename.
+        """
+        os.makedirs(self.directorio, exist_ok=True)
+        descriptor, temporal = tempfile.mkstemp(suffix=".tmp", dir=self.directorio)
+        try:
+            with open(descriptor, "w", encoding="utf-8") as f:
+                json.dump(entrada, f, ensure_ascii=False)
+            os.replace(temporal, self._ruta(clave))
+        except BaseException:
+            os.unlink(temporal)
+            raise
+
+
+class ClienteHTTP:
+    """
+    Cliente HTTP para obtener JSON de APIs con conexiones reutilizadas.
+
+    - Una requests.Session con un pool de conexiones (keep-alive).
+    - Timeouts de conexión y lectura en todas las peticiones.
+    - Reintentos con espera exponencial ante errores de conexión y
+      respuestas 429/5xx (respeta Retry-After).
+    - Caché en disco con TTL: mientras está vigente no se hace la petición;
+      al vencer se revalida con If-None-Match / If-Modified-Since y un 304
+      reutiliza los datos guardados.
+    """
+
+    def __init__(self, timeout=TIMEOUT, reintentos=3, espera_base=0.5,
+                 ttl=300, directorio_cache=".cache_http", conexiones=10):
+        """
+        Args:
+            timeout (tuple): (segundos de conexión, segundos de lectura)
+            reintentos (int): Reintentos después del primer intento
+            espera_base (float): Espera inicial entre reintentos (se duplica)
+            ttl (float): Segundos que una respuesta guardada se usa sin revalidar
+                         (0 = revalidar siempre, None = sin caché)
+            directorio_cache (str): Carpeta de la caché
+            conexiones (int): Conexiones mantenidas por host
+        """
+        self.timeout = timeout
+        self.ttl = ttl
+        self.cache = CacheDisco(directorio_cache) if ttl is not None else None
+
+        politica = Retry(
+            total=reintentos,
+            backoff_factor=espera_base,
+            status_forcelist=ESTADOS_REINTENTABLES,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,  # agotados los reintentos se devuelve la última respuesta
+        )
+        adaptador = HTTPAdapter(pool_connections=conexiones, pool_maxsize=conexiones, max_retries=politica)
+        self.sesion = requests.Session()
+        self.sesion.mount("http://", adaptador)
+        self.sesion.mount("https://", adaptador)
+        self.sesion.headers["Accept"] = "application/json"
+
+    def obtener_json(self, url, params=None):
+        """
+        Obtiene y decodifica un JSON, usando la caché cuando corresponde.
+
+        Args:
+            url (str): URL del recurso
+            params (dict): Parámetros de la consulta
+
+        Returns:
+            Respuesta: (estado, datos, origen)
+
+        Raises:
+            requests.exceptions.RequestException: Si no se pudo conectar
+                después de los reintentos
+        """
+        clave = requests.Request("GET", url, params=params).prepare().url
+        entrada = self.cache.leer(clave) if self.cache else None
+
+        if entrada and time.time() - entrada["guardado"] < self.ttl:
+            return Respuesta(200, entrada["datos"], "cache")
+
+        encabezados = {}
+        if entrada:
+            if entrada.get("etag"):
+                encabezados["If-None-Match"] = entrada["etag"]
+            if entrada.get("last_modified"):
+                encabezados["If-Modified-Since"] = entrada["last_modified"]
+
+        respuesta = self.sesion.get(url, params=params, headers=encabezados, timeout=self.timeout)
+
+        if respuesta.status_code == 304 and entrada:
+            entrada["guardado"] = time.time()
+            self.cache.guardar(clave, entrada)
+            return Respuesta(200, entrada["datos"], "revalidada")
+        if respuesta.status_code != 200:
+            return Respuesta(respuesta.status_code, None, "red")
+
+        datos = respuesta.json()
+        if self.cache:
+            self.cache.guardar(clave, {
+                "url": clave,
+                "guardado": time.time(),
+                "etag": respuesta.headers.get("ETag"),
+                "last_modified": respuesta.headers.get("Last-Modified"),
+                "datos": datos,
+            })
+        return Respuesta(200, datos, "red")
+
+    def cerrar(self):
+        """Cierra las conexiones del pool."""
+        self.sesion.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
@@ -1,24 +1,37 @@
+import asyncio
 import requests
 import json
 from datetime import datetime
 import time
 
-def consumir_api_publica():
-    """Consume una API pública para obtener datos."""
+from cliente_http import ClienteHTTP
+from descarga_async import DescargadorAsync
+from pipeline_sensores import AgregadorSensores, ejecutar_pipeline
+
+# API de ejemplo: JSONPlaceholder (datos de prueba)
+URL_POSTS = "https://jsonplaceholder.typicode.com/posts"
+
+def consumir_api_publica(url=URL_POSTS, cliente=None):
+    """
+    Consume una API pública para obtener datos.
+    
+    Args:
+        url (str): Recurso a consultar
+        cliente (ClienteHTTP): Cliente a reutilizar (por defecto uno nuevo,
+                               con timeouts, reintentos y caché en disco)
+    """
     print("🌐 CONSUMIENDO API PÚBLICA")
     print("=" * 30)
     
+    cliente = cliente or ClienteHTTP()
     try:
-        # API de ejemplo: JSONPlaceholder (datos de prueba)
-        url = "https://jsonplaceholder.typicode.com/posts"
-        
         print(f"📡 Haciendo petición a: {url}")
-        response = requests.get(url)
+        respuesta = cliente.obtener_json(url)
         
         # Verificar status code
-        if response.status_code == 200:
-            print(f"✅ Petición exitosa (Status: {response.status_code})")
-            datos = response.json()
+        if respuesta.estado == 200:
+            print(f"✅ Petición exitosa (Status: {respuesta.estado}, origen: {respuesta.origen})")
+            datos = respuesta.datos
             
             print(f"📊 Se obtuvieron {len(datos)} registros")
             
@@ -29,38 +42,59 @@ def consumir_api_publica():
             
             return datos
         else:
-            print(f"❌ Error en la petición: {response.status_code}")
+            print(f"❌ Error en la petición: {respuesta.estado}")
             return None
             
     except requests.exceptions.RequestException as e:
         print(f"❌ Error de conexión: {e}")
         return None
 
+class EstadisticasPosts:
+    """
+    Estadísticas de posts acumuladas de a partes.
+    
+    Permite procesar cada página apenas llega, sin esperar a tener todos
+    los posts en memoria.
+    """
+    
+    def __init__(self):
+        self.total_posts = 0
+        self.posts_por_usuario = {}
+        self.suma_longitudes = 0  # caracteres de los títulos
+    
+    def agregar(self, posts):
+        """Acumula un lote (o página) de posts."""
+        posts_por_usuario = self.posts_por_usuario
+        for post in posts:
+            user_id = post['userId']
+            posts_por_usuario[user_id] = posts_por_usuario.get(user_id, 0) + 1
+            self.suma_longitudes += len(post['title'])
+            self.total_posts += 1
+
 def procesar_datos_api(datos):
     """Procesa los datos obtenidos de la API."""
     if not datos:
         return
     
+    estadisticas = EstadisticasPosts()
+    estadisticas.agregar(datos)
+    return mostrar_estadisticas_posts(estadisticas)
+
+def mostrar_estadisticas_posts(estadisticas):
+    """Muestra las estadísticas acumuladas y devuelve los posts por usuario."""
     print(f"\n🔧 PROCESANDO DATOS DE LA API")
     print("=" * 35)
     
     # Análisis básico
-    total_posts = len(datos)
-    usuarios_unicos = len(set(post['userId'] for post in datos))
+    total_posts = estadisticas.total_posts
+    posts_por_usuario = estadisticas.posts_por_usuario
+    usuarios_unicos = len(posts_por_usuario)
     
     print(f"📊 Estadísticas generales:")
     print(f"  Total de posts: {total_posts}")
     print(f"  Usuarios únicos: {usuarios_unicos}")
     print(f"  Posts por usuario: {total_posts / usuarios_unicos:.1f}")
     
-    # Análisis por usuario
-    posts_por_usuario = {}
-    for post in datos:
-        user_id = post['userId']
-        if user_id not in posts_por_usuario:
-            posts_por_usuario[user_id] = 0
-        posts_por_usuario[user_id] += 1
-    
     # Usuario más activo
     usuario_mas_activo = max(posts_por_usuario, key=posts_por_usuario.get)
     posts_max = posts_por_usuario[usuario_mas_activo]
@@ -68,52 +102,100 @@ def procesar_datos_api(datos):
     print(f"\n👤 Usuario más activo: Usuario {usuario_mas_activo} ({posts_max} posts)")
     
     # Longitud promedio de títulos
-    longitudes = [len(post['title']) for post in datos]
-    longitud_promedio = sum(longitudes) / len(longitudes)
+    longitud_promedio = estadisticas.suma_longitudes / total_posts
     
     print(f"📏 Longitud promedio de títulos: {longitud_promedio:.1f} caracteres")
     
     return posts_por_usuario
 
-def simular_api_tiempo_real():
-    """Simula el consumo de una API en tiempo real."""
+async def consumir_api_paginada(url=URL_POSTS, tamano_pagina=10, descargador=None):
+    """
+    Consume un recurso paginado pidiendo varias páginas a la vez.
+    
+    Cada página se acumula en las estadísticas apenas llega.
+    
+    Args:
+        url (str): Recurso paginado (parámetros _page y _limit)
+        tamano_pagina (int): Posts por página
+        descargador (DescargadorAsync): Descargador a reutilizar
+    
+    Returns:
+        EstadisticasPosts: Estadísticas de todos los posts
+    """
+    print(f"🌐 CONSUMIENDO API PAGINADA: {url}")
+    
+    propio = descargador is None
+    descargador = descargador or DescargadorAsync()
+    estadisticas = EstadisticasPosts()
+    paginas = 0
+    try:
+        async for pagina in descargador.paginas(url, tamano_pagina):
+            estadisticas.agregar(pagina)
+            paginas += 1
+    finally:
+        if propio:
+            descargador.cerrar()
+    
+    print(f"✅ {paginas} páginas, {estadisticas.total_posts} posts")
+    return estadisticas
+
+UNIDADES_SENSOR = {"Sensor_Temp_01": "°C", "Sensor_Hum_01": "%", "Sensor_Pres_01": "hPa"}
+
+def leer_sensores(i):
+    """Lecturas (sensor, momento, valor) simuladas de la iteración `i`."""
+    momento = time.time()
+    return [
+        ("Sensor_Temp_01", momento, round(20 + (i * 2) + (i * 0.5), 1)),  # Simulando temperatura
+        ("Sensor_Hum_01", momento, round(45 + (i * 3) - (i * 0.2), 1)),   # Simulando humedad
+        ("Sensor_Pres_01", momento, round(1013 + (i * 1) + (i * 0.1), 1)),  # Simulando presión
+    ]
+
+def simular_api_tiempo_real(iteraciones=5, intervalo=2, duracion_ventana=10):
+    """
+    Simula el consumo de una API en tiempo real.
+    
+    Un productor asyncio emite las lecturas de cada iteración a una cola
+    acotada y un consumidor las agrega por sensor en ventanas a medida que
+    llegan (ver pipeline_sensores).
+    
+    Args:
+        iteraciones (int): Lecturas por sensor
+        intervalo (float): Segundos entre iteraciones
+        duracion_ventana (float): Segundos de cada ventana de agregados
+    
+    Returns:
+        list: Lecturas con sensor, timestamp, valor y unidad
+    """
     print(f"\n⏰ SIMULACIÓN DE API EN TIEMPO REAL")
     print("=" * 40)
     
-    # Simular datos de sensores IoT
-    sensores = ["Sensor_Temp_01", "Sensor_Hum_01", "Sensor_Pres_01"]
     datos_tiempo_real = []
     
-    print(f"🔄 Recolectando datos cada 2 segundos (5 iteraciones)...")
-    
-    for i in range(5):
-        timestamp = datetime.now()
-        
-        for sensor in sensores:
-            if "Temp" in sensor:
-                valor = round(20 + (i * 2) + (i * 0.5), 1)  # Simulando temperatura
-                unidad = "°C"
-            elif "Hum" in sensor:
-                valor = round(45 + (i * 3) - (i * 0.2), 1)  # Simulando humedad
-                unidad = "%"
-            else:
-                valor = round(1013 + (i * 1) + (i * 0.1), 1)  # Simulando presión
-                unidad = "hPa"
-            
-            lectura = {
+    def registrar_lote(lote):
+        timestamp = datetime.fromtimestamp(lote[0][1])
+        for sensor, _, valor in lote:
+            unidad = UNIDADES_SENSOR[sensor]
+            datos_tiempo_real.append({
                 "sensor": sensor,
                 "timestamp": timestamp.isoformat(),
                 "valor": valor,
                 "unidad": unidad
-            }
-            
-            datos_tiempo_real.append(lectura)
+            })
             print(f"  📊 {sensor}: {valor} {unidad} [{timestamp.strftime('%H:%M:%S')}]")
-        
-        print(f"  ⏱️ Iteración {i+1}/5 completada")
-        time.sleep(2)  # Esperar 2 segundos
+        iteracion = len(datos_tiempo_real) // len(lote)
+        print(f"  ⏱️ Iteración {iteracion}/{iteraciones} completada")
+    
+    print(f"🔄 Recolectando datos cada {intervalo} segundos ({iteraciones} iteraciones)...")
+    
+    agregador = AgregadorSensores(duracion_ventana=duracion_ventana)
+    asyncio.run(ejecutar_pipeline(leer_sensores, iteraciones, agregador,
+                                  intervalo=intervalo, al_recibir=registrar_lote))
     
     print(f"\n✅ Recolección completada: {len(datos_tiempo_real)} lecturas")
+    for sensor, estado in agregador.sensores.items():
+        for ventana in estado.cerradas:
+            print(f"  📈 {sensor}: promedio {ventana.promedio:.2f}, "
+                  f"mín {ventana.minimo}, máx {ventana.maximo} ({ventana.cantidad} lecturas)")
     return datos_tiempo_real
 
 def guardar_datos_json(datos, nombre_archivo):
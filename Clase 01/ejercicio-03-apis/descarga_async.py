@@ -0,0 +1,147 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+
+from cliente_http import ClienteHTTP
+
+
+class LimitadorTasa:
+    """
+    Limita las peticiones por host con un balde de fichas (token bucket).
+
+    Cada host recibe `tasa` fichas por segundo y acumula hasta `rafaga`;
+    cada petición consume una ficha o espera a que haya una.
+    """
+
+    def __init__(self, tasa, rafaga=1):
+        """
+        Args:
+            tasa (float): Peticiones por segundo por host
+            rafaga (int): Peticiones que se pueden hacer seguidas
+        """
+        self.tasa = tasa
+        self.rafaga = rafaga
+        self._baldes = {}  # host -> [fichas, último momento de recarga]
+        self._cerrojos = {}
+
+    async def esperar(self, host):
+        """Espera hasta que `host` tenga una ficha disponible y la consume."""
+        cerrojo = self._cerrojos.setdefault(host, asyncio.Lock())
+        async with cerrojo:
+            balde = self._baldes.setdefault(host, [self.rafaga, time.monotonic()])
+            while True:
+                ahora = time.monotonic()
+                balde[0] = min(self.rafaga, balde[0] + (ahora - balde[1]) * self.tasa)
+                balde[1] = ahora
+                if balde[0] >= 1:
+                    balde[0] -= 1
+                    return
+                await asyncio.sleep((1 - balde[0]) / self.tasa)
+
+
+class DescargadorAsync:
+    """
+    Descarga muchos recursos JSON en paralelo desde asyncio.
+
+    Las peticiones usan un ClienteHTTP (pool de conexiones, timeouts,
+    reintentos y caché) en un grupo de hilos propio; un semáforo acota
+    cuántas hay en vuelo y un LimitadorTasa opcional respeta el límite de
+    cada host.
+    """
+
+    def __init__(self, cliente=None, concurrencia=10, tasa_por_host=None, rafaga=1):
+        """
+        Args:
+            cliente (ClienteHTTP): Cliente a usar (por defecto uno nuevo con
+                                   un pool del tamaño de la concurrencia)
+            concurrencia (int): Peticiones simultáneas como máximo
+            tasa_por_host (float): Peticiones por segundo por host (None = sin límite)
+            rafaga (int): Peticiones seguidas permitidas por host
+        """
+        self.cliente = cliente or ClienteHTTP(conexiones=concurrencia)
+        self.concurrencia = concurrencia
+        self.limitador = LimitadorTasa(tasa_por_host, rafaga) if tasa_por_host else None
+        self._semaforo = asyncio.Semaphore(concurrencia)
+        self._hilos = ThreadPoolExecutor(max_workers=concurrencia, thread_name_prefix="descarga")
+
+    async def obtener(self, url, params=None):
+        """
+        Obtiene un recurso sin bloquear el bucle de eventos.
+
+        Returns:
+            Respuesta: (estado, datos, origen), como ClienteHTTP.obtener_json
+
+        Raises:
+            requests.exceptions.RequestException: Si no se pudo conectar
+        """
+        async with self._semaforo:
+            if self.limitador:
+                await self.limitador.esperar(urlsplit(url).netloc)
+            bucle = asyncio.get_running_loop()
+            return await bucle.run_in_executor(self._hilos, self.cliente.obtener_json, url, params)
+
+    async def obtener_varios(self, urls):
+        """
+        Obtiene varios recursos en paralelo.
+
+        Returns:
+            list: Respuestas en el mismo orden que `urls`
+        """
+        return await asyncio.gather(*(self.obtener(url) for url in urls))
+
+    async def paginas(self, url, tamano_pagina=10, params=None,
+                      parametro_pagina="_page", parametro_limite="_limit", max_paginas=None):
+        """
+        Recorre un recurso paginado, pidiendo varias páginas a la vez.
+
+        Se piden tandas de tantas páginas como la concurrencia y se entregan
+        en orden; el recorrido termina con la primera página incompleta (o
+        vacía) o al llegar a `max_paginas`.
+
+        Args:
+            url (str): Recurso paginado
+            tamano_pagina (int): Elementos por página
+            params (dict): Parámetros adicionales de la consulta
+            parametro_pagina (str): Nombre del parámetro de número de página
+            parametro_limite (str): Nombre del parámetro de tamaño de página
+            max_paginas (int): Páginas como máximo (None = hasta la última)
+
+        Yields:
+            list: Elementos de cada página
+
+        Raises:
+            requests.exceptions.HTTPError: Si una página responde con error
+        """
+        pagina = 1
+        while max_paginas is None or pagina <= max_paginas:
+            ultima = pagina + self.concurrencia - 1
+            if max_paginas is not None:
+                ultima = min(ultima, max_paginas)
+            tanda = [
+                self.obtener(url, {**(params or {}), parametro_pagina: numero, parametro_limite: tamano_pagina})
+                for numero in range(pagina, ultima + 1)
+            ]
+            for numero, respuesta in zip(range(pagina, ultima + 1), await asyncio.gather(*tanda)):
+                if respuesta.estado != 200:
+                    raise requests.exceptions.HTTPError(
+                        f"{respuesta.estado} al pedir la página {numero} de {url}")
+                if respuesta.datos:
+                    yield respuesta.datos
+                if len(respuesta.datos or ()) < tamano_pagina:
+                    return
+            pagina = ultima + 1
+
+    def cerrar(self):
+        """Libera los hilos y las conexiones."""
+        self._hilos.shutdown(wait=True)
+        self.cliente.cerrar()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.cerrar()
+
@@ -0,0 +1,135 @@
+import json
+import re
+
+
+TAMANO_BLOQUE = 1 << 16  # caracteres leídos por vez
+
+_decodificador = json.JSONDecoder()
+_ESPACIOS = " \t\r\n"
+_SALTAR_ESPACIOS = re.compile(r"[ \t\r\n]*")
+_COMA = re.compile(r"[ \t\r\n]*,[ \t\r\n]*")
+_CONTINUAN_NUMERO = frozenset("0123456789.eE+-")
+
+
+def iterar_json(nombre_archivo, tamano_bloque=TAMANO_BLOQUE):
+    """
+    Recorre los registros de un archivo JSON sin cargarlo entero.
+
+    Acepta:
+    - Un arreglo JSON ([{...}, {...}]): los elementos se decodifican de a
+      uno a medida que se lee el archivo por bloques.
+    - JSON lines (un objeto por línea).
+    - Cualquier otro valor JSON único, que se entrega como un solo registro.
+
+    Args:
+        nombre_archivo (str): Ruta del archivo
+        tamano_bloque (int): Caracteres leídos por vez
+
+    Yields:
+        Cada registro decodificado
+
+    Raises:
+        json.JSONDecodeError: Si el contenido no es JSON válido
+    """
+    with open(nombre_archivo, 'r', encoding='utf-8') as archivo:
+        inicio = archivo.read(tamano_bloque).lstrip(_ESPACIOS)
+        while not inicio:
+            # Bloques solo con espacios: seguir hasta el primer carácter
+            bloque = archivo.read(tamano_bloque)
+            if not bloque:
+                return
+            inicio = bloque.lstrip(_ESPACIOS)
+        primero = inicio[:1]
+        if primero == '[':
+            yield from _iterar_arreglo(archivo, inicio, tamano_bloque)
+        elif primero == '{':
+            yield from _iterar_lineas(archivo, inicio)
+        else:
+            yield json.loads(inicio + archivo.read())
+
+
+def _iterar_arreglo(archivo, texto, tamano_bloque):
+    """
+    Decodifica los elementos de un arreglo JSON a medida que se leen.
+
+    Sigue la misma gramática que json.load: exactamente una coma entre
+    elementos, sin coma final y nada después del corchete de cierre.
+    """
+    posicion = texto.index('[') + 1
+    fin_archivo = False
+
+    def leer_mas():
+        # Descartar lo ya procesado y leer más. Leer al menos lo pendiente
+        # hace que un registro grande se decodifique pocas veces
+        nonlocal texto, posicion, fin_archivo
+        texto = texto[posicion:]
+        bloque = archivo.read(max(tamano_bloque, len(texto)))
+        fin_archivo = not bloque
+        texto += bloque
+        posicion = 0
+
+    def siguiente():
+        """Salta espacios y devuelve el próximo carácter ('' al final del archivo)."""
+        nonlocal posicion
+        while True:
+            posicion = _SALTAR_ESPACIOS.match(texto, posicion).end()
+            if posicion < len(texto) or fin_archivo:
+                return texto[posicion:posicion + 1]
+            leer_mas()
+
+    if siguiente() == ']':
+        caracter = ']'
+    else:
+        while True:
+            try:
+                registro, fin = _decodificador.raw_decode(texto, posicion)
+                # Un valor que termina justo al final del bloque podría continuar
+                # en el siguiente, y un número cortado ("1.25e" + "-3") se
+                # decodifica en parte: está completo si lo que sigue no lo continúa
+                completo = fin_archivo or (fin < len(texto) and texto[fin] not in _CONTINUAN_NUMERO)
+            except json.JSONDecodeError:
+                if fin_archivo:
+                    raise
+                completo = False
+            if not completo:
+                leer_mas()
+                continue
+
+            yield registro
+            coma = _COMA.match(texto, fin)
+            if coma and coma.end() < len(texto):
+                posicion = coma.end()  # caso común: la coma y el siguiente valor ya están leídos
+                continue
+            posicion = fin
+            caracter = siguiente()
+            if caracter != ',':
+                break
+            posicion += 1
+            siguiente()  # después de la coma tiene que venir un valor
+
+    if caracter != ']':
+        raise json.JSONDecodeError("Expecting ',' delimiter", texto, posicion)
+    posicion += 1
+    if siguiente():
+        raise json.JSONDecodeError("Extra data", texto, posicion)
+
+
+def _iterar_lineas(archivo, inicio):
+    """Decodifica JSON lines; si la primera línea no es un objeto completo, lee un único valor."""
+    resto = archivo.readline()
+    primera, salto, pendiente = (inicio + resto).partition('\n')
+    try:
+        registro = json.loads(primera)
+    except json.JSONDecodeError:
+        # JSON con formato (un objeto en varias líneas): un solo registro
+        yield json.loads(primera + salto + pendiente + archivo.read())
+        return
+    yield registro
+
+    lineas = pendiente.split('\n')
+    for linea in lineas:
+        if linea.strip():
+            yield json.loads(linea)
+    for linea in archivo:
+        if linea.strip():
+            yield json.loads(linea)
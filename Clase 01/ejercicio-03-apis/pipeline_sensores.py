@@ -0,0 +1,184 @@
+import asyncio
+import time
+from collections import deque
+
+
+class Ventana:
+    """Agregado (cantidad, suma, mínimo, máximo) de una ventana de tiempo."""
+
+    __slots__ = ("numero", "inicio", "cantidad", "suma", "minimo", "maximo")
+
+    def __init__(self, numero, inicio, valor):
+        self.numero = numero    # momento // duración de la ventana
+        self.inicio = inicio
+        self.cantidad = 1
+        self.suma = valor
+        self.minimo = valor
+        self.maximo = valor
+
+    @property
+    def promedio(self):
+        return self.suma / self.cantidad
+
+    def __repr__(self):
+        return (f"Ventana(inicio={self.inicio}, cantidad={self.cantidad}, promedio={self.promedio:.2f}, "
+                f"minimo={self.minimo}, maximo={self.maximo})")
+
+
+class EstadoSensor:
+    """
+    Lecturas recientes y ventanas de un sensor.
+
+    Attributes:
+        lecturas (deque): Últimas lecturas (momento, valor), buffer circular
+        actual (Ventana): Ventana en curso (None antes de la primera lectura)
+        cerradas (deque): Últimas ventanas completas
+        tardias (int): Lecturas descartadas por llegar después de cerrada su ventana
+    """
+
+    __slots__ = ("lecturas", "actual", "cerradas", "tardias")
+
+    def __init__(self, capacidad, ventanas_guardadas):
+        self.lecturas = deque(maxlen=capacidad)
+        self.actual = None
+        self.cerradas = deque(maxlen=ventanas_guardadas)
+        self.tardias = 0
+
+
+class AgregadorSensores:
+    """
+    Agregados por sensor en ventanas fijas (tumbling) actualizados al vuelo.
+
+    Cada lectura actualiza la ventana en curso de su sensor en O(1); al
+    llegar una lectura de una ventana posterior, la actual se cierra y se
+    guarda. Las lecturas de cada sensor deben llegar en orden de tiempo.
+    """
+
+    def __init__(self, duracion_ventana=1.0, capacidad=1024, ventanas_guardadas=60, al_cerrar=None):
+        """
+        Args:
+            duracion_ventana (float): Segundos por ventana
+            capacidad (int): Lecturas recientes guardadas por sensor
+            ventanas_guardadas (int): Ventanas cerradas guardadas por sensor
+            al_cerrar (callable): Se llama con (sensor, ventana) al cerrar cada ventana
+        """
+        self.duracion_ventana = duracion_ventana
+        self.capacidad = capacidad
+        self.ventanas_guardadas = ventanas_guardadas
+        self.al_cerrar = al_cerrar
+        self.sensores = {}
+        self.procesadas = 0
+
+    def procesar(self, sensor, momento, valor):
+        """Incorpora una lectura."""
+        estado = self.sensores.get(sensor)
+        if estado is None:
+            estado = self.sensores[sensor] = EstadoSensor(self.capacidad, self.ventanas_guardadas)
+        estado.lecturas.append((momento, valor))
+        self.procesadas += 1
+
+        numero = momento // self.duracion_ventana
+        ventana = estado.actual
+        if ventana is not None and ventana.numero == numero:
+            ventana.cantidad += 1
+            ventana.suma += valor
+            if valor < ventana.minimo:
+                ventana.minimo = valor
+            elif valor > ventana.maximo:
+                ventana.maximo = valor
+        elif ventana is None or numero > ventana.numero:
+            if ventana is not None:
+                self._cerrar(sensor, estado)
+            estado.actual = Ventana(numero, numero * self.duracion_ventana, valor)
+        else:
+            estado.tardias += 1
+
+    def procesar_lote(self, lecturas):
+        """Incorpora un lote de lecturas (sensor, momento, valor)."""
+        procesar = self.procesar
+        for sensor, momento, valor in lecturas:
+            procesar(sensor, momento, valor)
+
+    def _cerrar(self, sensor, estado):
+        estado.cerradas.append(estado.actual)
+        if self.al_cerrar:
+            self.al_cerrar(sensor, estado.actual)
+
+    def cerrar_ventanas(self):
+        """Cierra las ventanas en curso (al terminar el flujo)."""
+        for sensor, estado in self.sensores.items():
+            if estado.actual is not None:
+                self._cerrar(sensor, estado)
+                estado.actual = None
+
+
+async def productor(cola, generar_lote, lotes, intervalo=0.0):
+    """
+    Pone lotes de lecturas en la cola; espera si está llena (contrapresión).
+
+    Args:
+        cola (asyncio.Queue): Cola acotada hacia el consumidor
+        generar_lote (callable): Recibe el número de lote y devuelve sus lecturas
+        lotes (int): Lotes a producir
+        intervalo (float): Segundos entre lotes
+    """
+    for numero in range(lotes):
+        await cola.put(generar_lote(numero))
+        if intervalo:
+            await asyncio.sleep(intervalo)
+    await cola.put(None)  # fin del flujo
+
+
+async def consumidor(cola, agregador, al_recibir=None):
+    """
+    Toma lotes de la cola y los agrega hasta recibir el fin del flujo.
+
+    Args:
+        cola (asyncio.Queue): Cola con lotes de lecturas (sensor, momento, valor)
+        agregador (AgregadorSensores): Destino de las lecturas
+        al_recibir (callable): Se llama con cada lote ya agregado
+    """
+    while True:
+        lote = await cola.get()
+        if lote is None:
+            break
+        agregador.procesar_lote(lote)
+        if al_recibir:
+            al_recibir(lote)
+    agregador.cerrar_ventanas()
+
+
+async def ejecutar_pipeline(generar_lote, lotes, agregador=None, intervalo=0.0,
+                            tamano_cola=64, al_recibir=None):
+    """
+    Ejecuta productor y consumidor conectados por una cola acotada.
+
+    Returns:
+        AgregadorSensores: Agregador con los resultados
+    """
+    agregador = agregador or AgregadorSensores()
+    cola = asyncio.Queue(maxsize=tamano_cola)
+    await asyncio.gather(
+        productor(cola, generar_lote, lotes, intervalo),
+        consumidor(cola, agregador, al_recibir),
+    )
+    return agregador
+
+
+def medir_rendimiento(lecturas=1_000_000, sensores=100, tamano_lote=1000):
+    """
+    Mide cuántas lecturas por segundo procesa el pipeline completo.
+
+    Returns:
+        float: Lecturas por segundo
+    """
+    nombres = [f"Sensor_{i:03d}" for i in range(sensores)]
+
+    def generar_lote(numero):
+        base = numero * tamano_lote
+        # 1000 lecturas por segundo simulado, repartidas entre los sensores
+        return [(nombres[i % sensores], i / 1000, float(i % 97)) for i in range(base, base + tamano_lote)]
+
+    inicio = time.perf_counter()
+    agregador = asyncio.run(ejecutar_pipeline(generar_lote, lecturas // tamano_lote))
+    return agregador.procesadas / (time.perf_counter() - inicio)
@@ -2,14 +2,30 @@ import json
 import os
 from collections import Counter, defaultdict
 from datetime import datetime
+from itertools import chain
 
-def cargar_datos_json(nombre_archivo):
-    """Carga datos desde un archivo JSON."""
+from analisis_texto import ContadorPalabras
+from consultas_logs import IndiceLogs
+from lectura_json import iterar_json
+
+def cargar_datos_json(nombre_archivo, incremental=False):
+    """
+    Carga datos desde un archivo JSON.
+    
+    Args:
+        nombre_archivo (str): Archivo JSON (arreglo, objeto o JSON lines)
+        incremental (bool): Si es True devuelve un iterador que lee los
+                            registros a medida que se consumen, sin cargar
+                            el archivo entero en memoria
+    """
     print(f"📂 CARGANDO DATOS JSON")
     print("=" * 25)
     
     try:
-        if os.path.exists(nombre_archivo):
+        if os.path.exists(nombre_archivo) and incremental:
+            print(f"✅ Archivo abierto para lectura incremental: {nombre_archivo}")
+            return iterar_json(nombre_archivo)
+        elif os.path.exists(nombre_archivo):
             with open(nombre_archivo, 'r', encoding='utf-8') as archivo:
                 datos = json.load(archivo)
             
@@ -27,61 +43,76 @@ def cargar_datos_json(nombre_archivo):
         print(f"❌ Error inesperado: {e}")
         return None
 
+def _con_primero(registros):
+    """Devuelve un iterador con todos los registros, o None si no hay ninguno."""
+    iterador = iter(registros)
+    for primero in iterador:
+        return chain([primero], iterador)
+    return None
+
 def procesar_posts_api(datos_posts):
-    """Procesa datos de posts obtenidos de API."""
-    if not datos_posts:
+    """
+    Procesa datos de posts obtenidos de API.
+    
+    Se recorre una sola vez, así que acepta una lista o un iterador
+    (cargar_datos_json(..., incremental=True)): solo se guardan contadores.
+    """
+    datos_posts = _con_primero(datos_posts or ())
+    if datos_posts is None:
         return
     
     print(f"\n📝 PROCESANDO POSTS DE API")
     print("=" * 30)
     
-    # Análisis de contenido
-    palabras_comunes = Counter()
-    longitudes_titulo = []
-    longitudes_body = []
+    # Análisis de contenido (las palabras se tokenizan por lotes)
+    palabras_comunes = ContadorPalabras()
+    total_posts = 0
+    suma_titulos = 0
+    suma_body = 0
+    posts_por_usuario = defaultdict(lambda: [0, 0])  # user_id -> [posts, caracteres de títulos]
     
     for post in datos_posts:
         # Análisis de títulos
-        titulo = post.get('title', '').lower()
-        palabras_titulo = titulo.split()
-        palabras_comunes.update(palabras_titulo)
-        longitudes_titulo.append(len(titulo))
+        titulo = post.get('title', '')
+        palabras_comunes.agregar(titulo)
+        suma_titulos += len(titulo.lower())
         
         # Análisis de contenido
-        body = post.get('body', '')
-        longitudes_body.append(len(body))
+        suma_body += len(post.get('body', ''))
+        total_posts += 1
+        
+        # Análisis por usuario
+        acumulado = posts_por_usuario[post.get('userId')]
+        acumulado[0] += 1
+        acumulado[1] += len(titulo)
     
     # Estadísticas
     print(f"📊 Estadísticas de contenido:")
-    print(f"  Longitud promedio título: {sum(longitudes_titulo)/len(longitudes_titulo):.1f} caracteres")
-    print(f"  Longitud promedio body: {sum(longitudes_body)/len(longitudes_body):.1f} caracteres")
+    print(f"  Longitud promedio título: {suma_titulos/total_posts:.1f} caracteres")
+    print(f"  Longitud promedio body: {suma_body/total_posts:.1f} caracteres")
     
     # Palabras más comunes en títulos
     print(f"\n🏷️ Top 5 palabras en títulos:")
-    for palabra, frecuencia in palabras_comunes.most_common(5):
+    for palabra, frecuencia in palabras_comunes.mas_comunes(5):
         print(f"  {palabra}: {frecuencia} veces")
     
-    # Análisis por usuario
-    posts_por_usuario = defaultdict(list)
-    for post in datos_posts:
-        user_id = post.get('userId')
-        posts_por_usuario[user_id].append(post)
-    
     print(f"\n👥 Análisis por usuario:")
-    for user_id, posts in sorted(posts_por_usuario.items())[:5]:
-        promedio_titulo = sum(len(p.get('title', '')) for p in posts) / len(posts)
-        print(f"  Usuario {user_id}: {len(posts)} posts, título promedio: {promedio_titulo:.1f} chars")
+    for user_id, (posts, caracteres) in sorted(posts_por_usuario.items())[:5]:
+        promedio_titulo = caracteres / posts
+        print(f"  Usuario {user_id}: {posts} posts, título promedio: {promedio_titulo:.1f} chars")
 
 def procesar_sensores_tiempo_real(datos_sensores):
-    """Procesa datos de sensores IoT."""
-    if not datos_sensores:
+    """Procesa datos de sensores IoT (lista o iterador, en una sola pasada)."""
+    datos_sensores = _con_primero(datos_sensores or ())
+    if datos_sensores is None:
         return
     
     print(f"\n🌡️ PROCESANDO DATOS DE SENSORES")
     print("=" * 35)
     
-    # Agrupar por tipo de sensor
-    sensores_por_tipo = defaultdict(list)
+    # Agregados por tipo de sensor, actualizados lectura a lectura
+    # (sin guardar listas de lecturas)
+    sensores_por_tipo = {}
     for lectura in datos_sensores:
         sensor = lectura.get('sensor', '')
         if 'Temp' in sensor:
@@ -93,28 +124,35 @@ def procesar_sensores_tiempo_real(datos_sensores):
         else:
             tipo = 'Otro'
         
-        sensores_por_tipo[tipo].append(lectura)
+        valor = lectura.get('valor', 0)
+        agregado = sensores_por_tipo.get(tipo)
+        if agregado is None:
+            sensores_por_tipo[tipo] = {
+                "lecturas": 1, "suma": valor, "minimo": valor, "maximo": valor,
+                "primero": valor, "ultimo": valor, "unidad": lectura.get('unidad', '')
+            }
+        else:
+            agregado["lecturas"] += 1
+            agregado["suma"] += valor
+            agregado["minimo"] = min(agregado["minimo"], valor)
+            agregado["maximo"] = max(agregado["maximo"], valor)
+            agregado["ultimo"] = valor
     
     # Análisis por tipo de sensor
-    for tipo, lecturas in sensores_por_tipo.items():
-        valores = [l.get('valor', 0) for l in lecturas]
+    for tipo, agregado in sensores_por_tipo.items():
+        promedio = agregado["suma"] / agregado["lecturas"]
+        unidad = agregado["unidad"]
         
-        if valores:
-            promedio = sum(valores) / len(valores)
-            maximo = max(valores)
-            minimo = min(valores)
-            unidad = lecturas[0].get('unidad', '')
-            
-            print(f"\n📊 {tipo}:")
-            print(f"  Lecturas: {len(lecturas)}")
-            print(f"  Promedio: {promedio:.2f} {unidad}")
-            print(f"  Máximo: {maximo} {unidad}")
-            print(f"  Mínimo: {minimo} {unidad}")
-            
-            # Tendencia simple
-            if len(valores) >= 2:
-                tendencia = "↗️ Creciente" if valores[-1] > valores[0] else "↘️ Decreciente"
-                print(f"  Tendencia: {tendencia}")
+        print(f"\n📊 {tipo}:")
+        print(f"  Lecturas: {agregado['lecturas']}")
+        print(f"  Promedio: {promedio:.2f} {unidad}")
+        print(f"  Máximo: {agregado['maximo']} {unidad}")
+        print(f"  Mínimo: {agregado['minimo']} {unidad}")
+        
+        # Tendencia simple
+        if agregado["lecturas"] >= 2:
+            tendencia = "↗️ Creciente" if agregado["ultimo"] > agregado["primero"] else "↘️ Decreciente"
+            print(f"  Tendencia: {tendencia}")
 
 def crear_json_complejo():
     """Crea un archivo JSON con estructura compleja."""
@@ -256,56 +294,67 @@ def analizar_json_complejo(datos_empresa):
         for proyecto in proyectos:
             print(f"  - {proyecto['nombre']}: {proyecto['estado']}")
 
-def transformar_y_filtrar():
-    """Demuestra transformaciones y filtros complejos."""
+LOGS_EJEMPLO = [
+    {"timestamp": "2024-06-12 10:30:15", "level": "INFO", "message": "Usuario conectado", "user_id": 123},
+    {"timestamp": "2024-06-12 10:31:22", "level": "ERROR", "message": "Conexión fallida", "user_id": 456},
+    {"timestamp": "2024-06-12 10:32:10", "level": "INFO", "message": "Consulta ejecutada", "user_id": 123},
+    {"timestamp": "2024-06-12 10:33:45", "level": "WARNING", "message": "Memoria baja", "user_id": None},
+    {"timestamp": "2024-06-12 10:34:12", "level": "ERROR", "message": "Base de datos no disponible", "user_id": 789}
+]
+
+def transformar_y_filtrar(logs_servidor=None):
+    """
+    Demuestra transformaciones y filtros complejos.
+    
+    Los logs se indexan una vez (IndiceLogs) y cada pregunta se responde
+    con los índices, sin volver a recorrerlos.
+    
+    Args:
+        logs_servidor (iterable): Logs a analizar (por defecto LOGS_EJEMPLO)
+    """
     print(f"\n🔄 TRANSFORMACIONES Y FILTROS")
     print("=" * 35)
     
-    # Datos de ejemplo: logs de servidor
-    logs_servidor = [
-        {"timestamp": "2024-06-12 10:30:15", "level": "INFO", "message": "Usuario conectado", "user_id": 123},
-        {"timestamp": "2024-06-12 10:31:22", "level": "ERROR", "message": "Conexión fallida", "user_id": 456},
-        {"timestamp": "2024-06-12 10:32:10", "level": "INFO", "message": "Consulta ejecutada", "user_id": 123},
-        {"timestamp": "2024-06-12 10:33:45", "level": "WARNING", "message": "Memoria baja", "user_id": None},
-        {"timestamp": "2024-06-12 10:34:12", "level": "ERROR", "message": "Base de datos no disponible", "user_id": 789}
-    ]
+    indice = IndiceLogs(LOGS_EJEMPLO if logs_servidor is None else logs_servidor)
     
     # Filtrar solo errores
-    errores = [log for log in logs_servidor if log['level'] == 'ERROR']
-    print(f"❌ Errores encontrados: {len(errores)}")
-    for error in errores:
+    errores = indice.mascara(nivel='ERROR')
+    print(f"❌ Errores encontrados: {errores.bit_count()}")
+    for error in indice.registros(errores):
         print(f"  {error['timestamp']}: {error['message']}")
     
     # Contar logs por nivel
-    niveles = Counter(log['level'] for log in logs_servidor)
     print(f"\n📊 Logs por nivel:")
-    for nivel, count in niveles.items():
+    for nivel, count in indice.conteo_por_nivel().items():
         print(f"  {nivel}: {count}")
     
     # Usuarios únicos (excluyendo None)
-    usuarios_unicos = set(log['user_id'] for log in logs_servidor if log['user_id'] is not None)
+    usuarios_unicos = indice.usuarios_unicos()
     print(f"\n👥 Usuarios únicos: {len(usuarios_unicos)}")
     print(f"  IDs: {sorted(list(usuarios_unicos))}")
     
-    # Guardar logs filtrados
-    with open('logs_errores.json', 'w', encoding='utf-8') as archivo:
-        json.dump(errores, archivo, indent=2, ensure_ascii=False)
+    # Guardar logs filtrados (JSON lines, escritos de a uno)
+    indice.exportar_jsonl('logs_errores.jsonl', errores)
     
-    print(f"\n💾 Errores guardados en: logs_errores.json")
+    print(f"\n💾 Errores guardados en: logs_errores.jsonl")
+    return indice
 
 def main():
     """Función principal."""
     print("📄 BOOTCAMP INGENIERÍA DE DATOS - PROCESAMIENTO JSON")
     print("=" * 55)
     
-    # Intentar cargar datos existentes
-    posts = cargar_datos_json('posts_api.json')
-    if posts:
-        procesar_posts_api(posts)
-    
-    sensores = cargar_datos_json('sensores_tiempo_real.json')
-    if sensores:
-        procesar_sensores_tiempo_real(sensores)
+    # Intentar cargar datos existentes (lectura incremental: no se cargan enteros)
+    try:
+        posts = cargar_datos_json('posts_api.json', incremental=True)
+        if posts:
+            procesar_posts_api(posts)
+        
+        sensores = cargar_datos_json('sensores_tiempo_real.json', incremental=True)
+        if sensores:
+            procesar_sensores_tiempo_real(sensores)
+    except json.JSONDecodeError as e:
+        print(f"❌ Error al parsear JSON: {e}")
     
     # Crear y analizar JSON complejo
     empresa = crear_json_complejo()
@@ -0,0 +1,217 @@
+# Tests unitarios para el cliente HTTP con caché y la descarga asyncio
+# Clase 01: Consumo de APIs
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import requests
+    from cliente_http import CacheDisco, ClienteHTTP
+    from descarga_async import DescargadorAsync
+except ImportError:  # requests no está instalado
+    ClienteHTTP = None
+
+ETAG = '"v1"'
+ULTIMA_MODIFICACION = "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+class ManejadorJSON(BaseHTTPRequestHandler):
+    """Responde siempre el mismo JSON."""
+
+    def do_GET(self):
+        cuerpo = json.dumps({"ruta": self.path}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def log_message(self, *args):
+        pass
+
+
+class ManejadorGuion(BaseHTTPRequestHandler):
+    """
+    Responde según el guion del servidor y anota cada petición recibida.
+
+    server.guion es una lista de acciones que se consumen en orden (la
+    última se repite): un código de estado, o 'lento' para demorar la
+    respuesta más que el timeout de lectura del cliente.
+    """
+
+    def do_GET(self):
+        servidor = self.server
+        with servidor.cerrojo:
+            servidor.peticiones.append(dict(self.headers))
+            accion = servidor.guion[min(len(servidor.peticiones), len(servidor.guion)) - 1]
+
+        if accion == "lento":
+            time.sleep(0.5)
+            accion = 200
+        if accion == 200 and (self.headers.get("If-None-Match") == ETAG
+                              or self.headers.get("If-Modified-Since") == ULTIMA_MODIFICACION):
+            accion = 304
+
+        cuerpo = json.dumps({"ruta": self.path}).encode("utf-8") if accion == 200 else b""
+        try:
+            self.send_response(accion)
+            if accion in (200, 304):
+                if servidor.validadores.get("etag"):
+                    self.send_header("ETag", ETAG)
+                if servidor.validadores.get("last_modified"):
+                    self.send_header("Last-Modified", ULTIMA_MODIFICACION)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(cuerpo)))
+            self.end_headers()
+            self.wfile.write(cuerpo)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # el cliente ya abandonó la petición por timeout
+
+    def log_message(self, *args):
+        pass
+
+
+@unittest.skipIf(ClienteHTTP is None, "requests no está instalado")
+class TestClienteHTTP(unittest.TestCase):
+    """
+    Tests de caché, revalidación, reintentos y timeouts contra un servidor local
+    """
+
+    def setUp(self):
+        """Servidor local con guion y carpeta de caché temporal"""
+        self.carpeta = tempfile.TemporaryDirectory()
+        self.servidor = ThreadingHTTPServer(("127.0.0.1", 0), ManejadorGuion)
+        self.servidor.daemon_threads = True
+        self.servidor.cerrojo = threading.Lock()
+        self.servidor.peticiones = []
+        self.servidor.guion = [200]
+        self.servidor.validadores = {"etag": True, "last_modified": True}
+        threading.Thread(target=self.servidor.serve_forever, args=(0.05,), daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.servidor.server_address[1]}/posts"
+
+    def tearDown(self):
+        self.servidor.shutdown()
+        self.servidor.server_close()
+        self.carpeta.cleanup()
+
+    def cliente(self, **opciones):
+        """Cliente sin espera entre reintentos, cerrado al terminar el test."""
+        opciones.setdefault("espera_base", 0)
+        cliente = ClienteHTTP(directorio_cache=self.carpeta.name, **opciones)
+        self.addCleanup(cliente.cerrar)
+        return cliente
+
+    def test_ttl_vigente_no_hace_peticion(self):
+        """Test: Dentro del TTL la respuesta sale de la caché"""
+        cliente = self.cliente(ttl=60)
+
+        primera = cliente.obtener_json(self.url, params={"p": 1})
+        segunda = cliente.obtener_json(self.url, params={"p": 1})
+
+        self.assertEqual(primera.origen, "red")
+        self.assertEqual(segunda, (200, {"ruta": "/posts?p=1"}, "cache"))
+        self.assertEqual(len(self.servidor.peticiones), 1)
+
+    def test_revalidacion_con_304(self):
+        """Test: Vencido el TTL se revalida con ETag o Last-Modified"""
+        for validadores, encabezado in [({"etag": True}, "If-None-Match"),
+                                        ({"last_modified": True}, "If-Modified-Since")]:
+            with self.subTest(encabezado=encabezado):
+                self.servidor.validadores = validadores
+                self.servidor.peticiones.clear()
+                cliente = self.cliente(ttl=0)
+                url = f"{self.url}/{encabezado}"
+
+                primera = cliente.obtener_json(url)
+                segunda = cliente.obtener_json(url)
+
+                self.assertEqual(primera.origen, "red")
+                self.assertEqual(segunda, (200, primera.datos, "revalidada"))
+                self.assertNotIn(encabezado, self.servidor.peticiones[0])
+                self.assertIn(encabezado, self.servidor.peticiones[1])
+
+    def test_reintenta_503_hasta_recuperarse(self):
+        """Test: Los 503 se reintentan y se devuelve la respuesta buena"""
+        self.servidor.guion = [503, 503, 200]
+        respuesta = self.cliente(ttl=None, reintentos=3).obtener_json(self.url)
+
+        self.assertEqual(respuesta, (200, {"ruta": "/posts"}, "red"))
+        self.assertEqual(len(self.servidor.peticiones), 3)
+
+    def test_reintentos_agotados(self):
+        """Test: Agotados los reintentos se devuelve el último estado sin datos"""
+        self.servidor.guion = [503]
+        respuesta = self.cliente(ttl=None, reintentos=2).obtener_json(self.url)
+
+        self.assertEqual(respuesta, (503, None, "red"))
+        self.assertEqual(len(self.servidor.peticiones), 3)
+
+    def test_timeout_de_lectura(self):
+        """Test: Un servidor lento corta la petición por timeout"""
+        self.servidor.guion = ["lento"]
+        cliente = self.cliente(ttl=None, reintentos=0, timeout=(1, 0.1))
+
+        inicio = time.monotonic()
+        with self.assertRaises(requests.exceptions.RequestException):
+            cliente.obtener_json(self.url)
+        self.assertLess(time.monotonic() - inicio, 0.5)
+
+
+@unittest.skipIf(ClienteHTTP is None, "requests no está instalado")
+class TestCacheConcurrente(unittest.TestCase):
+    """
+    Tests para escrituras simultáneas de la misma URL en la caché
+    """
+
+    def setUp(self):
+        """Servidor local y carpeta de caché temporal"""
+        self.carpeta = tempfile.TemporaryDirectory()
+        self.servidor = ThreadingHTTPServer(("127.0.0.1", 0), ManejadorJSON)
+        threading.Thread(target=self.servidor.serve_forever, args=(0.05,), daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.servidor.server_address[1]}/posts"
+
+    def tearDown(self):
+        self.servidor.shutdown()
+        self.servidor.server_close()
+        self.carpeta.cleanup()
+
+    def test_guardar_misma_clave_desde_varios_hilos(self):
+        """Test: Muchos hilos guardando la misma clave no fallan ni dejan temporales"""
+        cache = CacheDisco(self.carpeta.name)
+
+        def guardar(i):
+            for _ in range(20):
+                cache.guardar("clave", {"hilo": i})
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            list(pool.map(guardar, range(16)))
+
+        self.assertIn(cache.leer("clave")["hilo"], range(16))
+        self.assertEqual(len(os.listdir(self.carpeta.name)), 1)
+
+    def test_descargas_simultaneas_de_la_misma_url(self):
+        """Test: obtener_varios con la misma URL repetida no aborta el lote"""
+        cliente = ClienteHTTP(ttl=0, directorio_cache=self.carpeta.name, conexiones=16)
+
+        async def descargar():
+            async with DescargadorAsync(cliente, concurrencia=16) as descargador:
+                return await descargador.obtener_varios([self.url] * 64)
+
+        respuestas = asyncio.run(descargar())
+
+        self.assertEqual({r.estado for r in respuestas}, {200})
+        self.assertTrue(all(r.datos == {"ruta": "/posts"} for r in respuestas))
+        self.assertEqual(len(os.listdir(self.carpeta.name)), 1)
+
+
+if __name__ == "__main__":
+    resultado = unittest.main(exit=False, verbosity=2).result
+    sys.exit(0 if resultado.wasSuccessful() else 1)
@@ -0,0 +1,97 @@
+# Tests unitarios para el índice de consultas sobre logs
+# Clase 01: Consumo de APIs
+
+import json
+import os
+import random
+import sys
+import tempfile
+import unittest
+
+from consultas_logs import IndiceLogs
+
+
+def generar_logs(cantidad, semilla=7):
+    """Logs sintéticos desordenados en el tiempo."""
+    rng = random.Random(semilla)
+    return [{
+        "timestamp": f"2024-01-{rng.randint(1, 28):02d} {rng.randint(0, 23):02d}:00:00",
+        "level": rng.choice(["INFO", "INFO", "WARNING", "ERROR", "DEBUG"]),
+        "message": f"Mensaje {i}",
+        "user_id": rng.choice([None, 1, 2, 3, 4]),
+    } for i in range(cantidad)]
+
+
+class TestIndiceLogs(unittest.TestCase):
+    """
+    Suite de tests que compara las consultas indexadas con filtros directos
+    """
+
+    def test_consultas_igual_que_filtrar(self):
+        """Test: Conteos y filas coinciden con un recorrido completo"""
+        for logs in (generar_logs(2000), sorted(generar_logs(2000), key=lambda log: log["timestamp"])):
+            indice = IndiceLogs(logs)
+            for nivel, desde, hasta, usuario in [("ERROR", None, None, None),
+                                                 (("ERROR", "WARNING"), "2024-01-10", "2024-01-20", None),
+                                                 (None, "2024-01-05 12:00:00", None, 3),
+                                                 ("NO EXISTE", None, None, None)]:
+                niveles = {nivel} if isinstance(nivel, str) else set(nivel or ())
+                esperadas = [i for i, log in enumerate(logs)
+                             if (nivel is None or log["level"] in niveles)
+                             and (desde is None or log["timestamp"] >= desde)
+                             and (hasta is None or log["timestamp"] <= hasta)
+                             and (usuario is None or log["user_id"] == usuario)]
+                mascara = indice.mascara(nivel=nivel, desde=desde, hasta=hasta, usuario=usuario)
+                with self.subTest(nivel=nivel, desde=desde, hasta=hasta, usuario=usuario):
+                    self.assertEqual(list(indice.filas(mascara)), esperadas)
+                    self.assertEqual(indice.contar(nivel=nivel, desde=desde, hasta=hasta, usuario=usuario),
+                                     len(esperadas))
+
+    def test_muchos_usuarios(self):
+        """Test: Filtro por usuario y usuarios_unicos con muchos usuarios distintos"""
+        logs = generar_logs(3000)
+        for i, log in enumerate(logs):
+            log["user_id"] = None if i % 7 == 0 else i % 1000
+        indice = IndiceLogs(logs)
+        errores = indice.mascara(nivel="ERROR")
+
+        self.assertEqual(indice.usuarios_unicos(), {log["user_id"] for log in logs} - {None})
+        self.assertEqual(indice.usuarios_unicos(errores),
+                         {log["user_id"] for log in logs if log["level"] == "ERROR"} - {None})
+        for usuario in (1, 999, 0, 5000):
+            with self.subTest(usuario=usuario):
+                self.assertEqual(list(indice.filas(indice.mascara(usuario=usuario, nivel="ERROR"))),
+                                 [i for i, log in enumerate(logs)
+                                  if log["user_id"] == usuario and log["level"] == "ERROR"])
+
+    def test_exportar_conserva_campos_adicionales(self):
+        """Test: Los logs con campos adicionales se exportan completos"""
+        logs = generar_logs(50)
+        logs[3] = {**logs[3], "level": "ERROR", "ip": "10.0.0.1", "detalle": {"codigo": 500}}
+        indice = IndiceLogs(logs)
+        mascara = indice.mascara(nivel="ERROR")
+
+        with tempfile.TemporaryDirectory() as carpeta:
+            ruta = os.path.join(carpeta, "errores.jsonl")
+            escritos = indice.exportar_jsonl(ruta, mascara)
+            with open(ruta, encoding="utf-8") as archivo:
+                exportados = [json.loads(linea) for linea in archivo]
+
+        self.assertEqual(exportados, [log for log in logs if log["level"] == "ERROR"])
+        self.assertEqual(escritos, len(exportados))
+        self.assertIn(logs[3], exportados)
+
+    def test_mas_de_256_niveles(self):
+        """Test: Los códigos de nivel se agrandan en lugar de desbordar"""
+        logs = [{"timestamp": f"2024-01-01 00:00:{i % 60:02d}", "level": f"N{i}",
+                 "message": "m", "user_id": None} for i in range(300)]
+        indice = IndiceLogs(logs)
+
+        self.assertEqual(indice.contar(nivel="N299"), 1)
+        self.assertEqual(len(indice.conteo_por_nivel()), 300)
+        self.assertEqual(next(indice.registros(indice.mascara(nivel="N280")))["level"], "N280")
+
+
+if __name__ == "__main__":
+    resultado = unittest.main(exit=False, verbosity=2).result
+    sys.exit(0 if resultado.wasSuccessful() else 1)
@@ -0,0 +1,98 @@
+# Tests unitarios para la lectura incremental de JSON
+# Clase 01: Consumo de APIs
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+from lectura_json import iterar_json
+
+
+TAMANOS_BLOQUE = (1, 2, 3, 7, 64, 1 << 16)
+
+REGISTROS = [
+    {"id": 1, "titulo": "Añoranza", "valores": [1.5, -2e10, None, True]},
+    {"id": 22, "titulo": "texto con \"comillas\", comas y ]corchetes[", "anidado": {"a": [{}, []]}},
+    12345678901234567890,
+    "cadena",
+    [],
+]
+
+
+class TestIterarJson(unittest.TestCase):
+    """
+    Suite de tests que compara iterar_json con json.load
+    """
+
+    def setUp(self):
+        """Carpeta temporal para los archivos de prueba"""
+        self.carpeta = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.carpeta.cleanup()
+
+    def escribir(self, contenido):
+        ruta = os.path.join(self.carpeta.name, "datos.json")
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(contenido)
+        return ruta
+
+    def test_arreglos_validos_igual_que_json_load(self):
+        """Test: Arreglos con distintos espacios dan lo mismo que json.load"""
+        contenidos = [
+            json.dumps(REGISTROS),
+            json.dumps(REGISTROS, indent=2, ensure_ascii=False),
+            " \n\t[ " + " ,\r\n ".join(json.dumps(r) for r in REGISTROS) + " ]\n",
+            "[]",
+            " [ \n ] ",
+            "[0]",
+            "[-1.25e-3]",
+        ]
+        for contenido in contenidos:
+            ruta = self.escribir(contenido)
+            with open(ruta, encoding="utf-8") as archivo:
+                esperado = json.load(archivo)
+            for tamano in TAMANOS_BLOQUE:
+                with self.subTest(contenido=contenido[:30], tamano=tamano):
+                    self.assertEqual(list(iterar_json(ruta, tamano)), esperado)
+
+    def test_espacios_iniciales_mas_largos_que_un_bloque(self):
+        """Test: Espacios iniciales que ocupan varios bloques no vacían el resultado"""
+        ruta = self.escribir(" " * 100 + "\n" * 50 + json.dumps(REGISTROS))
+        for tamano in (1, 16, 64):
+            with self.subTest(tamano=tamano):
+                self.assertEqual(list(iterar_json(ruta, tamano)), REGISTROS)
+
+        ruta = self.escribir("\n" * 100 + '{"a": 1}\n{"a": 2}\n')
+        self.assertEqual(list(iterar_json(ruta, 8)), [{"a": 1}, {"a": 2}])
+
+        ruta = self.escribir(" " * 100)
+        self.assertEqual(list(iterar_json(ruta, 8)), [])
+
+    def test_json_lines_y_valor_unico(self):
+        """Test: JSON lines y un objeto con formato en varias líneas"""
+        ruta = self.escribir("".join(json.dumps(r) + "\n" for r in REGISTROS[:2]))
+        self.assertEqual(list(iterar_json(ruta, 4)), REGISTROS[:2])
+
+        ruta = self.escribir(json.dumps(REGISTROS[1], indent=2))
+        self.assertEqual(list(iterar_json(ruta, 4)), [REGISTROS[1]])
+
+    def test_arreglos_mal_formados(self):
+        """Test: Lo que json.load rechaza también lo rechaza iterar_json"""
+        contenidos = ["[1 2,3]", "[1,,2]", "[,1]", "[1,]", "[1,2", "[1] x", "[1}", "[1, 2]]"]
+        for contenido in contenidos:
+            ruta = self.escribir(contenido)
+            with open(ruta, encoding="utf-8") as archivo:
+                with self.assertRaises(json.JSONDecodeError):
+                    json.load(archivo)
+            for tamano in TAMANOS_BLOQUE:
+                with self.subTest(contenido=contenido, tamano=tamano):
+                    with self.assertRaises(json.JSONDecodeError):
+                        list(iterar_json(ruta, tamano))
+
+
+if __name__ == "__main__":
+    resultado = unittest.main(exit=False, verbosity=2).result
+    sys.exit(0 if resultado.wasSuccessful() else 1)
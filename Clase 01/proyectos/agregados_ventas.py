@@ -0,0 +1,144 @@
+from array import array
+from collections import defaultdict
+from operator import itemgetter
+
+
+class Resumen:
+    """Acumulado de un grupo de ventas."""
+
+    __slots__ = ("total", "cantidad", "transacciones")
+
+    def __init__(self, total=0.0, cantidad=0, transacciones=0):
+        self.total = total
+        self.cantidad = cantidad
+        self.transacciones = transacciones
+
+    @property
+    def promedio(self):
+        """Ticket promedio del grupo."""
+        return self.total / self.transacciones if self.transacciones else 0.0
+
+    def __repr__(self):
+        return (f"Resumen(total={self.total:.2f}, cantidad={self.cantidad}, "
+                f"transacciones={self.transacciones})")
+
+
+class AgregadosVentas:
+    """
+    Agregados de ventas calculados en una sola pasada.
+
+    Cada venta se acumula en el grupo de su combinación de dimensiones
+    (fecha, categoría, producto, vendedor, región, tipo de cliente). Esas
+    combinaciones son pocas comparadas con las ventas, así que los agregados
+    por cualquier dimensión (o par de dimensiones, o el mes derivado de la
+    fecha) se obtienen sumando los grupos, sin volver a recorrer las ventas.
+    Los totales de cada venta se guardan en un arreglo compacto para las
+    estadísticas de dispersión.
+    """
+
+    DIMENSIONES = ("fecha", "categoria", "producto", "vendedor", "region", "cliente_tipo")
+    DERIVADAS = {"mes": lambda clave: clave[0][:7]}  # YYYY-MM
+
+    # Campos leídos de cada venta: las dimensiones, la cantidad y el total
+    _CAMPOS = itemgetter("fecha", "categoria", "producto", "vendedor_id", "region",
+                         "cliente_tipo", "cantidad", "total")
+
+    def __init__(self, ventas=()):
+        self.grupos = {}              # combinación de dimensiones -> [total, cantidad, transacciones]
+        self.totales = array("d")     # total de cada venta, en orden
+        self._cache = {}
+        self.agregar(ventas)
+
+    def agregar(self, ventas):
+        """
+        Acumula más ventas (un solo recorrido).
+
+        Args:
+            ventas (iterable): Ventas con fecha, categoria, producto,
+                               vendedor_id, region, cliente_tipo, cantidad y total
+        """
+        grupos = self.grupos
+        totales = self.totales.append
+        # itemgetter lee los ocho campos en una sola llamada
+        for campos in map(self._CAMPOS, ventas):
+            total = campos[7]
+            totales(total)
+            clave = campos[:6]
+            grupo = grupos.get(clave)
+            if grupo is None:
+                grupos[clave] = [total, campos[6], 1]
+            else:
+                grupo[0] += total
+                grupo[1] += campos[6]
+                grupo[2] += 1
+        self._cache.clear()
+
+    def por(self, *dimensiones):
+        """
+        Agregados por una o más dimensiones.
+
+        Args:
+            *dimensiones (str): Nombres de DIMENSIONES o DERIVADAS
+
+        Returns:
+            dict: Valor (o tupla de valores) -> Resumen, en orden de aparición
+        """
+        if dimensiones not in self._cache:
+            extractores = [self.DERIVADAS.get(d) or itemgetter(self.DIMENSIONES.index(d))
+                           for d in dimensiones]
+            resultado = defaultdict(Resumen)
+            for clave, (total, cantidad, transacciones) in self.grupos.items():
+                if len(extractores) == 1:
+                    valor = extractores[0](clave)
+                else:
+                    valor = tuple(extraer(clave) for extraer in extractores)
+                resumen = resultado[valor]
+                resumen.total += total
+                resumen.cantidad += cantidad
+                resumen.transacciones += transacciones
+            self._cache[dimensiones] = dict(resultado)
+        return self._cache[dimensiones]
+
+    def desglose(self, dimension, detalle):
+        """
+        Transacciones de cada valor de `dimension` repartidas por `detalle`.
+
+        Returns:
+            dict: Valor -> {valor de detalle: transacciones}
+        """
+        resultado = defaultdict(dict)
+        for (valor, sub), resumen in self.por(dimension, detalle).items():
+            resultado[valor][sub] = resumen.transacciones
+        return dict(resultado)
+
+    @property
+    def transacciones(self):
+        return len(self.totales)
+
+    @property
+    def total(self):
+        return sum(self.totales)
+
+    def media_y_desviacion(self):
+        """
+        Promedio y desviación estándar poblacional de los totales.
+
+        Returns:
+            tuple: (promedio, desviación)
+        """
+        n = len(self.totales)
+        promedio = sum(self.totales) / n
+        varianza = sum((x - promedio) ** 2 for x in self.totales) / n
+        return promedio, varianza ** 0.5
+
+    def indices_fuera_de(self, umbral_bajo, umbral_alto):
+        """
+        Posiciones de las ventas con total fuera del rango.
+
+        Returns:
+            tuple: (índices sobre umbral_alto, índices bajo umbral_bajo con total > 0)
+        """
+        fuera = [i for i, x in enumerate(self.totales) if not umbral_bajo <= x <= umbral_alto]
+        altos = [i for i in fuera if self.totales[i] > umbral_alto]
+        bajos = [i for i in fuera if 0 < self.totales[i] < umbral_bajo]
+        return altos, bajos
@@ -0,0 +1,169 @@
+import csv
+import math
+import random
+from datetime import datetime, timedelta
+from itertools import repeat
+from operator import mul, truediv
+
+
+PRODUCTOS = [
+    {"nombre": "Laptop Pro", "categoria": "Electrónicos", "precio_base": 1200},
+    {"nombre": "Mouse Inalámbrico", "categoria": "Accesorios", "precio_base": 45},
+    {"nombre": "Teclado Mecánico", "categoria": "Accesorios", "precio_base": 120},
+    {"nombre": "Monitor 4K", "categoria": "Electrónicos", "precio_base": 400},
+    {"nombre": "Webcam HD", "categoria": "Accesorios", "precio_base": 80},
+    {"nombre": "Tablet Pro", "categoria": "Electrónicos", "precio_base": 600},
+    {"nombre": "Auriculares", "categoria": "Audio", "precio_base": 150},
+    {"nombre": "Smartphone", "categoria": "Móviles", "precio_base": 800}
+]
+REGIONES = ["Norte", "Sur", "Este", "Oeste", "Centro"]
+CANALES = ["Online", "Tienda Física", "Teléfono", "App Móvil"]
+TIPOS_CLIENTE = ["Nuevo", "Recurrente", "VIP"]
+VENDEDORES = [f"VEND-{i:02d}" for i in range(1, 16)]
+
+FECHA_INICIO = datetime(2024, 1, 1)
+DIAS = 166  # Hasta junio
+
+COLUMNAS = ["id", "fecha", "producto", "categoria", "cantidad", "precio_unitario",
+            "region", "canal", "vendedor_id", "cliente_tipo", "total"]
+
+
+def factor_estacional(mes):
+    """Variación estacional del precio según el mes."""
+    if mes in [11, 12]:  # Black Friday, Navidad
+        return 1.3
+    if mes in [1, 2]:  # Post-navidad
+        return 0.8
+    return 1.0
+
+
+def _rango_centavos(precio):
+    """Precio mínimo y cantidad de precios posibles, en centavos, con ±10% de variación."""
+    minimo = math.ceil(round(precio * 90, 6))
+    return minimo, math.floor(round(precio * 110, 6)) - minimo + 1
+
+
+# Fecha y rango de precios de cada producto en cada día: se calculan una vez
+# y cada venta solo busca por índice
+_FECHAS = [(FECHA_INICIO + timedelta(days=d)).isoformat()[:10] for d in range(DIAS)]
+_RANGOS = [[_rango_centavos(p["precio_base"] * factor_estacional((FECHA_INICIO + timedelta(days=d)).month))
+            for d in range(DIAS)] for p in PRODUCTOS]
+_NOMBRES = [p["nombre"] for p in PRODUCTOS]
+_CATEGORIAS = [p["categoria"] for p in PRODUCTOS]
+
+
+def _indices(rng, opciones, cantidad):
+    """
+    Sortea `cantidad` índices uniformes en range(opciones) (opciones <= 256).
+
+    Se piden bytes aleatorios en bloque y bytes.translate los reduce módulo
+    `opciones` y descarta los que sesgarían la distribución (rechazo), todo
+    sin un bucle de Python por valor.
+
+    Returns:
+        bytes: Un índice por byte
+    """
+    limite = 256 - 256 % opciones
+    tabla = bytes(b % opciones for b in range(256))
+    descartar = bytes(range(limite, 256))
+    indices = b""
+    while len(indices) < cantidad:
+        faltan = cantidad - len(indices)
+        indices += rng.randbytes(faltan + faltan * (256 - limite) // limite + 16).translate(tabla, descartar)
+    return indices[:cantidad]
+
+
+def generar_columnas(cantidad, rng, primer_id=1):
+    """
+    Genera `cantidad` ventas como columnas (una lista por campo).
+
+    Cada columna se sortea completa de una vez, en lugar de varias llamadas
+    a random por fila. Los precios se sortean en centavos enteros, así el
+    precio y el total ya quedan redondeados a dos decimales.
+
+    Args:
+        cantidad (int): Ventas a generar
+        rng (random.Random): Generador (define la reproducibilidad)
+        primer_id (int): Número de la primera venta
+
+    Returns:
+        dict: Nombre de columna (COLUMNAS) -> lista de valores
+    """
+    productos = _indices(rng, len(PRODUCTOS), cantidad)
+    dias = _indices(rng, DIAS, cantidad)
+    cantidades = [c + 1 for c in _indices(rng, 5, cantidad)]
+
+    aleatorio = rng.random
+    centavos = []
+    for p, d in zip(productos, dias):
+        minimo, opciones = _RANGOS[p][d]
+        centavos.append(minimo + int(aleatorio() * opciones))  # Variación aleatoria
+    return {
+        "id": list(map("VT-%04d".__mod__, range(primer_id, primer_id + cantidad))),
+        "fecha": list(map(_FECHAS.__getitem__, dias)),
+        "producto": list(map(_NOMBRES.__getitem__, productos)),
+        "categoria": list(map(_CATEGORIAS.__getitem__, productos)),
+        "cantidad": cantidades,
+        "precio_unitario": list(map(truediv, centavos, repeat(100))),
+        "region": list(map(REGIONES.__getitem__, _indices(rng, len(REGIONES), cantidad))),
+        "canal": list(map(CANALES.__getitem__, _indices(rng, len(CANALES), cantidad))),
+        "vendedor_id": list(map(VENDEDORES.__getitem__, _indices(rng, len(VENDEDORES), cantidad))),
+        "cliente_tipo": list(map(TIPOS_CLIENTE.__getitem__, _indices(rng, len(TIPOS_CLIENTE), cantidad))),
+        "total": list(map(truediv, map(mul, centavos, cantidades), repeat(100))),
+    }
+
+
+def generar_ventas(cantidad, semilla=42, tamano_bloque=100_000):
+    """
+    Genera ventas simuladas como lista de diccionarios.
+
+    La misma semilla (y el mismo tamaño de bloque) produce siempre las
+    mismas ventas.
+
+    Args:
+        cantidad (int): Ventas a generar
+        semilla (int): Semilla del generador
+        tamano_bloque (int): Ventas sorteadas por bloque
+
+    Returns:
+        list: Ventas con las claves de COLUMNAS
+    """
+    ventas = []
+    for columnas in _bloques(cantidad, semilla, tamano_bloque):
+        ventas.extend([
+            {"id": i, "fecha": f, "producto": p, "categoria": c, "cantidad": n,
+             "precio_unitario": u, "region": r, "canal": k, "vendedor_id": v,
+             "cliente_tipo": t, "total": total}
+            for i, f, p, c, n, u, r, k, v, t, total in zip(*columnas.values())
+        ])
+    return ventas
+
+
+def escribir_csv(ruta, cantidad, semilla=42, tamano_bloque=100_000):
+    """
+    Escribe ventas simuladas a un CSV por bloques, sin tenerlas todas en memoria.
+
+    Args:
+        ruta (str): Archivo de salida
+        cantidad (int): Ventas a generar
+        semilla (int): Semilla del generador
+        tamano_bloque (int): Ventas generadas y escritas por bloque
+
+    Returns:
+        int: Ventas escritas
+    """
+    escritas = 0
+    with open(ruta, "w", newline="", encoding="utf-8") as f:
+        escritor = csv.writer(f)
+        escritor.writerow(COLUMNAS)
+        for columnas in _bloques(cantidad, semilla, tamano_bloque):
+            escritor.writerows(zip(*columnas.values()))
+            escritas += len(columnas["id"])
+    return escritas
+
+
+def _bloques(cantidad, semilla, tamano_bloque):
+    """Genera las columnas de bloques sucesivos con un único generador."""
+    rng = random.Random(semilla)
+    for inicio in range(0, cantidad, tamano_bloque):
+        yield generar_columnas(min(tamano_bloque, cantidad - inicio), rng, primer_id=inicio + 1)
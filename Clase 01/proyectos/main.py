@@ -1,8 +1,17 @@
 import json
 import requests
-from datetime import datetime, timedelta
-from collections import defaultdict, Counter
+from datetime import datetime
+from collections import Counter
 import os
+import sys
+
+# El cliente HTTP (timeouts, reintentos y caché) vive en el ejercicio de APIs
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ejercicio-03-apis"))
+from cliente_http import ClienteHTTP
+
+from agregados_ventas import AgregadosVentas
+from generador_ventas import generar_ventas
+from registro_proceso import RegistroProceso
 
 class AnalizadorDatos:
     """Clase principal para análisis de datos del bootcamp."""
@@ -11,6 +20,29 @@ class AnalizadorDatos:
         self.datos_ventas = []
         self.datos_usuarios = []
         self.configuracion = self.cargar_configuracion()
+        self.registro = RegistroProceso(self.configuracion["archivos_salida"]["log_proceso"],
+                                        **self.configuracion.get("registro", {}))
+        self.cliente_http = ClienteHTTP(**self.configuracion.get("http", {}))
+        self._agregados = None
+        self._agregados_de = (None, 0)  # (lista agregada, ventas incluidas)
+    
+    @property
+    def agregados(self):
+        """
+        Agregados de self.datos_ventas, compartidos por todos los análisis.
+        
+        Se calculan en una sola pasada; si solo se agregaron ventas al final
+        de la lista, se acumulan únicamente las nuevas.
+        """
+        lista, incluidas = self._agregados_de
+        if self._agregados is None or lista is not self.datos_ventas or len(self.datos_ventas) < incluidas:
+            with self.medir("agregar_ventas", ventas=len(self.datos_ventas)):
+                self._agregados = AgregadosVentas(self.datos_ventas)
+        elif len(self.datos_ventas) > incluidas:
+            with self.medir("agregar_ventas", ventas=len(self.datos_ventas) - incluidas):
+                self._agregados.agregar(self.datos_ventas[incluidas:])
+        self._agregados_de = (self.datos_ventas, len(self.datos_ventas))
+        return self._agregados
     
     def cargar_configuracion(self):
         """Carga configuración del proyecto."""
@@ -36,68 +68,31 @@ class AnalizadorDatos:
                 json.dump(config_default, f, indent=2)
             return config_default
     
-    def log_proceso(self, mensaje):
-        """Registra eventos del proceso."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] {mensaje}"
-        print(log_entry)
-        
-        with open(self.configuracion["archivos_salida"]["log_proceso"], 'a') as f:
-            f.write(log_entry + "\n")
+    def log_proceso(self, mensaje, nivel="INFO", **campos):
+        """Registra eventos del proceso (JSON lines, escritos por lotes)."""
+        self.registro.registrar(mensaje, nivel, **campos)
     
-    def generar_datos_ventas(self, num_registros=500):
-        """Genera datos de ventas simulados."""
-        self.log_proceso(f"Generando {num_registros} registros de ventas")
-        
-        import random
-        random.seed(42)
-        
-        productos = [
-            {"nombre": "Laptop Pro", "categoria": "Electrónicos", "precio_base": 1200},
-            {"nombre": "Mouse Inalámbrico", "categoria": "Accesorios", "precio_base": 45},
-            {"nombre": "Teclado Mecánico", "categoria": "Accesorios", "precio_base": 120},
-            {"nombre": "Monitor 4K", "categoria": "Electrónicos", "precio_base": 400},
-            {"nombre": "Webcam HD", "categoria": "Accesorios", "precio_base": 80},
-            {"nombre": "Tablet Pro", "categoria": "Electrónicos", "precio_base": 600},
-            {"nombre": "Auriculares", "categoria": "Audio", "precio_base": 150},
-            {"nombre": "Smartphone", "categoria": "Móviles", "precio_base": 800}
-        ]
-        
-        regiones = ["Norte", "Sur", "Este", "Oeste", "Centro"]
-        canales = ["Online", "Tienda Física", "Teléfono", "App Móvil"]
+    def medir(self, fase, **campos):
+        """
+        Mide la duración de una fase del proceso.
+        
+        Example:
+            >>> with analizador.medir("analizar_ventas"):
+            ...     analizador.analizar_ventas_por_periodo()
+        """
+        return self.registro.medir(fase, **campos)
+    
+    def generar_datos_ventas(self, num_registros=500, semilla=42):
+        """
+        Genera datos de ventas simulados.
         
-        fecha_inicio = datetime(2024, 1, 1)
+        Las columnas se sortean por bloques (ver generador_ventas); con la
+        misma semilla se obtienen siempre las mismas ventas.
+        """
+        self.log_proceso(f"Generando {num_registros} registros de ventas")
         
-        for i in range(num_registros):
-            producto = random.choice(productos)
-            dias_transcurridos = random.randint(0, 165)  # Hasta junio
-            fecha_venta = fecha_inicio + timedelta(days=dias_transcurridos)
-            
-            # Simular variaciones estacionales
-            factor_estacional = 1.0
-            if fecha_venta.month in [11, 12]:  # Black Friday, Navidad
-                factor_estacional = 1.3
-            elif fecha_venta.month in [1, 2]:  # Post-navidad
-                factor_estacional = 0.8
-            
-            precio_final = producto["precio_base"] * factor_estacional
-            precio_final *= random.uniform(0.9, 1.1)  # Variación aleatoria
-            
-            venta = {
-                "id": f"VT-{i+1:04d}",
-                "fecha": fecha_venta.isoformat()[:10],
-                "producto": producto["nombre"],
-                "categoria": producto["categoria"],
-                "cantidad": random.randint(1, 5),
-                "precio_unitario": round(precio_final, 2),
-                "region": random.choice(regiones),
-                "canal": random.choice(canales),
-                "vendedor_id": f"VEND-{random.randint(1, 15):02d}",
-                "cliente_tipo": random.choice(["Nuevo", "Recurrente", "VIP"])
-            }
-            
-            venta["total"] = round(venta["cantidad"] * venta["precio_unitario"], 2)
-            self.datos_ventas.append(venta)
+        with self.medir("generar_datos_ventas", registros=num_registros):
+            self.datos_ventas.extend(generar_ventas(num_registros, semilla))
         
         self.log_proceso(f"Datos de ventas generados exitosamente")
     
@@ -107,9 +102,9 @@ class AnalizadorDatos:
         
         try:
             # API de usuarios de prueba
-            response = requests.get("https://jsonplaceholder.typicode.com/users")
-            if response.status_code == 200:
-                usuarios_api = response.json()
+            respuesta = self.cliente_http.obtener_json("https://jsonplaceholder.typicode.com/users")
+            if respuesta.estado == 200:
+                usuarios_api = respuesta.datos
                 
                 # Transformar datos para nuestro análisis
                 for usuario in usuarios_api:
@@ -126,27 +121,21 @@ class AnalizadorDatos:
                 self.log_proceso(f"Obtenidos {len(usuarios_api)} usuarios de API externa")
             
         except requests.exceptions.RequestException as e:
-            self.log_proceso(f"Error al obtener datos externos: {e}")
+            self.log_proceso(f"Error al obtener datos externos: {e}", nivel="ERROR")
     
     def analizar_ventas_por_periodo(self):
         """Análisis temporal de ventas."""
         self.log_proceso("Iniciando análisis temporal de ventas")
         
-        ventas_por_mes = defaultdict(lambda: {"total": 0, "cantidad": 0, "transacciones": 0})
-        ventas_por_categoria = defaultdict(lambda: {"total": 0, "cantidad": 0})
-        
-        for venta in self.datos_ventas:
-            mes = venta["fecha"][:7]  # YYYY-MM
-            categoria = venta["categoria"]
-            
-            # Por mes
-            ventas_por_mes[mes]["total"] += venta["total"]
-            ventas_por_mes[mes]["cantidad"] += venta["cantidad"]
-            ventas_por_mes[mes]["transacciones"] += 1
-            
-            # Por categoría
-            ventas_por_categoria[categoria]["total"] += venta["total"]
-            ventas_por_categoria[categoria]["cantidad"] += venta["cantidad"]
+        agregados = self.agregados
+        ventas_por_mes = {
+            mes: {"total": r.total, "cantidad": r.cantidad, "transacciones": r.transacciones}
+            for mes, r in agregados.por("mes").items()
+        }
+        ventas_por_categoria = {
+            categoria: {"total": r.total, "cantidad": r.cantidad}
+            for categoria, r in agregados.por("categoria").items()
+        }
         
         # Resultados mensuales
         print(f"\n📅 ANÁLISIS TEMPORAL")
@@ -171,19 +160,17 @@ class AnalizadorDatos:
         """Análisis de rendimiento de vendedores."""
         self.log_proceso("Analizando rendimiento de vendedores")
         
-        vendedores = defaultdict(lambda: {
-            "ventas_total": 0,
-            "transacciones": 0,
-            "productos_vendidos": 0,
-            "clientes_tipos": Counter()
-        })
-        
-        for venta in self.datos_ventas:
-            vendedor = venta["vendedor_id"]
-            vendedores[vendedor]["ventas_total"] += venta["total"]
-            vendedores[vendedor]["transacciones"] += 1
-            vendedores[vendedor]["productos_vendidos"] += venta["cantidad"]
-            vendedores[vendedor]["clientes_tipos"][venta["cliente_tipo"]] += 1
+        agregados = self.agregados
+        clientes_por_vendedor = agregados.desglose("vendedor", "cliente_tipo")
+        vendedores = {
+            vendedor: {
+                "ventas_total": r.total,
+                "transacciones": r.transacciones,
+                "productos_vendidos": r.cantidad,
+                "clientes_tipos": Counter(clientes_por_vendedor[vendedor])
+            }
+            for vendedor, r in agregados.por("vendedor").items()
+        }
         
         print(f"\n👥 TOP 5 VENDEDORES")
         print("=" * 25)
@@ -206,20 +193,17 @@ class AnalizadorDatos:
         """Detecta patrones anómalos en las ventas."""
         self.log_proceso("Detectando patrones anómalos")
         
-        # Calcular estadísticas para detectar anomalías
-        totales_venta = [venta["total"] for venta in self.datos_ventas]
-        promedio_global = sum(totales_venta) / len(totales_venta)
-        
-        # Desviación estándar simple
-        varianza = sum((x - promedio_global) ** 2 for x in totales_venta) / len(totales_venta)
-        desviacion = varianza ** 0.5
+        # Estadísticas sobre el arreglo de totales de los agregados
+        agregados = self.agregados
+        promedio_global, desviacion = agregados.media_y_desviacion()
         
         # Umbral para anomalías (3 desviaciones estándar)
         umbral_alto = promedio_global + (3 * desviacion)
         umbral_bajo = promedio_global - (3 * desviacion)
         
-        anomalias_altas = [v for v in self.datos_ventas if v["total"] > umbral_alto]
-        anomalias_bajas = [v for v in self.datos_ventas if v["total"] < umbral_bajo and v["total"] > 0]
+        indices_altos, indices_bajos = agregados.indices_fuera_de(umbral_bajo, umbral_alto)
+        anomalias_altas = [self.datos_ventas[i] for i in indices_altos]
+        anomalias_bajas = [self.datos_ventas[i] for i in indices_bajos]
         
         print(f"\n⚠️ DETECCIÓN DE ANOMALÍAS")
         print("=" * 30)
@@ -239,25 +223,26 @@ class AnalizadorDatos:
         """Genera reporte ejecutivo completo."""
         self.log_proceso("Generando reporte ejecutivo")
         
-        # Métricas clave
-        total_ventas = sum(v["total"] for v in self.datos_ventas)
-        total_transacciones = len(self.datos_ventas)
+        # Métricas clave (de los agregados: sin volver a recorrer las ventas)
+        agregados = self.agregados
+        por_producto = agregados.por("producto")
+        por_region = agregados.por("region")
+        
+        total_ventas = agregados.total
+        total_transacciones = agregados.transacciones
         ticket_promedio = total_ventas / total_transacciones
         
-        productos_unicos = len(set(v["producto"] for v in self.datos_ventas))
-        regiones_activas = len(set(v["region"] for v in self.datos_ventas))
-        vendedores_activos = len(set(v["vendedor_id"] for v in self.datos_ventas))
+        productos_unicos = len(por_producto)
+        regiones_activas = len(por_region)
+        vendedores_activos = len(agregados.por("vendedor"))
         
         # Producto más vendido
-        productos_counter = Counter(v["producto"] for v in self.datos_ventas)
-        producto_top = productos_counter.most_common(1)[0]
+        producto, resumen = max(por_producto.items(), key=lambda x: x[1].transacciones)
+        producto_top = (producto, resumen.transacciones)
         
         # Región con más ventas
-        ventas_por_region = defaultdict(float)
-        for venta in self.datos_ventas:
-            ventas_por_region[venta["region"]] += venta["total"]
-        
-        region_top = max(ventas_por_region.items(), key=lambda x: x[1])
+        region, resumen = max(por_region.items(), key=lambda x: x[1].total)
+        region_top = (region, resumen.total)
         
         reporte = {
             "fecha_generacion": datetime.now().isoformat(),
@@ -0,0 +1,162 @@
+import atexit
+import json
+import os
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+
+
+class RegistroProceso:
+    """
+    Registro de eventos en formato JSON lines con escritura por lotes.
+
+    El archivo se abre una sola vez y los registros se acumulan en memoria;
+    se escriben juntos cuando el lote se llena, cuando pasa el intervalo
+    máximo desde la última escritura o cuando llega un error. Al superar el
+    tamaño máximo el archivo se rota (proceso.log -> proceso.log.1 -> ...).
+    """
+
+    def __init__(self, archivo, tamano_lote=100, intervalo=2.0,
+                 max_bytes=5 * 1024 * 1024, respaldos=3, consola=True):
+        """
+        Args:
+            archivo (str): Ruta del archivo de log
+            tamano_lote (int): Registros acumulados antes de escribir
+            intervalo (float): Segundos máximos entre escrituras
+            max_bytes (int): Tamaño a partir del cual se rota (0 = sin rotación)
+            respaldos (int): Archivos rotados que se conservan
+            consola (bool): Si también se muestra cada evento en consola
+        """
+        self.archivo = archivo
+        self.tamano_lote = tamano_lote
+        self.intervalo = intervalo
+        self.max_bytes = max_bytes
+        self.respaldos = respaldos
+        self.consola = consola
+
+        self.duraciones = defaultdict(list)   # fase -> duraciones en segundos
+        self._pendientes = []
+        self._ultima_escritura = time.monotonic()
+        self._archivo = None
+        self._tamano = 0
+        self._cierre_programado = False
+        self._programar_cierre()
+
+    def _programar_cierre(self):
+        """Registra cerrar() en atexit (cerrar() lo quita para no retener la instancia)."""
+        if not self._cierre_programado:
+            atexit.register(self.cerrar)
+            self._cierre_programado = True
+
+    def _abrir(self):
+        self._archivo = open(self.archivo, 'a', encoding='utf-8')
+        self._tamano = self._archivo.tell()
+
+    def registrar(self, mensaje, nivel="INFO", **campos):
+        """
+        Agrega un evento al lote.
+
+        Args:
+            mensaje (str): Descripción del evento
+            nivel (str): INFO, WARNING, ERROR...
+            **campos: Datos adicionales que se guardan en el registro
+        """
+        ahora = datetime.now()
+        if self.consola:
+            print(f"[{ahora:%Y-%m-%d %H:%M:%S}] {mensaje}")
+
+        registro = {"fecha": ahora.isoformat(timespec="milliseconds"), "nivel": nivel, "mensaje": mensaje}
+        registro.update(campos)
+        self._pendientes.append(json.dumps(registro, ensure_ascii=False, default=str) + "\n")
+        self._programar_cierre()
+
+        if (len(self._pendientes) >= self.tamano_lote or nivel == "ERROR"
+                or time.monotonic() - self._ultima_escritura >= self.intervalo):
+            self.vaciar()
+
+    def vaciar(self):
+        """Escribe los registros pendientes."""
+        self._ultima_escritura = time.monotonic()
+        if not self._pendientes:
+            return
+        if self._archivo is None:
+            self._abrir()
+        bloque = "".join(self._pendientes)
+        self._pendientes.clear()
+        tamano = len(bloque.encode("utf-8"))
+        if self.max_bytes and self._tamano and self._tamano + tamano > self.max_bytes:
+            self._rotar()
+        self._archivo.write(bloque)
+        self._archivo.flush()
+        self._tamano += tamano
+
+    def _rotar(self):
+        """Renombra el archivo actual a .1 (desplazando los anteriores) y abre uno nuevo."""
+        self._archivo.close()
+        if self.respaldos > 0:
+            for i in range(self.respaldos - 1, 0, -1):
+                origen = f"{self.archivo}.{i}"
+                if os.path.exists(origen):
+                    os.replace(origen, f"{self.archivo}.{i + 1}")
+            os.replace(self.archivo, f"{self.archivo}.1")
+        else:
+            os.remove(self.archivo)
+        self._abrir()
+
+    @contextmanager
+    def medir(self, fase, **campos):
+        """
+        Mide la duración de un bloque y la registra.
+
+        Example:
+            >>> with registro.medir("analizar_ventas"):
+            ...     analizador.analizar_ventas_por_periodo()
+        """
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            duracion = time.perf_counter() - inicio
+            self.duraciones[fase].append(duracion)
+            self._pendientes.append(json.dumps(
+                {"fecha": datetime.now().isoformat(timespec="milliseconds"), "nivel": "INFO",
+                 "mensaje": f"Fase {fase} completada en {duracion:.3f} s",
+                 "fase": fase, "duracion_s": round(duracion, 6), **campos},
+                ensure_ascii=False, default=str) + "\n")
+            self._programar_cierre()
+            if len(self._pendientes) >= self.tamano_lote:
+                self.vaciar()
+
+    def resumen_fases(self):
+        """
+        Tiempos acumulados por fase.
+
+        Returns:
+            dict: fase -> {'veces', 'total_s', 'promedio_s', 'maximo_s'}
+        """
+        return {
+            fase: {
+                "veces": len(tiempos),
+                "total_s": round(sum(tiempos), 6),
+                "promedio_s": round(sum(tiempos) / len(tiempos), 6),
+                "maximo_s": round(max(tiempos), 6),
+            }
+            for fase, tiempos in self.duraciones.items()
+        }
+
+    def cerrar(self):
+        """Escribe lo pendiente, cierra el archivo y se quita de atexit."""
+        self.vaciar()
+        if self._archivo is not None:
+            self._archivo.close()
+            self._archivo = None
+        if self._cierre_programado:
+            atexit.unregister(self.cerrar)
+            self._cierre_programado = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
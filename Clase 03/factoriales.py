@@ -0,0 +1,188 @@
+"""
+Módulo de factoriales.
+
+- Los factoriales chicos salen de una tabla precalculada.
+- Los grandes reutilizan el factorial memorizado más cercano por debajo:
+  n! = k! * (k+1)···n, con el producto del tramo calculado por división
+  binaria (binary splitting) para multiplicar números de tamaño parecido.
+- Sin un punto de control útil se usa math.factorial, que en CPython ya
+  aplica división binaria sobre la parte impar del factorial.
+- log_factorial y magnitud_factorial usan lgamma cuando solo interesa el
+  orden de magnitud.
+"""
+
+import math
+from bisect import bisect_right, insort
+from collections import OrderedDict
+
+
+LIMITE_TABLA = 170                 # 170! es el último que cabe en un float
+UMBRAL_MEMO = 1000                 # por debajo, calcular es más barato que memorizar
+MAXIMO_MEMO = 32                   # puntos de control guardados (los menos usados se descartan)
+TRAMO_DIRECTO = 32                 # tramos más cortos se multiplican en un bucle
+
+_TABLA = [1]
+for _i in range(1, LIMITE_TABLA + 1):
+    _TABLA.append(_TABLA[-1] * _i)
+del _i
+
+_memo = OrderedDict()              # n -> n!, en orden de uso
+_claves = []                       # claves de _memo ordenadas, para bisect
+
+
+def producto_rango(inicio, fin):
+    """
+    Multiplica los enteros de `inicio` a `fin` (inclusive) por división binaria.
+
+    Partir el rango a la mitad hace que cada multiplicación sea entre
+    números de tamaño parecido, donde Karatsuba rinde mucho más que en
+    el producto acumulado uno a uno.
+
+    Args:
+        inicio (int): Primer factor
+        fin (int): Último factor
+
+    Returns:
+        int: Producto (1 si el rango está vacío)
+
+    Example:
+        >>> producto_rango(4, 6)
+        120
+    """
+    if fin - inicio < TRAMO_DIRECTO:
+        resultado = 1
+        for i in range(inicio, fin + 1):
+            resultado *= i
+        return resultado
+    medio = (inicio + fin) // 2
+    return producto_rango(inicio, medio) * producto_rango(medio + 1, fin)
+
+
+def _memorizar(numero, valor):
+    """Guarda un punto de control y descarta el menos usado si sobran."""
+    if numero not in _memo:
+        insort(_claves, numero)
+    _memo[numero] = valor
+    _memo.move_to_end(numero)
+    if len(_memo) > MAXIMO_MEMO:
+        descartado, _ = _memo.popitem(last=False)
+        _claves.remove(descartado)
+
+
+def factorial(numero):
+    """
+    Calcula n! reutilizando los puntos de control memorizados.
+
+    Args:
+        numero (int): Entero no negativo
+
+    Returns:
+        int: Factorial del número
+
+    Raises:
+        ValueError: Si el número es negativo
+
+    Example:
+        >>> factorial(20)
+        2432902008176640000
+    """
+    if numero < 0:
+        raise ValueError("El factorial no está definido para números negativos")
+    if numero <= LIMITE_TABLA:
+        return _TABLA[numero]
+
+    posicion = bisect_right(_claves, numero)
+    anterior = _claves[posicion - 1] if posicion else LIMITE_TABLA
+    if anterior == numero:
+        _memo.move_to_end(numero)
+        return _memo[numero]
+
+    if numero - anterior <= numero // 2:
+        base = _memo[anterior] if posicion else _TABLA[LIMITE_TABLA]
+        resultado = base * producto_rango(anterior + 1, numero)
+    else:
+        resultado = math.factorial(numero)
+
+    if numero >= UMBRAL_MEMO:
+        _memorizar(numero, resultado)
+    return resultado
+
+
+def factoriales(numeros):
+    """
+    Calcula el factorial de varios números.
+
+    Se calculan de menor a mayor, así cada uno parte del anterior.
+
+    Args:
+        numeros (iterable): Enteros no negativos
+
+    Returns:
+        list: Factoriales en el mismo orden recibido
+
+    Raises:
+        ValueError: Si algún número es negativo
+
+    Example:
+        >>> factoriales([5, 3, 5])
+        [120, 6, 120]
+    """
+    numeros = list(numeros)
+    calculados = {numero: factorial(numero) for numero in sorted(set(numeros))}
+    return [calculados[numero] for numero in numeros]
+
+
+def log_factorial(numero, base=math.e):
+    """
+    Logaritmo de n! sin calcular el factorial (vía lgamma).
+
+    Args:
+        numero (float): Número no negativo
+        base (float): Base del logaritmo (por defecto, natural)
+
+    Returns:
+        float: log(n!) en la base indicada
+
+    Raises:
+        ValueError: Si el número es negativo
+
+    Example:
+        >>> round(log_factorial(10, 10), 6)
+        6.559763
+    """
+    if numero < 0:
+        raise ValueError("El factorial no está definido para números negativos")
+    logaritmo = math.lgamma(numero + 1)
+    return logaritmo if base == math.e else logaritmo / math.log(base)
+
+
+def magnitud_factorial(numero):
+    """
+    Notación científica aproximada de n!: (mantisa, exponente) en base 10.
+
+    Args:
+        numero (int): Entero no negativo
+
+    Returns:
+        tuple: (mantisa en [1, 10), exponente) tal que n! ≈ mantisa × 10^exponente
+
+    Raises:
+        ValueError: Si el número es negativo
+
+    Example:
+        >>> mantisa, exponente = magnitud_factorial(100)
+        >>> round(mantisa, 4), exponente
+        (9.3326, 157)
+    """
+    logaritmo = log_factorial(numero, 10)
+    exponente = math.floor(logaritmo)
+    mantisa = 10 ** (logaritmo - exponente)
+    if mantisa >= 10:  # redondeo en el borde
+        mantisa, exponente = mantisa / 10, exponente + 1
+    return mantisa, exponente
+
+
+def limpiar_memo():
+    """Descarta los puntos de control memorizados."""
+    _memo.clear()
+    _claves.clear()
@@ -0,0 +1,432 @@
+"""
+Módulo de geometría por lotes.
+
+Cada función recibe columnas de valores (listas, tuplas, generadores) o
+escalares, que se repiten para acompañar a las columnas (broadcasting).
+La validación se hace con máscaras sobre la columna completa y los errores
+no interrumpen el lote: cada función devuelve un reporte con
+
+- 'resultados': valor de cada fila (None en las filas con error)
+- 'validos': máscara de filas correctas
+- 'errores': lista de dicts con 'indice', 'tipo' y 'mensaje'
+
+Un resultado que no es un número finito (desbordamiento, o entradas
+infinitas o NaN) también se reporta como error de esa fila, con tipo
+'OverflowError'.
+
+Cada figura se describe una sola vez (conversión, reglas de validación y
+fórmula) y esa descripción la usan tanto los lotes como las funciones
+escalares de utilidades_matematicas, a través de funcion_escalar().
+"""
+
+import math
+from collections import namedtuple
+from itertools import compress
+from operator import itemgetter, mul
+
+
+def _es_escalar(valor):
+    """Los textos y los valores no iterables se tratan como escalares."""
+    return isinstance(valor, (str, bytes)) or not hasattr(valor, '__iter__')
+
+
+def _convertir(columna, conversor, relleno):
+    """
+    Convierte una columna con `conversor`.
+
+    Returns:
+        tuple: (valores, posiciones que no se pudieron convertir); las
+               posiciones fallidas quedan con `relleno`
+    """
+    try:
+        return list(map(conversor, columna)), []
+    except (ValueError, TypeError, OverflowError):
+        pass
+    valores, fallidas = [], []
+    for i, valor in enumerate(columna):
+        try:
+            valores.append(conversor(valor))
+        except (ValueError, TypeError, OverflowError):
+            valores.append(relleno)
+            fallidas.append(i)
+    return valores, fallidas
+
+
+def _preparar(argumentos, conversores, mensaje_tipo):
+    """
+    Convierte y alinea las columnas de entrada.
+
+    Args:
+        argumentos (list): Columnas o escalares
+        conversores (list): Conversor de cada argumento (float o int)
+        mensaje_tipo (str): Mensaje para los valores no numéricos
+
+    Returns:
+        tuple: (columnas, validos, errores)
+
+    Raises:
+        ValueError: Si las columnas tienen distinto largo
+    """
+    columnas = [None if _es_escalar(arg) else arg if isinstance(arg, (list, tuple)) else list(arg)
+                for arg in argumentos]
+    largos = {len(columna) for columna in columnas if columna is not None}
+    if len(largos) > 1:
+        raise ValueError("Todas las columnas deben tener el mismo largo")
+    filas = largos.pop() if largos else 1
+
+    convertidas, fallidas = [], set()
+    for arg, columna, conversor in zip(argumentos, columnas, conversores):
+        if columna is None:
+            # Un escalar se convierte una vez y se repite
+            valores, falla = _convertir([arg], conversor, conversor(0))
+            convertidas.append(valores * filas)
+            if falla:
+                fallidas.update(range(filas))
+        else:
+            valores, falla = _convertir(columna, conversor, conversor(0))
+            convertidas.append(valores)
+            fallidas.update(falla)
+
+    validos = [True] * filas
+    errores = []
+    for i in sorted(fallidas):
+        validos[i] = False
+        errores.append({'indice': i, 'tipo': 'TypeError', 'mensaje': mensaje_tipo})
+    return convertidas, validos, errores
+
+
+Figura = namedtuple('Figura', ['conversores', 'mensaje_tipo', 'validar', 'formula', 'neutros'])
+Figura.__doc__ = """
+Descripción de un cálculo geométrico.
+
+Attributes:
+    conversores (tuple): Conversor de cada parámetro (float o int)
+    mensaje_tipo (str): Mensaje del TypeError para valores no numéricos
+    validar (callable): Recibe los parámetros y devuelve el mensaje del
+                        ValueError o None si son válidos
+    formula (callable): Cálculo sobre los parámetros ya validados
+    neutros (tuple): Valores válidos que ocupan las filas con error
+                     mientras se calcula el lote
+"""
+
+
+def _validar_radio(r):
+    return "El radio no puede ser negativo" if r < 0 else None
+
+
+def _validar_rectangulo(a, h):
+    return "El ancho y alto deben ser positivos" if a < 0 or h < 0 else None
+
+
+def _validar_triangulo(b, h):
+    return "La base y altura deben ser positivos" if b < 0 or h < 0 else None
+
+
+def _validar_poligono(n, s):
+    if n < 3:
+        return "Un polígono debe tener al menos 3 lados"
+    if s < 0:
+        return "La longitud del lado debe ser positiva"
+    return None
+
+
+def _validar_catetos(a, b):
+    return "Los catetos deben ser positivos" if a < 0 or b < 0 else None
+
+
+def _area_circulo(r):
+    return math.pi * r ** 2
+
+
+def _area_triangulo(b, h):
+    return (b * h) / 2
+
+
+def _area_poligono(n, s):
+    return (n * s ** 2) / (4 * math.tan(math.pi / n))
+
+
+def _info_circulo(r):
+    return {'radio': r, 'area': math.pi * r ** 2, 'perimetro': 2 * math.pi * r, 'diametro': 2 * r}
+
+
+CIRCULO = Figura((float,), "El radio debe ser un número", _validar_radio, _area_circulo, (0.0,))
+RECTANGULO = Figura((float, float), "El ancho y alto deben ser números",
+                    _validar_rectangulo, mul, (0.0, 0.0))
+TRIANGULO = Figura((float, float), "La base y altura deben ser números",
+                   _validar_triangulo, _area_triangulo, (0.0, 0.0))
+POLIGONO_REGULAR = Figura((int, float), "Los parámetros deben ser números válidos",
+                          _validar_poligono, _area_poligono, (3, 0.0))
+# hypot evita el overflow y la pérdida de precisión de √(a² + b²)
+HIPOTENUSA = Figura((float, float), "Los catetos deben ser números",
+                    _validar_catetos, math.hypot, (0.0, 0.0))
+INFO_CIRCULO = CIRCULO._replace(formula=_info_circulo)
+
+
+def funcion_escalar(figura):
+    """
+    Crea la función que calcula una figura para un solo juego de valores.
+
+    La función valida con las mismas reglas y aplica la misma fórmula que
+    los lotes, sin el costo de armar un reporte.
+
+    Args:
+        figura (Figura): Descripción del cálculo
+
+    Returns:
+        callable: Función con un parámetro por cada conversor de la figura,
+                  que lanza TypeError o ValueError como las funciones escalares
+    """
+    mensaje_tipo, validar, formula = figura.mensaje_tipo, figura.validar, figura.formula
+
+    if len(figura.conversores) == 1:
+        (convertir,) = figura.conversores
+
+        def calcular(a):
+            try:
+                a = convertir(a)
+            except (ValueError, TypeError, OverflowError):
+                raise TypeError(mensaje_tipo) from None
+            mensaje = validar(a)
+            if mensaje:
+                raise ValueError(mensaje)
+            return formula(a)
+    else:
+        convertir_a, convertir_b = figura.conversores
+
+        def calcular(a, b):
+            try:
+                a, b = convertir_a(a), convertir_b(b)
+            except (ValueError, TypeError, OverflowError):
+                raise TypeError(mensaje_tipo) from None
+            mensaje = validar(a, b)
+            if mensaje:
+                raise ValueError(mensaje)
+            return formula(a, b)
+    return calcular
+
+
+def _validar_lote(figura, columnas):
+    """
+    Convierte y valida las columnas de un lote.
+
+    Las filas con error quedan con los valores neutros de la figura, así la
+    fórmula se puede aplicar a todas las filas sin condiciones.
+
+    Returns:
+        tuple: (columnas, validos, errores)
+    """
+    convertidas, validos, errores = _preparar(columnas, figura.conversores, figura.mensaje_tipo)
+    mensajes = list(map(figura.validar, *convertidas))
+    if any(mensajes):
+        for i in compress(range(len(mensajes)), mensajes):
+            if validos[i]:
+                validos[i] = False
+                errores.append({'indice': i, 'tipo': 'ValueError', 'mensaje': mensajes[i]})
+    if errores:
+        errores.sort(key=itemgetter('indice'))
+        for columna, neutro in zip(convertidas, figura.neutros):
+            for error in errores:
+                columna[error['indice']] = neutro
+    return convertidas, validos, errores
+
+
+MENSAJE_NO_FINITO = "El resultado no es un número finito"
+
+
+def _por_fila(formula, *columnas):
+    """Aplica la fórmula fila por fila; las filas que desbordan quedan en inf."""
+    resultados = []
+    for valores in zip(*columnas):
+        try:
+            resultados.append(formula(*valores))
+        except OverflowError:
+            resultados.append(math.inf)
+    return resultados
+
+
+def _aplicar(formula, *columnas):
+    """Aplica la fórmula a la columna completa; si algo desborda, fila por fila."""
+    try:
+        return list(map(formula, *columnas))
+    except OverflowError:
+        return _por_fila(formula, *columnas)
+
+
+def _marcar_no_finitos(columna, validos, errores):
+    """
+    Reporta como error las filas válidas cuyo resultado no es finito.
+
+    Returns:
+        bool: True si se agregaron errores (hay que reordenarlos)
+    """
+    if all(map(math.isfinite, columna)):
+        return False
+    agregados = False
+    for i, valor in enumerate(columna):
+        if validos[i] and not math.isfinite(valor):
+            validos[i] = False
+            errores.append({'indice': i, 'tipo': 'OverflowError', 'mensaje': MENSAJE_NO_FINITO})
+            agregados = True
+    return agregados
+
+
+def _reporte(resultados, validos, errores):
+    """Arma el reporte de una columna de resultados, enmascarando los no finitos."""
+    if _marcar_no_finitos(resultados, validos, errores):
+        errores.sort(key=itemgetter('indice'))
+    return {'resultados': _anular(resultados, errores), 'validos': validos, 'errores': errores}
+
+
+def _anular(columna, errores):
+    """Pone None en las filas con error."""
+    for error in errores:
+        columna[error['indice']] = None
+    return columna
+
+
+def calcular_lote(figura, *columnas):
+    """
+    Calcula una figura sobre columnas de valores.
+
+    Args:
+        figura (Figura): Descripción del cálculo
+        *columnas: Una columna (o escalar) por parámetro de la figura
+
+    Returns:
+        dict: Reporte con 'resultados', 'validos' y 'errores'
+
+    Raises:
+        ValueError: Si las columnas tienen distinto largo
+    """
+    convertidas, validos, errores = _validar_lote(figura, columnas)
+    return _reporte(_aplicar(figura.formula, *convertidas), validos, errores)
+
+
+def areas_circulo(radios):
+    """
+    Área de cada círculo: π * r².
+
+    Args:
+        radios (list o float): Radios (no negativos)
+
+    Returns:
+        dict: Reporte con 'resultados', 'validos' y 'errores'
+
+    Example:
+        >>> areas_circulo([1, -1])['validos']
+        [True, False]
+    """
+    (r,), validos, errores = _validar_lote(CIRCULO, [radios])
+    pi = math.pi
+    try:
+        resultados = [pi * x ** 2 for x in r]
+    except OverflowError:
+        resultados = _por_fila(_area_circulo, r)
+    return _reporte(resultados, validos, errores)
+
+
+def areas_rectangulo(anchos, altos):
+    """
+    Área de cada rectángulo: ancho * alto.
+
+    Args:
+        anchos (list o float): Anchos (no negativos)
+        altos (list o float): Altos (no negativos)
+
+    Returns:
+        dict: Reporte con 'resultados', 'validos' y 'errores'
+
+    Example:
+        >>> areas_rectangulo([1, 2, 3], 2)['resultados']
+        [2.0, 4.0, 6.0]
+    """
+    return calcular_lote(RECTANGULO, anchos, altos)
+
+
+def areas_triangulo(bases, alturas):
+    """
+    Área de cada triángulo: (base * altura) / 2.
+
+    Args:
+        bases (list o float): Bases (no negativas)
+        alturas (list o float): Alturas (no negativas)
+
+    Returns:
+        dict: Reporte con 'resultados', 'validos' y 'errores'
+    """
+    return calcular_lote(TRIANGULO, bases, alturas)
+
+
+def areas_poligono_regular(nums_lados, longitudes_lado):
+    """
+    Área de cada polígono regular: (n * s²) / (4 * tan(π/n)).
+
+    Args:
+        nums_lados (list o int): Número de lados (al menos 3)
+        longitudes_lado (list o float): Longitud del lado (no negativa)
+
+    Returns:
+        dict: Reporte con 'resultados', 'validos' y 'errores'
+    """
+    (n, s), validos, errores = _validar_lote(POLIGONO_REGULAR, [nums_lados, longitudes_lado])
+    # Los lotes repiten pocas cantidades de lados: tan(π/n) se calcula una vez por valor
+    tan, pi = math.tan, math.pi
+    divisores = {}
+    for lados in set(n):
+        try:
+            divisores[lados] = 4 * tan(pi / lados)
+        except OverflowError:
+            divisores[lados] = math.nan  # demasiados lados para un float
+    try:
+        resultados = [(x * y ** 2) / divisores[x] for x, y in zip(n, s)]
+    except OverflowError:
+        resultados = _por_fila(lambda x, y: (x * y ** 2) / divisores[x], n, s)
+    return _reporte(resultados, validos, errores)
+
+
+def hipotenusas(catetos1, catetos2):
+    """
+    Hipotenusa de cada triángulo rectángulo con math.hypot.
+
+    Args:
+        catetos1 (list o float): Primer cateto (no negativo)
+        catetos2 (list o float): Segundo cateto (no negativo)
+
+    Returns:
+        dict: Reporte con 'resultados', 'validos' y 'errores'
+    """
+    return calcular_lote(HIPOTENUSA, catetos1, catetos2)
+
+
+def info_circulos(radios):
+    """
+    Área, perímetro y diámetro de cada círculo.
+
+    Args:
+        radios (list o float): Radios (no negativos)
+
+    Returns:
+        dict: Columnas 'radio', 'area', 'perimetro' y 'diametro' (None en
+              las filas con error), más 'validos' y 'errores'
+    """
+    (r,), validos, errores = _validar_lote(CIRCULO, [radios])
+    pi = math.pi
+    try:
+        areas = [pi * x ** 2 for x in r]
+    except OverflowError:
+        areas = _por_fila(_area_circulo, r)
+    perimetros = [2 * pi * x for x in r]
+    diametros = [2 * x for x in r]
+    # El área es la primera en desbordar (r > ~1e154): si es finita, el
+    # perímetro y el diámetro también, así que basta revisarla
+    if _marcar_no_finitos(areas, validos, errores):
+        errores.sort(key=itemgetter('indice'))
+    return {
+        'radio': _anular(r, errores),
+        'area': _anular(areas, errores),
+        'perimetro': _anular(perimetros, errores),
+        'diametro': _anular(diametros, errores),
+        'validos': validos,
+        'errores': errores,
+    }
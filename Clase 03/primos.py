@@ -0,0 +1,261 @@
+"""
+Módulo de números primos.
+
+Reemplaza la división por tentativa con:
+- Una criba de Eratóstenes segmentada (solo impares) para listar y contar
+  primos: la memoria de trabajo es un segmento de tamaño fijo más los primos
+  hasta √límite, así que sirve para límites de miles de millones.
+- Una tabla de bits (bytearray) de primos pequeños, calculada una sola vez,
+  para responder es_primo en O(1).
+- Miller-Rabin determinista para números grandes y, por encima de su
+  límite demostrado, Baillie-PSW (Miller-Rabin + Lucas fuerte).
+"""
+
+import math
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import compress
+
+
+LIMITE_TABLA = 1 << 20         # es_primo consulta la tabla por debajo de este valor
+TAMANO_SEGMENTO = 1 << 20      # impares por segmento de la criba (1 MiB)
+
+# Con los 13 primeros primos como bases Miller-Rabin es exacto para todo
+# n < LIMITE_MILLER_RABIN (ψ13 ≈ 3.3 * 10^24, el menor pseudoprimo fuerte
+# para todas ellas); por encima se agrega la prueba de Lucas fuerte
+BASES_MILLER_RABIN = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+LIMITE_MILLER_RABIN = 3317044064679887385961981
+PRIMOS_PEQUENOS = BASES_MILLER_RABIN
+
+
+def _criba_impares(limite):
+    """
+    Criba de Eratóstenes sobre los impares hasta `limite`.
+
+    Args:
+        limite (int): Límite superior (inclusive)
+
+    Returns:
+        bytearray: Posición i en 1 si 2*i + 1 es primo
+    """
+    cantidad = (limite + 1) // 2
+    criba = bytearray([1]) * cantidad
+    if cantidad:
+        criba[0] = 0  # el 1 no es primo
+    for i in range(1, (math.isqrt(limite) - 1) // 2 + 1):
+        if criba[i]:
+            primo = 2 * i + 1
+            inicio = primo * primo // 2
+            criba[inicio::primo] = bytes(len(range(inicio, cantidad, primo)))
+    return criba
+
+
+@lru_cache(maxsize=None)
+def _tabla_primos():
+    """Tabla de bits de los primos impares menores que LIMITE_TABLA (se calcula una vez)."""
+    return _criba_impares(LIMITE_TABLA - 1)
+
+
+def _primos_hasta(limite):
+    """Lista de primos hasta `limite` con una criba de una sola pieza."""
+    if limite < 2:
+        return []
+    criba = _tabla_primos() if limite < LIMITE_TABLA else _criba_impares(limite)
+    cantidad = (limite + 1) // 2
+    return [2] + [2 * i + 1 for i in compress(range(cantidad), criba[:cantidad])]
+
+
+def _segmentos(inicio, limite):
+    """
+    Recorre [inicio, limite] en segmentos de impares ya cribados.
+
+    Yields:
+        tuple: (primer impar del segmento, bytearray con 1 en los primos)
+    """
+    base = _primos_hasta(math.isqrt(limite))[1:]  # primos impares hasta √límite
+    bajo = max(inicio, 3) | 1
+    while bajo <= limite:
+        alto = min(bajo + 2 * (TAMANO_SEGMENTO - 1), limite)
+        cantidad = (alto - bajo) // 2 + 1
+        segmento = bytearray([1]) * cantidad
+        for primo in base[:bisect_right(base, math.isqrt(alto))]:
+            # Primer múltiplo impar de `primo` dentro del segmento
+            multiplo = max(primo * primo, (bajo + primo - 1) // primo * primo)
+            if multiplo % 2 == 0:
+                multiplo += primo
+            posicion = (multiplo - bajo) // 2
+            if posicion < cantidad:
+                segmento[posicion::primo] = bytes(len(range(posicion, cantidad, primo)))
+        yield bajo, segmento
+        bajo = (alto + 1) | 1
+
+
+def iterar_primos(limite, inicio=2):
+    """
+    Genera los primos entre `inicio` y `limite` con memoria acotada.
+
+    Args:
+        limite (int): Límite superior (inclusive)
+        inicio (int): Límite inferior (inclusive)
+
+    Yields:
+        int: Primos en orden creciente
+
+    Example:
+        >>> list(iterar_primos(30, inicio=10))
+        [11, 13, 17, 19, 23, 29]
+    """
+    if limite < 2 or inicio > limite:
+        return
+    if inicio <= 2:
+        yield 2
+    for bajo, segmento in _segmentos(inicio, limite):
+        yield from (bajo + 2 * i for i in compress(range(len(segmento)), segmento))
+
+
+def lista_primos(limite):
+    """
+    Lista los primos hasta `limite` (inclusive).
+
+    Args:
+        limite (int): Límite superior
+
+    Returns:
+        list: Primos en orden creciente
+
+    Example:
+        >>> lista_primos(20)
+        [2, 3, 5, 7, 11, 13, 17, 19]
+    """
+    if limite <= TAMANO_SEGMENTO * 2:
+        return _primos_hasta(limite)
+    return list(iterar_primos(limite))
+
+
+def contar_primos(limite):
+    """
+    Cuenta los primos hasta `limite` sin guardarlos.
+
+    Args:
+        limite (int): Límite superior (inclusive)
+
+    Returns:
+        int: Cantidad de primos
+
+    Example:
+        >>> contar_primos(10 ** 6)
+        78498
+    """
+    if limite < 2:
+        return 0
+    return 1 + sum(segmento.count(1) for _, segmento in _segmentos(3, limite))
+
+
+def _miller_rabin(numero):
+    """Miller-Rabin con las bases de BASES_MILLER_RABIN (numero impar > 37)."""
+    d, r = numero - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        r += 1
+    for base in BASES_MILLER_RABIN:
+        x = pow(base, d, numero)
+        if x == 1 or x == numero - 1:
+            continue
+        for _ in range(r - 1):
+            x = x * x % numero
+            if x == numero - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _jacobi(a, n):
+    """Símbolo de Jacobi (a/n) para n impar positivo."""
+    a %= n
+    resultado = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                resultado = -resultado
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            resultado = -resultado
+        a %= n
+    return resultado if n == 1 else 0
+
+
+def _lucas_fuerte(numero):
+    """
+    Prueba de probable primo de Lucas fuerte (numero impar sin factores chicos).
+
+    Usa los parámetros de Selfridge: D es el primero de 5, -7, 9, -11, ...
+    con (D/numero) = -1, P = 1 y Q = (1 - D) / 4.
+    """
+    if math.isqrt(numero) ** 2 == numero:
+        return False  # con un cuadrado perfecto no existe D con (D/n) = -1
+    d = 5
+    while _jacobi(d, numero) != -1:
+        if _jacobi(d, numero) == 0:
+            return False  # |D| comparte un factor con numero
+        d = -d - 2 if d > 0 else -d + 2
+    q = (1 - d) // 4
+
+    # numero + 1 = k * 2^s con k impar
+    k, s = numero + 1, 0
+    while k % 2 == 0:
+        k //= 2
+        s += 1
+
+    # U_k y V_k por duplicación binaria (P = 1); dividir por 2 es módulo numero impar
+    u, v, qk = 1, 1, q % numero
+    for bit in bin(k)[3:]:
+        u, v = u * v % numero, (v * v - 2 * qk) % numero
+        qk = qk * qk % numero
+        if bit == '1':
+            u, v = u + v, d * u + v
+            u = (u + numero if u % 2 else u) // 2 % numero
+            v = (v + numero if v % 2 else v) // 2 % numero
+            qk = qk * q % numero
+
+    if u == 0 or v == 0:
+        return True
+    for _ in range(s - 1):
+        v = (v * v - 2 * qk) % numero
+        if v == 0:
+            return True
+        qk = qk * qk % numero
+    return False
+
+
+def es_primo(numero):
+    """
+    Determina si un entero es primo.
+
+    Por debajo de LIMITE_TABLA consulta la tabla de bits. Hasta
+    LIMITE_MILLER_RABIN (≈ 3.3 * 10^24) usa Miller-Rabin con bases fijas,
+    que es exacto en ese rango. Por encima aplica Baillie-PSW (Miller-Rabin
+    en base 2 y la prueba de Lucas fuerte): no es una demostración, pero no
+    se conoce ningún compuesto que la pase.
+
+    Args:
+        numero (int): Entero a verificar
+
+    Returns:
+        bool: True si es primo
+
+    Example:
+        >>> es_primo(2 ** 61 - 1)
+        True
+    """
+    if numero < LIMITE_TABLA:
+        if numero < 3:
+            return numero == 2
+        return numero % 2 == 1 and _tabla_primos()[numero // 2] == 1
+    if any(numero % primo == 0 for primo in PRIMOS_PEQUENOS):
+        return False
+    if not _miller_rabin(numero):
+        return False
+    return numero < LIMITE_MILLER_RABIN or _lucas_fuerte(numero)
+
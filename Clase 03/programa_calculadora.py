@@ -1,5 +1,6 @@
 import utilidades_matematicas as util_math
 import math
+from itertools import islice
 
 
 def mostrar_menu():
@@ -114,12 +115,17 @@ def calcular_factorial():
     try:
         numero = obtener_numero("🔸 Ingresa un número entero: ", int, 0)
         
-        if numero > 20:
+        if numero > 10 ** 6:
             print("⚠️ Advertencia: Números muy grandes pueden tomar tiempo...")
         
-        resultado = util_math.factorial(numero)
-        
         print(f"\n✅ RESULTADO:")
+        if numero > 1000:
+            # Con miles de dígitos basta la magnitud (vía lgamma)
+            mantisa, exponente = util_math.magnitud_factorial(numero)
+            print(f"   {numero}! ≈ {mantisa:.6f} × 10^{exponente} ({exponente + 1} dígitos)")
+            return
+        
+        resultado = util_math.factorial(numero)
         print(f"   {numero}! = {resultado}")
         
         # Información adicional para números pequeños
@@ -245,15 +251,31 @@ def listar_primos():
     try:
         limite = obtener_numero("🔸 Hasta qué número buscar primos: ", int, 2)
         
-        if limite > 1000:
+        if limite > 10 ** 9:
             confirmar = input("⚠️ Esto puede tomar tiempo. ¿Continuar? (s/n): ")
             if confirmar.lower() not in ['s', 'si', 'sí']:
                 return
         
-        primos = util_math.lista_primos(limite)
-        
         print(f"\n✅ NÚMEROS PRIMOS HASTA {limite}:")
         
+        if limite > 10 ** 6:
+            # Sin guardar la lista: se cuentan por segmentos y solo se
+            # generan los extremos
+            total = util_math.contar_primos(limite)
+            primeros = list(islice(util_math.iterar_primos(limite), 20))
+            ventana = 1000
+            ultimos = list(util_math.iterar_primos(limite, inicio=limite - ventana))
+            while len(ultimos) < 20 and ventana < limite:
+                ventana *= 2
+                ultimos = list(util_math.iterar_primos(limite, inicio=limite - ventana))
+            print("Primeros 20:", primeros)
+            print("...")
+            print("Últimos 20:", ultimos[-20:])
+            print(f"\n📊 Total encontrados: {total} números primos")
+            return
+        
+        primos = util_math.lista_primos(limite)
+        
         if len(primos) <= 50:
             # Mostrar todos si son pocos
             for i, primo in enumerate(primos, 1):
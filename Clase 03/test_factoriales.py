@@ -0,0 +1,73 @@
+# Tests unitarios para el módulo de factoriales
+# Clase 03: Funciones y Módulos
+
+import math
+import sys
+import unittest
+
+import factoriales
+from factoriales import (MAXIMO_MEMO, factorial, limpiar_memo, log_factorial,
+                         magnitud_factorial, producto_rango)
+
+
+class TestFactoriales(unittest.TestCase):
+    """
+    Suite de tests que compara los factoriales con math.factorial
+    """
+
+    def setUp(self):
+        """Cada test parte sin puntos de control"""
+        limpiar_memo()
+
+    def tearDown(self):
+        limpiar_memo()
+
+    def test_tabla_y_grandes(self):
+        """Test: Tabla, tramos y math.factorial dan lo mismo"""
+        for numero in list(range(0, 200)) + [999, 1000, 1001, 1500, 3000, 2999, 5000]:
+            with self.subTest(numero=numero):
+                self.assertEqual(factorial(numero), math.factorial(numero))
+
+    def test_negativo(self):
+        """Test: Números negativos lanzan ValueError"""
+        for funcion in (factorial, log_factorial, magnitud_factorial):
+            with self.assertRaises(ValueError):
+                funcion(-1)
+        with self.assertRaises(ValueError):
+            factoriales.factoriales([3, -2])
+
+    def test_producto_rango(self):
+        """Test: División binaria igual al producto directo"""
+        self.assertEqual(producto_rango(4, 6), 120)
+        self.assertEqual(producto_rango(7, 6), 1)
+        self.assertEqual(producto_rango(1, 500), math.factorial(500))
+        self.assertEqual(producto_rango(1001, 1999), math.prod(range(1001, 2000)))
+
+    def test_memo_acotada_y_ordenada(self):
+        """Test: La memoria descarta los menos usados y sus claves siguen ordenadas"""
+        for numero in range(1000, 1000 + 40 * 50, 50):
+            factorial(numero)
+        self.assertEqual(len(factoriales._memo), MAXIMO_MEMO)
+        self.assertEqual(factoriales._claves, sorted(factoriales._memo))
+        self.assertEqual(factorial(2975), math.factorial(2975))  # parte de un punto de control
+
+    def test_factoriales_en_orden_recibido(self):
+        """Test: factoriales conserva el orden y los repetidos"""
+        self.assertEqual(factoriales.factoriales([5, 3, 5]), [120, 6, 120])
+        self.assertEqual(factoriales.factoriales([]), [])
+
+    def test_log_y_magnitud(self):
+        """Test: Logaritmo y notación científica sin calcular el factorial"""
+        self.assertAlmostEqual(log_factorial(10, 10), math.log10(math.factorial(10)))
+        self.assertAlmostEqual(log_factorial(50), math.log(math.factorial(50)))
+        for numero in (0, 1, 10, 100, 500, 1000):
+            digitos = str(math.factorial(numero))
+            mantisa, exponente = magnitud_factorial(numero)
+            with self.subTest(numero=numero):
+                self.assertEqual(exponente, len(digitos) - 1)
+                self.assertAlmostEqual(mantisa, int(digitos[:8]) / 10 ** (len(digitos[:8]) - 1), places=5)
+
+
+if __name__ == "__main__":
+    resultado = unittest.main(exit=False, verbosity=2).result
+    sys.exit(0 if resultado.wasSuccessful() else 1)
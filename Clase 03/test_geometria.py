@@ -0,0 +1,82 @@
+# Tests unitarios para el módulo de geometría por lotes
+# Clase 03: Funciones y Módulos
+
+import math
+import sys
+import unittest
+
+from geometria import (areas_circulo, areas_rectangulo, areas_triangulo,
+                       areas_poligono_regular, hipotenusas, info_circulos)
+from utilidades_matematicas import area_circulo, area_poligono_regular
+
+
+class TestGeometriaPorLotes(unittest.TestCase):
+    """
+    Suite de tests para los cálculos por lotes y sus reportes de errores
+    """
+
+    def assertErrores(self, reporte, esperados):
+        """Compara los errores del reporte como pares (indice, tipo)."""
+        self.assertEqual([(e['indice'], e['tipo']) for e in reporte['errores']], esperados)
+
+    def test_lote_coincide_con_funciones_escalares(self):
+        """Test: Los lotes dan lo mismo que las funciones escalares"""
+        radios = [0, 1, 2.5, 10]
+        self.assertEqual(areas_circulo(radios)['resultados'], [area_circulo(r) for r in radios])
+        self.assertEqual(areas_poligono_regular([3, 4, 6], 2)['resultados'],
+                         [area_poligono_regular(n, 2) for n in (3, 4, 6)])
+
+    def test_broadcasting_de_escalares(self):
+        """Test: Un escalar acompaña a una columna"""
+        self.assertEqual(areas_rectangulo([1, 2, 3], 2)['resultados'], [2.0, 4.0, 6.0])
+        self.assertEqual(areas_triangulo(4, [1, 2])['resultados'], [2.0, 4.0])
+
+    def test_columnas_de_distinto_largo(self):
+        """Test: Columnas de distinto largo lanzan ValueError"""
+        with self.assertRaises(ValueError):
+            areas_rectangulo([1, 2], [1, 2, 3])
+
+    def test_filas_invalidas_no_interrumpen_el_lote(self):
+        """Test: Tipos y valores inválidos se reportan por fila"""
+        reporte = areas_triangulo(['x', 3, 2], [1, 4, -1])
+        self.assertEqual(reporte['resultados'], [None, 6.0, None])
+        self.assertEqual(reporte['validos'], [False, True, False])
+        self.assertErrores(reporte, [(0, 'TypeError'), (2, 'ValueError')])
+
+    def test_desbordamiento_en_una_fila(self):
+        """Test: Una fila que desborda no hace fallar el resto del lote"""
+        reporte = areas_circulo([1, 1e200])
+        self.assertEqual(reporte['resultados'], [math.pi, None])
+        self.assertErrores(reporte, [(1, 'OverflowError')])
+
+        reporte = areas_poligono_regular([3, 6], [1, 1e200])
+        self.assertEqual(reporte['validos'], [True, False])
+        self.assertErrores(reporte, [(1, 'OverflowError')])
+
+        reporte = areas_poligono_regular([3, 10 ** 400], 1)
+        self.assertEqual(reporte['validos'], [True, False])
+        self.assertErrores(reporte, [(1, 'OverflowError')])
+
+    def test_resultados_no_finitos(self):
+        """Test: inf y NaN no se reportan como resultados válidos"""
+        reporte = areas_rectangulo([1e200, 2], [1e200, 3])
+        self.assertEqual(reporte['resultados'], [None, 6.0])
+        self.assertErrores(reporte, [(0, 'OverflowError')])
+
+        reporte = hipotenusas([3, float('inf'), float('nan')], 4)
+        self.assertEqual(reporte['resultados'], [5.0, None, None])
+        self.assertErrores(reporte, [(1, 'OverflowError'), (2, 'OverflowError')])
+
+    def test_info_circulos(self):
+        """Test: Una fila con error queda anulada en todas las columnas"""
+        reporte = info_circulos([2, 1e200, -1])
+        self.assertEqual(reporte['radio'], [2.0, None, None])
+        self.assertEqual(reporte['area'][0], 4 * math.pi)
+        self.assertEqual(reporte['perimetro'], [4 * math.pi, None, None])
+        self.assertEqual(reporte['diametro'], [4.0, None, None])
+        self.assertErrores(reporte, [(1, 'OverflowError'), (2, 'ValueError')])
+
+
+if __name__ == "__main__":
+    resultado = unittest.main(exit=False, verbosity=2).result
+    sys.exit(0 if resultado.wasSuccessful() else 1)
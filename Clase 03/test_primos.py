@@ -0,0 +1,100 @@
+# Tests unitarios para el módulo de números primos
+# Clase 03: Funciones y Módulos
+
+import math
+import sys
+import unittest
+
+from primos import (LIMITE_MILLER_RABIN, LIMITE_TABLA, TAMANO_SEGMENTO,
+                    _lucas_fuerte, contar_primos, es_primo, iterar_primos, lista_primos)
+
+
+def es_primo_ingenuo(numero):
+    """División por tentativa, como referencia."""
+    return numero >= 2 and all(numero % d for d in range(2, math.isqrt(numero) + 1))
+
+
+# Pseudoprimos fuertes conocidos: (número, factorización)
+PSEUDOPRIMOS_FUERTES = [
+    (3215031751, (151, 751, 28351)),                            # bases 2, 3, 5 y 7
+    (3825123056546413051, (149491, 747451, 34233211)),          # bases 2 a 23
+    (318665857834031151167461, (399165290221, 798330580441)),   # ψ12: bases 2 a 37
+    (3317044064679887385961981, (1287836182261, 2575672364521)),  # ψ13: bases 2 a 41
+]
+
+# Primeros pseudoprimos de Lucas fuertes con parámetros de Selfridge (OEIS A217255)
+PSEUDOPRIMOS_LUCAS = [5459, 5777, 10877, 16109, 18971, 22499, 24569, 25199, 40309, 58519, 75077, 97439]
+
+
+class TestCriba(unittest.TestCase):
+    """
+    Suite de tests para listar, iterar y contar primos
+    """
+
+    def test_lista_igual_que_division_por_tentativa(self):
+        """Test: lista_primos coincide con la referencia"""
+        self.assertEqual(lista_primos(2000), [n for n in range(2001) if es_primo_ingenuo(n)])
+        self.assertEqual(lista_primos(1), [])
+        self.assertEqual(lista_primos(2), [2])
+
+    def test_iterar_con_inicio(self):
+        """Test: iterar_primos respeta los límites inclusive"""
+        self.assertEqual(list(iterar_primos(30, inicio=10)), [11, 13, 17, 19, 23, 29])
+        self.assertEqual(list(iterar_primos(13, inicio=13)), [13])
+        self.assertEqual(list(iterar_primos(10, inicio=20)), [])
+
+    def test_conteos_conocidos_entre_segmentos(self):
+        """Test: Conteos de π(x) que cruzan varios segmentos"""
+        self.assertEqual(contar_primos(10 ** 6), 78498)
+        self.assertEqual(contar_primos(5 * 10 ** 6), 348513)
+        borde = 2 * TAMANO_SEGMENTO
+        self.assertEqual(len(lista_primos(borde + 1000)), contar_primos(borde + 1000))
+
+
+class TestEsPrimo(unittest.TestCase):
+    """
+    Suite de tests para es_primo (tabla, Miller-Rabin y Baillie-PSW)
+    """
+
+    def test_borde_de_la_tabla(self):
+        """Test: Mismo resultado a ambos lados de LIMITE_TABLA"""
+        for numero in range(LIMITE_TABLA - 200, LIMITE_TABLA + 200):
+            with self.subTest(numero=numero):
+                self.assertEqual(es_primo(numero), es_primo_ingenuo(numero))
+
+    def test_coincide_con_la_criba(self):
+        """Test: es_primo coincide con la criba segmentada lejos de la tabla"""
+        inicio, fin = 10 ** 9, 10 ** 9 + 20000
+        self.assertEqual([n for n in range(inicio, fin + 1) if es_primo(n)],
+                         list(iterar_primos(fin, inicio=inicio)))
+
+    def test_pseudoprimos_fuertes(self):
+        """Test: Compuestos que engañan a Miller-Rabin con las primeras bases"""
+        for numero, factores in PSEUDOPRIMOS_FUERTES:
+            with self.subTest(numero=numero):
+                self.assertEqual(math.prod(factores), numero)
+                self.assertFalse(es_primo(numero))
+        self.assertGreaterEqual(PSEUDOPRIMOS_FUERTES[-1][0], LIMITE_MILLER_RABIN)
+
+    def test_pseudoprimos_de_lucas(self):
+        """Test: La prueba de Lucas sola falla donde se conoce, es_primo no"""
+        fuera_de_lista = [n for n in range(43, PSEUDOPRIMOS_LUCAS[-1] + 1, 2)
+                          if not es_primo_ingenuo(n) and math.gcd(n, math.prod(range(3, 42, 2))) == 1
+                          and _lucas_fuerte(n)]
+        self.assertEqual(fuera_de_lista, PSEUDOPRIMOS_LUCAS)
+        self.assertFalse(any(es_primo(n) for n in PSEUDOPRIMOS_LUCAS))
+
+    def test_numeros_grandes(self):
+        """Test: Primos de Mersenne y compuestos grandes"""
+        for exponente in (61, 89, 107, 127, 521):
+            with self.subTest(exponente=exponente):
+                self.assertTrue(es_primo(2 ** exponente - 1))
+        self.assertFalse(es_primo(2 ** 67 - 1))  # 193707721 × 761838257287
+        self.assertFalse(es_primo((2 ** 89 - 1) * (2 ** 107 - 1)))
+        self.assertFalse(es_primo((2 ** 61 - 1) ** 2))
+        self.assertFalse(es_primo(5394826801))  # número de Carmichael
+
+
+if __name__ == "__main__":
+    resultado = unittest.main(exit=False, verbosity=2).result
+    sys.exit(0 if resultado.wasSuccessful() else 1)
@@ -1,5 +1,21 @@
 import math
 
+import geometria
+import primos
+from geometria import (areas_circulo, areas_rectangulo, areas_triangulo,
+                       areas_poligono_regular, hipotenusas, info_circulos)
+from factoriales import factorial as factorial_entero, factoriales, log_factorial, magnitud_factorial
+from primos import iterar_primos, contar_primos
+
+
+# Las funciones escalares comparten validación y fórmula con los lotes de geometria
+_area_circulo = geometria.funcion_escalar(geometria.CIRCULO)
+_area_rectangulo = geometria.funcion_escalar(geometria.RECTANGULO)
+_area_triangulo = geometria.funcion_escalar(geometria.TRIANGULO)
+_area_poligono_regular = geometria.funcion_escalar(geometria.POLIGONO_REGULAR)
+_hipotenusa = geometria.funcion_escalar(geometria.HIPOTENUSA)
+_info_circulo = geometria.funcion_escalar(geometria.INFO_CIRCULO)
+
 
 def area_circulo(radio):
     """
@@ -21,15 +37,7 @@ def area_circulo(radio):
         >>> area_circulo(5)
         78.53981633974483
     """
-    try:
-        radio = float(radio)
-        if radio < 0:
-            raise ValueError("El radio no puede ser negativo")
-        return math.pi * radio ** 2
-    except (ValueError, TypeError) as e:
-        if "could not convert" in str(e):
-            raise TypeError("El radio debe ser un número")
-        raise
+    return _area_circulo(radio)
 
 
 def area_rectangulo(ancho, alto):
@@ -53,19 +61,7 @@ def area_rectangulo(ancho, alto):
         >>> area_rectangulo(4, 6)
         24
     """
-    try:
-        ancho = float(ancho)
-        alto = float(alto)
-        
-        if ancho < 0 or alto < 0:
-            raise ValueError("El ancho y alto deben ser positivos")
-            
-        return ancho * alto
-        
-    except (ValueError, TypeError) as e:
-        if "could not convert" in str(e):
-            raise TypeError("El ancho y alto deben ser números")
-        raise
+    return _area_rectangulo(ancho, alto)
 
 
 def area_triangulo(base, altura):
@@ -89,19 +85,7 @@ def area_triangulo(base, altura):
         >>> area_triangulo(10, 8)
         40.0
     """
-    try:
-        base = float(base)
-        altura = float(altura)
-        
-        if base < 0 or altura < 0:
-            raise ValueError("La base y altura deben ser positivos")
-            
-        return (base * altura) / 2
-        
-    except (ValueError, TypeError) as e:
-        if "could not convert" in str(e):
-            raise TypeError("La base y altura deben ser números")
-        raise
+    return _area_triangulo(base, altura)
 
 
 def factorial(numero):
@@ -110,6 +94,9 @@ def factorial(numero):
     
     Fórmula: n! = n * (n-1) * (n-2) * ... * 1
     
+    Los valores grandes se calculan por división binaria partiendo del
+    factorial memorizado más cercano (ver factoriales.py).
+    
     Args:
         numero (int): Número entero no negativo
         
@@ -128,22 +115,10 @@ def factorial(numero):
     """
     try:
         numero = int(numero)
-        if numero < 0:
-            raise ValueError("El factorial no está definido para números negativos")
-            
-        if numero == 0 or numero == 1:
-            return 1
-        
-        resultado = 1
-        for i in range(2, numero + 1):
-            resultado *= i
-            
-        return resultado
-        
-    except (ValueError, TypeError) as e:
-        if "invalid literal" in str(e):
-            raise TypeError("El número debe ser un entero")
-        raise
+    except (ValueError, TypeError):
+        raise TypeError("El número debe ser un entero")
+    
+    return factorial_entero(numero)
 
 
 def es_primo(numero):
@@ -151,7 +126,8 @@ def es_primo(numero):
     Determina si un número es primo.
     
     Un número primo es un entero mayor que 1 que no tiene divisores
-    positivos distintos a 1 y él mismo.
+    positivos distintos a 1 y él mismo. Los números pequeños se consultan
+    en una tabla precalculada y los grandes con Miller-Rabin (ver primos.py).
     
     Args:
         numero (int): Número entero a verificar
@@ -170,29 +146,10 @@ def es_primo(numero):
     """
     try:
         numero = int(numero)
-        
-        # Los números menores a 2 no son primos
-        if numero < 2:
-            return False
-            
-        # 2 es primo
-        if numero == 2:
-            return True
-            
-        # Los números pares mayores a 2 no son primos
-        if numero % 2 == 0:
-            return False
-            
-        # Verificar divisibilidad desde 3 hasta la raíz cuadrada del número
-        # Solo verificamos números impares
-        for i in range(3, int(math.sqrt(numero)) + 1, 2):
-            if numero % i == 0:
-                return False
-                
-        return True
-        
     except (ValueError, TypeError):
         raise TypeError("El número debe ser un entero")
+    
+    return primos.es_primo(numero)
 
 
 def area_poligono_regular(num_lados, longitud_lado):
@@ -217,25 +174,7 @@ def area_poligono_regular(num_lados, longitud_lado):
         >>> area_poligono_regular(6, 5)  # Hexágono regular
         64.95190528383289
     """
-    try:
-        num_lados = int(num_lados)
-        longitud_lado = float(longitud_lado)
-        
-        if num_lados < 3:
-            raise ValueError("Un polígono debe tener al menos 3 lados")
-            
-        if longitud_lado < 0:
-            raise ValueError("La longitud del lado debe ser positiva")
-            
-        # Fórmula para el área de un polígono regular
-        area = (num_lados * longitud_lado ** 2) / (4 * math.tan(math.pi / num_lados))
-        
-        return area
-        
-    except (ValueError, TypeError) as e:
-        if "invalid literal" in str(e) or "could not convert" in str(e):
-            raise TypeError("Los parámetros deben ser números válidos")
-        raise
+    return _area_poligono_regular(num_lados, longitud_lado)
 
 
 def obtener_info_circulo(radio):
@@ -248,27 +187,16 @@ def obtener_info_circulo(radio):
     Returns:
         dict: Diccionario con área, perímetro y diámetro
     """
-    try:
-        radio = float(radio)
-        if radio < 0:
-            raise ValueError("El radio no puede ser negativo")
-            
-        return {
-            'radio': radio,
-            'area': area_circulo(radio),
-            'perimetro': 2 * math.pi * radio,
-            'diametro': 2 * radio
-        }
-    except (ValueError, TypeError) as e:
-        if "could not convert" in str(e):
-            raise TypeError("El radio debe ser un número")
-        raise
+    return _info_circulo(radio)
 
 
 def lista_primos(limite):
     """
     Función adicional: Genera una lista de números primos hasta un límite.
     
+    Usa una criba de Eratóstenes segmentada. Para límites muy grandes,
+    iterar_primos() y contar_primos() evitan guardar la lista completa.
+    
     Args:
         limite (int): Límite superior para buscar primos
         
@@ -277,25 +205,18 @@ def lista_primos(limite):
     """
     try:
         limite = int(limite)
-        if limite < 2:
-            return []
-            
-        primos = []
-        for num in range(2, limite + 1):
-            if es_primo(num):
-                primos.append(num)
-                
-        return primos
-        
     except (ValueError, TypeError):
         raise TypeError("El límite debe ser un entero")
+    
+    return primos.lista_primos(limite)
 
 
 def calcular_hipotenusa(cateto1, cateto2):
     """
     Función adicional: Calcula la hipotenusa de un triángulo rectángulo.
     
-    Fórmula: √(cateto1² + cateto2²)
+    Fórmula: √(cateto1² + cateto2²), calculada con math.hypot para evitar
+    overflow con catetos muy grandes
     
     Args:
         cateto1 (float): Primer cateto
@@ -304,19 +225,7 @@ def calcular_hipotenusa(cateto1, cateto2):
     Returns:
         float: Longitud de la hipotenusa
     """
-    try:
-        cateto1 = float(cateto1)
-        cateto2 = float(cateto2)
-        
-        if cateto1 < 0 or cateto2 < 0:
-            raise ValueError("Los catetos deben ser positivos")
-            
-        return math.sqrt(cateto1**2 + cateto2**2)
-        
-    except (ValueError, TypeError) as e:
-        if "could not convert" in str(e):
-            raise TypeError("Los catetos deben ser números")
-        raise
+    return _hipotenusa(cateto1, cateto2)
 
 
 # Constantes matemáticas útiles
@@ -3,8 +3,240 @@
 
 import re
 from datetime import datetime, date
+from itertools import islice
+from operator import itemgetter
 import json
 
+from registro_personas import RegistroPersonas
+
+
+# Patrones compilados una sola vez para todas las validaciones
+PATRON_CORREO = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+PATRON_NOMBRE = re.compile(r'^[a-zA-ZÀ-ÿñÑ\s]+$')
+
+# Variantes para validar una columna completa con una sola búsqueda: los
+# valores se unen con un separador que ningún valor válido puede contener
+# (si algún valor lo contiene, la columna se valida registro por registro)
+PATRON_COLUMNA_NOMBRES = re.compile(r'(?:[a-zA-ZÀ-ÿñÑ\s]+\x00)*[a-zA-ZÀ-ÿñÑ\s]+')
+PATRON_COLUMNA_CORREOS = re.compile(
+    r'(?:[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\n)*'
+    r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+)
+
+CAMPOS_PERSONA = ('nombre', 'edad', 'correo_electronico')
+TAMANO_BLOQUE_VALIDACION = 1024
+
+
+def _normalizar_nombre(nombre):
+    """
+    Valida y formatea un nombre sin lanzar excepciones.
+    
+    Args:
+        nombre (str): Nombre a validar
+        
+    Returns:
+        tuple: (nombre formateado, None) o (None, mensaje de error)
+    """
+    if not isinstance(nombre, str):
+        return None, "El nombre debe ser una cadena de texto"
+    
+    nombre = nombre.strip()
+    if not nombre:
+        return None, "El nombre no puede estar vacío"
+    
+    if len(nombre) < 2:
+        return None, "El nombre debe tener al menos 2 caracteres"
+    
+    if len(nombre) > 100:
+        return None, "El nombre no puede tener más de 100 caracteres"
+    
+    # Verificar que solo contenga letras y espacios
+    if not PATRON_NOMBRE.match(nombre):
+        return None, "El nombre solo puede contener letras y espacios"
+    
+    # Formatear nombre (primera letra de cada palabra en mayúscula)
+    return ' '.join(map(str.capitalize, nombre.split())), None
+
+
+def _error_edad(edad):
+    """
+    Valida una edad sin lanzar excepciones.
+    
+    Returns:
+        str o None: Mensaje de error, o None si la edad es válida
+    """
+    if not isinstance(edad, int):
+        return "La edad debe ser un número entero"
+    if edad < 0:
+        return "La edad no puede ser negativa"
+    if edad > 150:
+        return "La edad no puede ser mayor a 150 años"
+    return None
+
+
+def correo_es_valido(correo):
+    """
+    Valida el formato de una dirección de correo electrónico.
+    
+    Args:
+        correo (str): Dirección a validar
+        
+    Returns:
+        bool: True si el correo es válido, False en caso contrario
+    """
+    # Verificaciones adicionales
+    if not isinstance(correo, str):
+        return False
+    
+    if len(correo) > 254:  # RFC 5321
+        return False
+    
+    # Verificar que no tenga caracteres especiales problemáticos
+    if '..' in correo:
+        return False
+    
+    if correo.startswith('.') or correo.endswith('.'):
+        return False
+    
+    return PATRON_CORREO.match(correo) is not None
+
+
+def calcular_dias_hasta(fecha_cumpleanos, hoy=None):
+    """
+    Calcula los días desde `hoy` hasta el próximo cumpleaños.
+    
+    Args:
+        fecha_cumpleanos (str): Fecha de cumpleaños en formato 'DD/MM'
+        hoy (date, optional): Fecha de referencia (por defecto, hoy)
+        
+    Returns:
+        int: Días hasta el cumpleaños
+        
+    Raises:
+        ValueError: Si la fecha no es válida
+    """
+    dia, mes = map(int, fecha_cumpleanos.split('/'))
+    hoy = hoy or date.today()
+    cumple_este_año = date(hoy.year, mes, dia)
+    
+    if cumple_este_año < hoy:
+        cumple_proximo = date(hoy.year + 1, mes, dia)
+    else:
+        cumple_proximo = cumple_este_año
+    
+    return (cumple_proximo - hoy).days
+
+
+def _extraer_columnas(bloque, desplazamiento, rechazos):
+    """
+    Separa un bloque de registros en columnas.
+    
+    Los registros a los que les falta algún campo se agregan a `rechazos`.
+    
+    Returns:
+        tuple: (posiciones en el bloque, nombres, edades, correos)
+    """
+    try:
+        filas = list(map(itemgetter(*CAMPOS_PERSONA), bloque))
+        posiciones = range(len(bloque))
+    except (KeyError, TypeError):
+        filas, posiciones = [], []
+        for posicion, datos in enumerate(bloque):
+            faltantes = [campo for campo in CAMPOS_PERSONA
+                         if not isinstance(datos, dict) or campo not in datos]
+            if faltantes:
+                rechazos.append({'indice': desplazamiento + posicion, 'registro': datos,
+                                 'errores': {campo: "Campo obligatorio ausente" for campo in faltantes}})
+            else:
+                filas.append((datos['nombre'], datos['edad'], datos['correo_electronico']))
+                posiciones.append(posicion)
+    
+    if not filas:
+        return posiciones, [], [], []
+    nombres, edades, correos = zip(*filas)
+    return posiciones, nombres, edades, correos
+
+
+def _formatear_columna_nombres(nombres):
+    """
+    Valida y formatea una columna de nombres con una sola búsqueda.
+    
+    Returns:
+        list o None: Nombres formateados, o None si algún nombre no pasa
+                     (o no puede formatearse en bloque) y hay que validarlos uno a uno
+    """
+    if not all(type(nombre) is str for nombre in nombres):
+        return None
+    
+    limpios = [nombre.strip() for nombre in nombres]
+    if min(map(len, limpios)) < 2 or max(map(len, limpios)) > 100:
+        return None
+    
+    columna = '\x00'.join(limpios)
+    if columna.count('\x00') != len(limpios) - 1:
+        return None  # algún nombre contiene el separador
+    # '×' y '÷' están en el rango permitido pero no son letras: title() no
+    # los trata igual que capitalize(), así que esos bloques van uno a uno
+    if '×' in columna or '÷' in columna or not PATRON_COLUMNA_NOMBRES.fullmatch(columna):
+        return None
+    
+    # Los nombres ya no tienen espacios en los extremos y '\x00' no es
+    # espacio, así que split()/join colapsa los espacios dentro de cada nombre
+    formateados = ' '.join(columna.split()).title().split('\x00')
+    return formateados if len(formateados) == len(nombres) else None
+
+
+def _columna_correos_valida(correos):
+    """Indica si todos los correos de una columna son válidos (una sola búsqueda)."""
+    if not all(type(correo) is str for correo in correos):
+        return False
+    if max(map(len, correos)) > 254:  # RFC 5321
+        return False
+    
+    columna = '\n'.join(correos)
+    if columna.count('\n') != len(correos) - 1:
+        return False  # algún correo contiene el separador
+    if '..' in columna or '\n.' in columna or '.\n' in columna:
+        return False
+    if columna.startswith('.') or columna.endswith('.'):
+        return False
+    return PATRON_COLUMNA_CORREOS.fullmatch(columna) is not None
+
+
+def _validar_columnas(nombres, edades, correos):
+    """
+    Valida columnas de nombres, edades y correos con las reglas de Persona.
+    
+    Primero intenta validar cada columna completa de una vez; solo si algún
+    valor falla se revisa registro por registro para saber cuál y por qué.
+    
+    Returns:
+        tuple: (nombres formateados, {posición: {campo: mensaje}})
+    """
+    errores = {}
+    if not nombres:
+        return [], errores
+    
+    formateados = _formatear_columna_nombres(nombres)
+    if formateados is None:
+        formateados = []
+        for i, nombre in enumerate(nombres):
+            nombre, error = _normalizar_nombre(nombre)
+            formateados.append(nombre)
+            if error:
+                errores.setdefault(i, {})['nombre'] = error
+    
+    for i, edad in enumerate(edades):
+        if not isinstance(edad, int) or not 0 <= edad <= 150:
+            errores.setdefault(i, {})['edad'] = _error_edad(edad)
+    
+    if not _columna_correos_valida(correos):
+        for i, correo in enumerate(correos):
+            if not correo_es_valido(correo):
+                errores.setdefault(i, {})['correo_electronico'] = f"El correo electrónico '{correo}' no es válido"
+    
+    return formateados, errores
+
 
 class Persona:
     """
@@ -12,9 +244,10 @@ class Persona:
     Incluye validaciones, métodos de actualización y funcionalidades avanzadas.
     """
     
-    # Atributo de clase para llevar registro de todas las personas creadas
+    # Atributos de clase: contador de personas creadas y registro de las
+    # personas vivas (referencias débiles + estadísticas incrementales)
     contador_personas = 0
-    personas_creadas = []
+    personas_creadas = RegistroPersonas()
     
     def __init__(self, nombre, edad, correo_electronico):
         """
@@ -28,22 +261,80 @@ class Persona:
         Raises:
             ValueError: Si algún parámetro no es válido
         """
-        # Validar y asignar atributos
+        # Validar y asignar atributos (la persona aún no está registrada,
+        # así que se asignan directo sin pasar por los setters)
         self.nombre = self._validar_nombre(nombre)
-        self.edad = self._validar_edad(edad)
-        self.correo_electronico = correo_electronico
+        self._edad = self._validar_edad(edad)
+        self._correo_electronico = correo_electronico
         
         # Validar correo al crear la persona
-        if not self.validar_correo():
+        correo_valido = self.validar_correo()
+        if not correo_valido:
             raise ValueError(f"El correo electrónico '{correo_electronico}' no es válido")
         
         # Atributos adicionales
         self.fecha_creacion = datetime.now()
         self.id_persona = Persona.contador_personas + 1
         
-        # Actualizar contador de clase
+        # Actualizar contador de clase y registrar en el registro global
         Persona.contador_personas += 1
-        Persona.personas_creadas.append(self)
+        registro = Persona.personas_creadas
+        if type(registro) is not RegistroPersonas:
+            registro = Persona._registro_activo()
+        self._slot_registro = registro.registrar(self, self._edad, True)
+        self._registro = registro
+    
+    @property
+    def edad(self):
+        """Edad en años."""
+        return self._edad
+    
+    @edad.setter
+    def edad(self, valor):
+        valor = self._validar_edad(valor)
+        if valor == self._edad:
+            return
+        # Primero el registro: si falla, la persona queda como estaba
+        if getattr(self, '_registro', None) is not None:
+            self._registro.actualizar(self._slot_registro, edad=valor)
+        self._edad = valor
+    
+    @property
+    def correo_electronico(self):
+        """Dirección de correo electrónico."""
+        return self._correo_electronico
+    
+    @correo_electronico.setter
+    def correo_electronico(self, valor):
+        if valor == self._correo_electronico:
+            return
+        self._correo_electronico = valor
+        if getattr(self, '_registro', None) is not None:
+            self._registro.actualizar(self._slot_registro, correo_valido=self.validar_correo())
+    
+    def _registrar_en(self, registro, correo_valido=None):
+        """Registra la persona en un RegistroPersonas."""
+        if correo_valido is None:
+            correo_valido = self.validar_correo()
+        self._slot_registro = registro.registrar(self, self.edad, correo_valido)
+        self._registro = registro
+    
+    @classmethod
+    def _registro_activo(cls):
+        """
+        Devuelve el registro global de personas.
+        
+        Si `personas_creadas` fue reemplazado por una lista (por ejemplo,
+        `Persona.personas_creadas = []` para reiniciarlo), se convierte en
+        un RegistroPersonas con las personas que contenga.
+        """
+        registro = Persona.personas_creadas
+        if not isinstance(registro, RegistroPersonas):
+            personas = list(registro)
+            registro = Persona.personas_creadas = RegistroPersonas()
+            for persona in personas:
+                persona._registrar_en(registro)
+        return registro
     
     def _validar_nombre(self, nombre):
         """
@@ -58,25 +349,10 @@ class Persona:
         Raises:
             ValueError: Si el nombre no es válido
         """
-        if not isinstance(nombre, str):
-            raise ValueError("El nombre debe ser una cadena de texto")
-        
-        nombre = nombre.strip()
-        if not nombre:
-            raise ValueError("El nombre no puede estar vacío")
-        
-        if len(nombre) < 2:
-            raise ValueError("El nombre debe tener al menos 2 caracteres")
-        
-        if len(nombre) > 100:
-            raise ValueError("El nombre no puede tener más de 100 caracteres")
-        
-        # Verificar que solo contenga letras y espacios
-        if not re.match(r'^[a-zA-ZÀ-ÿñÑ\s]+$', nombre):
-            raise ValueError("El nombre solo puede contener letras y espacios")
-        
-        # Formatear nombre (primera letra de cada palabra en mayúscula)
-        return ' '.join(word.capitalize() for word in nombre.split())
+        nombre, error = _normalizar_nombre(nombre)
+        if error:
+            raise ValueError(error)
+        return nombre
     
     def _validar_edad(self, edad):
         """
@@ -91,15 +367,9 @@ class Persona:
         Raises:
             ValueError: Si la edad no es válida
         """
-        if not isinstance(edad, int):
-            raise ValueError("La edad debe ser un número entero")
-        
-        if edad < 0:
-            raise ValueError("La edad no puede ser negativa")
-        
-        if edad > 150:
-            raise ValueError("La edad no puede ser mayor a 150 años")
-        
+        error = _error_edad(edad)
+        if error:
+            raise ValueError(error)
         return edad
     
     def mostrar_datos(self):
@@ -124,24 +394,7 @@ class Persona:
         Returns:
             bool: True si el correo es válido, False en caso contrario
         """
-        # Patrón mejorado para validación de correo electrónico
-        patron = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        
-        # Verificaciones adicionales
-        if not isinstance(self.correo_electronico, str):
-            return False
-        
-        if len(self.correo_electronico) > 254:  # RFC 5321
-            return False
-        
-        # Verificar que no tenga caracteres especiales problemáticos
-        if '..' in self.correo_electronico:
-            return False
-        
-        if self.correo_electronico.startswith('.') or self.correo_electronico.endswith('.'):
-            return False
-        
-        return bool(re.match(patron, self.correo_electronico))
+        return correo_es_valido(self.correo_electronico)
     
     def actualizar_datos(self, nombre=None, edad=None, correo_electronico=None):
         """
@@ -168,7 +421,7 @@ class Persona:
             # Actualizar edad si se proporciona
             if edad is not None:
                 edad_anterior = self.edad
-                self.edad = self._validar_edad(edad)
+                self.edad = edad  # el setter valida la edad
                 cambios['edad'] = {'anterior': edad_anterior, 'nuevo': self.edad}
                 print(f"✅ Edad actualizada: {edad_anterior} → {self.edad} años")
             
@@ -244,18 +497,7 @@ class Persona:
             int: Días hasta el cumpleaños
         """
         try:
-            dia, mes = map(int, fecha_cumpleanos.split('/'))
-            año_actual = datetime.now().year
-            cumple_este_año = datetime(año_actual, mes, dia).date()
-            hoy = date.today()
-            
-            if cumple_este_año < hoy:
-                cumple_proximo = datetime(año_actual + 1, mes, dia).date()
-            else:
-                cumple_proximo = cumple_este_año
-            
-            dias = (cumple_proximo - hoy).days
-            return dias
+            return calcular_dias_hasta(fecha_cumpleanos)
             
         except Exception as e:
             print(f"❌ Error al calcular días hasta cumpleaños: {e}")
@@ -349,32 +591,88 @@ class Persona:
             Persona: Nueva instancia de Persona
         """
         return cls(datos['nombre'], datos['edad'], datos['correo_electronico'])
+
+    @classmethod
+    def desde_lote(cls, registros):
+        """
+        Crea personas a partir de muchos diccionarios, validándolos en bloque.
+        
+        Aplica las mismas reglas que el constructor, pero columna por columna
+        (ver `_validar_columnas`) y sin excepciones por registro: los registros
+        inválidos se reportan en lugar de interrumpir la carga. Todas las
+        personas del lote comparten la misma `fecha_creacion` y se agregan al
+        registro global de una sola vez.
+        
+        Args:
+            registros (iterable): Diccionarios con 'nombre', 'edad' y
+                                  'correo_electronico'
+            
+        Returns:
+            tuple: (lista de Persona válidas, lista de rechazos). Cada rechazo
+                   es un dict con 'indice', 'registro' y 'errores'
+                   ({campo: mensaje})
+        """
+        nombres_validos, edades_validas, correos_validos, rechazos = [], [], [], []
+        iterador = iter(registros)
+        desplazamiento = 0
+        
+        while True:
+            bloque = list(islice(iterador, TAMANO_BLOQUE_VALIDACION))
+            if not bloque:
+                break
+            
+            posiciones, nombres, edades, correos = _extraer_columnas(bloque, desplazamiento, rechazos)
+            nombres, errores = _validar_columnas(nombres, edades, correos)
+            
+            if not errores:
+                # Bloque completo válido: las columnas se agregan tal cual
+                nombres_validos.extend(nombres)
+                edades_validas.extend(edades)
+                correos_validos.extend(correos)
+            else:
+                for i, (posicion, nombre, edad, correo) in enumerate(zip(posiciones, nombres, edades, correos)):
+                    if i in errores:
+                        rechazos.append({'indice': desplazamiento + posicion,
+                                         'registro': bloque[posicion], 'errores': errores[i]})
+                        continue
+                    nombres_validos.append(nombre)
+                    edades_validas.append(edad)
+                    correos_validos.append(correo)
+            
+            desplazamiento += len(bloque)
+        
+        # Las instancias se crean sin pasar por __init__ ni los setters: se
+        # registran todas juntas y luego se completa su __dict__ con el slot
+        nuevo = object.__new__
+        cantidad = len(edades_validas)
+        personas = [nuevo(cls) for _ in range(cantidad)]
+        registro_activo = cls._registro_activo()
+        slots = registro_activo.registrar_lote(personas, edades_validas, [True] * cantidad)
+        fecha_creacion = datetime.now()
+        ids = range(Persona.contador_personas + 1, Persona.contador_personas + 1 + cantidad)
+        Persona.contador_personas += cantidad
+        for persona, nombre, edad, correo, id_persona, slot in zip(
+                personas, nombres_validos, edades_validas, correos_validos, ids, slots):
+            persona.__dict__ = {
+                'nombre': nombre, '_edad': edad, '_correo_electronico': correo,
+                'fecha_creacion': fecha_creacion, 'id_persona': id_persona,
+                '_registro': registro_activo, '_slot_registro': slot
+            }
+        
+        rechazos.sort(key=itemgetter('indice'))
+        return personas, rechazos
     
     @classmethod
     def obtener_estadisticas_generales(cls):
         """
-        Obtiene estadísticas generales de todas las personas creadas.
+        Obtiene estadísticas generales de todas las personas vivas.
+        
+        Se leen de los contadores del registro, sin recorrer las personas.
         
         Returns:
             dict: Estadísticas generales
         """
-        if not cls.personas_creadas:
-            return {"mensaje": "No hay personas registradas"}
-        
-        edades = [p.edad for p in cls.personas_creadas]
-        correos_validos = sum(1 for p in cls.personas_creadas if p.validar_correo())
-        mayores_edad = sum(1 for p in cls.personas_creadas if p.es_mayor_de_edad())
-        
-        return {
-            'total_personas': len(cls.personas_creadas),
-            'edad_promedio': sum(edades) / len(edades),
-            'edad_minima': min(edades),
-            'edad_maxima': max(edades),
-            'correos_validos': correos_validos,
-            'porcentaje_correos_validos': (correos_validos / len(cls.personas_creadas)) * 100,
-            'mayores_de_edad': mayores_edad,
-            'porcentaje_mayores_edad': (mayores_edad / len(cls.personas_creadas)) * 100
-        }
+        return cls._registro_activo().estadisticas()
     
     def __str__(self):
         """
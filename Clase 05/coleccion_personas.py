@@ -0,0 +1,399 @@
+# Colección indexada de personas
+# Índice ordenado por edad (bisect), índice por generación, índice hash por
+# correo normalizado (sin duplicados) e índice de cumpleaños por fecha.
+
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, timedelta
+from itertools import chain, islice
+
+from clase_persona import Persona, calcular_dias_hasta
+
+
+def normalizar_correo(correo):
+    """
+    Normaliza un correo para compararlo (sin espacios y en minúsculas).
+
+    Args:
+        correo (str): Dirección de correo
+
+    Returns:
+        str: Correo normalizado
+    """
+    return correo.strip().lower() if isinstance(correo, str) else correo
+
+
+class ColeccionPersonas:
+    """
+    Colección de personas con índices para consultas sub-lineales.
+
+    - Edad: lista ordenada de (edad, id) para consultas por rango con bisect.
+    - Generación: diccionario generación -> personas (usa obtener_generacion).
+    - Correo: diccionario correo normalizado -> persona; evita duplicados.
+    - Cumpleaños: lista ordenada de (mes, día, id) para buscar los próximos.
+
+    Los índices se calculan al agregar la persona. Si después cambian su
+    edad o su correo, hay que llamar a `reindexar(persona)`.
+    """
+
+    def __init__(self, personas=None):
+        """
+        Inicializa la colección.
+
+        Args:
+            personas (iterable, optional): Personas a agregar
+        """
+        self._personas = {}            # id -> Persona
+        self._claves = {}              # id -> claves con las que se indexó
+        self._indice_edad = []         # [(edad, id)] ordenada
+        self._indice_generacion = {}   # generación -> {id: Persona}
+        self._indice_correo = {}       # correo normalizado -> Persona
+        self._correos_validos = set()  # ids con correo válido
+        self._cumpleanos = {}          # id -> 'DD/MM'
+        self._indice_cumpleanos = []   # [(mes, día, id)] ordenada
+
+        if personas is not None:
+            self.extender(personas)
+
+    # ---------- Altas y bajas ----------
+
+    def agregar(self, persona, cumpleanos=None):
+        """
+        Agrega una persona si su correo no está ya en la colección.
+
+        Args:
+            persona (Persona): Persona a agregar
+            cumpleanos (str, optional): Fecha de cumpleaños en formato 'DD/MM'
+
+        Returns:
+            bool: True si se agregó, False si el correo ya existía
+
+        Raises:
+            ValueError: Si no es una Persona o la fecha de cumpleaños no es válida
+        """
+        return self._indexar(persona, cumpleanos, ordenar=True)
+
+    def extender(self, personas, cumpleanos=None):
+        """
+        Agrega muchas personas de una vez.
+
+        En lugar de insertar cada una en su posición, los índices ordenados
+        se ordenan una sola vez al final (O(n log n) en total).
+
+        Args:
+            personas (iterable): Personas a agregar
+            cumpleanos (iterable, optional): Fecha 'DD/MM' (o None) de cada persona
+
+        Returns:
+            int: Número de personas agregadas (sin contar correos duplicados)
+
+        Raises:
+            ValueError: Si algún elemento no es una Persona o una fecha no es válida
+        """
+        if cumpleanos is None:
+            pares = ((persona, None) for persona in personas)
+        else:
+            pares = zip(personas, cumpleanos)
+
+        agregadas = 0
+        try:
+            for persona, fecha in pares:
+                agregadas += self._indexar(persona, fecha, ordenar=False)
+        finally:
+            self._indice_edad.sort()
+            self._indice_cumpleanos.sort()
+        return agregadas
+
+    def eliminar(self, persona):
+        """
+        Quita una persona de la colección.
+
+        Returns:
+            bool: True si la persona estaba en la colección
+        """
+        clave = id(persona)
+        if self._personas.get(clave) is not persona:
+            return False
+
+        edad, generacion, correo = self._claves.pop(clave)
+        del self._personas[clave]
+
+        posicion = bisect_left(self._indice_edad, (edad, clave))
+        del self._indice_edad[posicion]
+
+        por_generacion = self._indice_generacion[generacion]
+        del por_generacion[clave]
+        if not por_generacion:
+            del self._indice_generacion[generacion]
+
+        del self._indice_correo[correo]
+        self._correos_validos.discard(clave)
+
+        cumpleanos = self._cumpleanos.pop(clave, None)
+        if cumpleanos is not None:
+            dia, mes = self._validar_cumpleanos(cumpleanos)
+            posicion = bisect_left(self._indice_cumpleanos, (mes, dia, clave))
+            del self._indice_cumpleanos[posicion]
+        return True
+
+    def reindexar(self, persona):
+        """
+        Vuelve a indexar una persona cuya edad o correo cambió.
+
+        Returns:
+            bool: True si se reindexó; False si no estaba en la colección o
+                  su nuevo correo ya pertenece a otra persona (queda fuera)
+        """
+        cumpleanos = self._cumpleanos.get(id(persona))
+        if not self.eliminar(persona):
+            return False
+        return self.agregar(persona, cumpleanos)
+
+    # ---------- Consultas ----------
+
+    def por_rango_edad(self, edad_minima=None, edad_maxima=None):
+        """
+        Obtiene las personas con edad dentro de un rango (ambos incluidos).
+
+        Args:
+            edad_minima (int, optional): Edad mínima
+            edad_maxima (int, optional): Edad máxima
+
+        Returns:
+            list: Personas ordenadas por edad
+        """
+        inicio, fin = self._limites_edad(edad_minima, edad_maxima)
+        personas = self._personas
+        return [personas[clave] for _, clave in self._indice_edad[inicio:fin]]
+
+    def contar_rango_edad(self, edad_minima=None, edad_maxima=None):
+        """Cuenta las personas en un rango de edad en O(log n)."""
+        inicio, fin = self._limites_edad(edad_minima, edad_maxima)
+        return max(fin - inicio, 0)
+
+    def por_generacion(self, generacion):
+        """
+        Obtiene las personas de una generación.
+
+        Args:
+            generacion (str): Nombre de la generación (p. ej. "Millennial")
+
+        Returns:
+            list: Personas de la generación, en orden de inserción
+        """
+        return list(self._indice_generacion.get(generacion, {}).values())
+
+    def buscar_por_correo(self, correo):
+        """
+        Busca una persona por su correo (sin distinguir mayúsculas).
+
+        Returns:
+            Persona o None: La persona con ese correo
+        """
+        return self._indice_correo.get(normalizar_correo(correo))
+
+    def consultar(self, edad_minima=None, edad_maxima=None, generacion=None, correo_valido=None):
+        """
+        Consulta combinando rango de edad, generación y validez del correo.
+
+        Parte del índice con menos candidatos y filtra el resto de criterios
+        con búsquedas O(1) sobre los otros índices.
+
+        Args:
+            edad_minima (int, optional): Edad mínima (incluida)
+            edad_maxima (int, optional): Edad máxima (incluida)
+            generacion (str, optional): Generación
+            correo_valido (bool, optional): Filtrar por correo válido o inválido
+
+        Returns:
+            list: Personas que cumplen todos los criterios, ordenadas por edad
+        """
+        inicio, fin = self._limites_edad(edad_minima, edad_maxima)
+        candidatos = [(max(fin - inicio, 0), 'edad')]
+        if generacion is not None:
+            candidatos.append((len(self._indice_generacion.get(generacion, {})), 'generacion'))
+        if correo_valido:
+            candidatos.append((len(self._correos_validos), 'correo'))
+
+        origen = min(candidatos)[1]
+        if origen == 'generacion':
+            claves = self._indice_generacion.get(generacion, {}).keys()
+        elif origen == 'correo':
+            claves = self._correos_validos
+        else:
+            claves = [clave for _, clave in self._indice_edad[inicio:fin]]
+
+        resultado = []
+        for clave in claves:
+            edad, generacion_persona, _ = self._claves[clave]
+            if edad_minima is not None and edad < edad_minima:
+                continue
+            if edad_maxima is not None and edad > edad_maxima:
+                continue
+            if generacion is not None and generacion_persona != generacion:
+                continue
+            if correo_valido is not None and (clave in self._correos_validos) != correo_valido:
+                continue
+            resultado.append((edad, clave))
+
+        if origen != 'edad':
+            resultado.sort()
+        return [self._personas[clave] for _, clave in resultado]
+
+    def dias_hasta_cumpleanos(self, hoy=None):
+        """
+        Calcula los días hasta el próximo cumpleaños de toda la colección.
+
+        La cuenta se hace una sola vez por fecha distinta (a lo sumo 366).
+        No hace falta ordenar: recorrer el índice de cumpleaños empezando en
+        la fecha de hoy (y dando la vuelta al año) ya da los días en orden.
+
+        Args:
+            hoy (date, optional): Fecha de referencia (por defecto, hoy)
+
+        Returns:
+            list: Tuplas (persona, días) ordenadas por días; las fechas que no
+                  existen en el año que corresponde (29/02) quedan al final
+                  con días = None
+        """
+        hoy = hoy or date.today()
+        indice = self._indice_cumpleanos
+        corte = bisect_left(indice, (hoy.month, hoy.day))
+        personas = self._personas
+        dias_por_fecha = {}
+        resultado, sin_cuenta = [], []
+
+        for mes, dia, clave in chain(islice(indice, corte, None), islice(indice, corte)):
+            fecha = (mes, dia)
+            if fecha not in dias_por_fecha:
+                try:
+                    dias_por_fecha[fecha] = calcular_dias_hasta(f"{dia}/{mes}", hoy)
+                except ValueError:
+                    dias_por_fecha[fecha] = None
+            dias = dias_por_fecha[fecha]
+            if dias is None:
+                sin_cuenta.append((personas[clave], None))
+            else:
+                resultado.append((personas[clave], dias))
+
+        resultado.extend(sin_cuenta)
+        return resultado
+
+    def proximos_cumpleanos(self, dias, hoy=None):
+        """
+        Obtiene las personas que cumplen años en los próximos `dias` días.
+
+        Usa el índice ordenado por (mes, día): solo recorre las fechas dentro
+        de la ventana, que puede cruzar el fin de año.
+
+        Args:
+            dias (int): Tamaño de la ventana en días (0 = solo hoy)
+            hoy (date, optional): Fecha de referencia (por defecto, hoy)
+
+        Returns:
+            list: Tuplas (persona, días) ordenadas por días
+        """
+        hoy = hoy or date.today()
+        if dias < 0:
+            return []
+        fin = hoy + timedelta(days=min(dias, 365))
+
+        tramos = [((hoy.month, hoy.day), (fin.month, fin.day))]
+        if fin.year != hoy.year or dias >= 365:
+            tramos = [((hoy.month, hoy.day), (12, 31)), ((1, 1), (fin.month, fin.day))]
+
+        indice = self._indice_cumpleanos
+        resultado, vistos = [], set()
+        for (mes_desde, dia_desde), (mes_hasta, dia_hasta) in tramos:
+            inicio = bisect_left(indice, (mes_desde, dia_desde))
+            fin_tramo = bisect_right(indice, (mes_hasta, dia_hasta, float('inf')))
+            for mes, dia, clave in indice[inicio:fin_tramo]:
+                if clave in vistos:
+                    continue
+                try:
+                    faltan = calcular_dias_hasta(f"{dia}/{mes}", hoy)
+                except ValueError:
+                    continue
+                if faltan <= dias:
+                    vistos.add(clave)
+                    resultado.append((faltan, clave))
+
+        resultado.sort()
+        return [(self._personas[clave], faltan) for faltan, clave in resultado]
+
+    def ordenadas_por_edad(self):
+        """Recorre las personas de menor a mayor edad."""
+        personas = self._personas
+        for _, clave in self._indice_edad:
+            yield personas[clave]
+
+    def __len__(self):
+        """Número de personas en la colección."""
+        return len(self._personas)
+
+    def __iter__(self):
+        """Recorre las personas en orden de inserción."""
+        return iter(list(self._personas.values()))
+
+    def __contains__(self, persona):
+        """Indica si la instancia está en la colección."""
+        return self._personas.get(id(persona)) is persona
+
+    # ---------- Auxiliares ----------
+
+    def _indexar(self, persona, cumpleanos, ordenar):
+        """
+        Agrega una persona a todos los índices.
+
+        Con ordenar=False las entradas se añaden al final de los índices
+        ordenados y quien llama debe ordenarlos después.
+        """
+        if not isinstance(persona, Persona):
+            raise ValueError("Solo se pueden agregar instancias de Persona")
+
+        correo = normalizar_correo(persona.correo_electronico)
+        if correo in self._indice_correo:
+            return False
+
+        fecha = self._validar_cumpleanos(cumpleanos) if cumpleanos is not None else None
+        agregar_ordenado = insort if ordenar else list.append
+
+        clave = id(persona)
+        edad = persona.edad
+        generacion = persona.obtener_generacion()
+        self._personas[clave] = persona
+        self._claves[clave] = (edad, generacion, correo)
+
+        agregar_ordenado(self._indice_edad, (edad, clave))
+        self._indice_generacion.setdefault(generacion, {})[clave] = persona
+        self._indice_correo[correo] = persona
+        if persona.validar_correo():
+            self._correos_validos.add(clave)
+        if fecha is not None:
+            self._cumpleanos[clave] = cumpleanos
+            agregar_ordenado(self._indice_cumpleanos, (fecha[1], fecha[0], clave))
+        return True
+
+    def _limites_edad(self, edad_minima, edad_maxima):
+        """Posiciones [inicio, fin) del rango de edad en el índice ordenado."""
+        indice = self._indice_edad
+        inicio = 0 if edad_minima is None else bisect_left(indice, (edad_minima,))
+        fin = len(indice) if edad_maxima is None else bisect_left(indice, (edad_maxima + 1,))
+        return inicio, fin
+
+    @staticmethod
+    def _validar_cumpleanos(cumpleanos):
+        """
+        Valida una fecha 'DD/MM' (se acepta 29/02).
+
+        Returns:
+            tuple: (día, mes)
+
+        Raises:
+            ValueError: Si la fecha no es válida
+        """
+        try:
+            dia, mes = map(int, cumpleanos.split('/'))
+            date(2000, mes, dia)  # año bisiesto: acepta 29/02
+        except (AttributeError, TypeError, ValueError):
+            raise ValueError(f"La fecha de cumpleaños '{cumpleanos}' no es válida (use 'DD/MM')")
+        return dia, mes
@@ -0,0 +1,198 @@
+# Registro de personas con estadísticas en columnas
+# Guarda edades y validez de correo en arreglos tipados, referencia las
+# instancias con weakref y mantiene contadores para estadísticas O(1).
+
+import weakref
+from array import array
+from collections import Counter
+
+
+EDAD_MAYORIA = 18
+
+
+class RegistroPersonas:
+    """
+    Registro de las personas vivas con estadísticas incrementales.
+
+    Cada persona ocupa una posición (slot) en los arreglos de columnas.
+    Las instancias se referencian de forma débil: cuando una persona deja
+    de usarse y el recolector la libera, su slot queda libre para reutilizarse
+    y los contadores se actualizan, por lo que la memoria queda acotada por
+    el número de personas vivas.
+    """
+
+    def __init__(self):
+        """Inicializa un registro vacío."""
+        self._edades = array('l')
+        self._correo_valido = array('b')
+        self._referencias = []
+        self._slot_por_referencia = {}
+        self._al_liberar_ref = self._al_liberar  # evita crear el método ligado en cada alta
+        self._libres = []
+
+        # Contadores de las estadísticas globales
+        self._total = 0
+        self._suma_edades = 0
+        self._correos_validos = 0
+        self._mayores_edad = 0
+        self._conteo_edades = Counter()
+
+    def registrar(self, persona, edad, correo_valido):
+        """
+        Agrega una persona al registro.
+
+        Args:
+            persona (Persona): Instancia a registrar
+            edad (int): Edad de la persona
+            correo_valido (bool): Si su correo es válido
+
+        Returns:
+            int: Slot asignado a la persona
+        """
+        referencia = weakref.ref(persona, self._al_liberar_ref)
+        if self._libres:
+            slot = self._libres.pop()
+            self._referencias[slot] = referencia
+            self._edades[slot] = edad
+            self._correo_valido[slot] = bool(correo_valido)
+        else:
+            slot = len(self._referencias)
+            self._referencias.append(referencia)
+            self._edades.append(edad)
+            self._correo_valido.append(bool(correo_valido))
+        self._slot_por_referencia[id(referencia)] = slot
+
+        # Equivale a self._sumar(edad, correo_valido, 1), sin la rama de borrado
+        self._total += 1
+        self._suma_edades += edad
+        self._correos_validos += bool(correo_valido)
+        self._mayores_edad += edad >= EDAD_MAYORIA
+        self._conteo_edades[edad] += 1
+        return slot
+
+    def registrar_lote(self, personas, edades, correos_validos):
+        """
+        Agrega varias personas al registro de una vez.
+
+        Los contadores se actualizan una sola vez para todo el lote.
+
+        Args:
+            personas (list): Instancias a registrar
+            edades (list): Edad de cada persona
+            correos_validos (list): Validez del correo de cada persona
+
+        Returns:
+            list: Slots asignados, en el mismo orden
+        """
+        al_liberar = self._al_liberar_ref
+        referencias = [weakref.ref(persona, al_liberar) for persona in personas]
+        validos = [1 if valido else 0 for valido in correos_validos]
+
+        # Primero se reutilizan los slots libres, el resto va al final
+        reutilizados = min(len(self._libres), len(referencias))
+        slots = [self._libres.pop() for _ in range(reutilizados)]
+        for slot, referencia, edad, valido in zip(slots, referencias, edades, validos):
+            self._referencias[slot] = referencia
+            self._edades[slot] = edad
+            self._correo_valido[slot] = valido
+
+        inicio = len(self._referencias)
+        self._referencias.extend(referencias[reutilizados:])
+        self._edades.extend(edades[reutilizados:])
+        self._correo_valido.extend(validos[reutilizados:])
+        slots.extend(range(inicio, len(self._referencias)))
+
+        self._slot_por_referencia.update(zip(map(id, referencias), slots))
+
+        self._total += len(referencias)
+        self._suma_edades += sum(edades)
+        self._correos_validos += sum(validos)
+        self._mayores_edad += sum(1 for edad in edades if edad >= EDAD_MAYORIA)
+        self._conteo_edades.update(edades)
+        return slots
+
+    def actualizar(self, slot, edad=None, correo_valido=None):
+        """
+        Actualiza las columnas de una persona registrada.
+
+        Los valores nuevos se guardan en los arreglos antes de tocar los
+        contadores, así una edad que el arreglo rechaza no los descuadra.
+
+        Args:
+            slot (int): Slot de la persona
+            edad (int, optional): Nueva edad
+            correo_valido (bool, optional): Nueva validez del correo
+
+        Raises:
+            TypeError: Si la edad no es un entero
+        """
+        if self._referencias[slot] is None:
+            return
+
+        edad_anterior = self._edades[slot]
+        valido_anterior = bool(self._correo_valido[slot])
+        if edad is not None:
+            self._edades[slot] = edad
+        if correo_valido is not None:
+            self._correo_valido[slot] = bool(correo_valido)
+
+        self._sumar(edad_anterior, valido_anterior, -1)
+        self._sumar(self._edades[slot], bool(self._correo_valido[slot]), 1)
+
+    def estadisticas(self):
+        """
+        Obtiene las estadísticas globales a partir de los contadores.
+
+        Returns:
+            dict: Estadísticas generales (o un mensaje si no hay personas)
+        """
+        if not self._total:
+            return {"mensaje": "No hay personas registradas"}
+
+        return {
+            'total_personas': self._total,
+            'edad_promedio': self._suma_edades / self._total,
+            'edad_minima': min(self._conteo_edades),
+            'edad_maxima': max(self._conteo_edades),
+            'correos_validos': self._correos_validos,
+            'porcentaje_correos_validos': (self._correos_validos / self._total) * 100,
+            'mayores_de_edad': self._mayores_edad,
+            'porcentaje_mayores_edad': (self._mayores_edad / self._total) * 100
+        }
+
+    def __len__(self):
+        """Número de personas vivas registradas."""
+        return self._total
+
+    def __iter__(self):
+        """Recorre las personas vivas en orden de slot."""
+        for referencia in self._referencias:
+            persona = referencia() if referencia is not None else None
+            if persona is not None:
+                yield persona
+
+    def __contains__(self, persona):
+        """Indica si la instancia está registrada en este registro."""
+        slot = getattr(persona, '_slot_registro', None)
+        return (getattr(persona, '_registro', None) is self and slot is not None
+                and self._referencias[slot] is not None
+                and self._referencias[slot]() is persona)
+
+    def _sumar(self, edad, correo_valido, signo):
+        """Suma (signo=1) o resta (signo=-1) una persona de los contadores."""
+        self._total += signo
+        self._suma_edades += signo * edad
+        self._correos_validos += signo * bool(correo_valido)
+        self._mayores_edad += signo * (edad >= EDAD_MAYORIA)
+        self._conteo_edades[edad] += signo
+        if not self._conteo_edades[edad]:
+            del self._conteo_edades[edad]
+
+    def _al_liberar(self, referencia):
+        """Callback de weakref: libera el slot de una persona recolectada."""
+        slot = self._slot_por_referencia.pop(id(referencia), None)
+        if slot is None or self._referencias[slot] is not referencia:
+            return
+        self._sumar(self._edades[slot], bool(self._correo_valido[slot]), -1)
+        self._referencias[slot] = None
+        self._libres.append(slot)
@@ -5,7 +5,9 @@ import unittest
 import sys
 import os
 from io import StringIO
+from datetime import date
 from clase_persona import Persona
+from coleccion_personas import ColeccionPersonas
 
 
 class TestClasePersona(unittest.TestCase):
@@ -408,6 +410,251 @@ class TestCasosEspeciales(unittest.TestCase):
         self.assertFalse(persona.validar_correo())
 
 
+class TestRegistroPersonas(unittest.TestCase):
+    """
+    Tests para el registro de personas con estadísticas incrementales
+    """
+    
+    def setUp(self):
+        """Configuración inicial"""
+        Persona.contador_personas = 0
+        Persona.personas_creadas = []
+    
+    def test_estadisticas_siguen_actualizaciones(self):
+        """Test: Las estadísticas reflejan cambios de edad y correo"""
+        persona1 = Persona("Ana García", 17, "ana@email.com")
+        persona2 = Persona("Carlos Pérez", 30, "carlos@email.com")
+        
+        persona1.actualizar_datos(edad=20)
+        persona2.correo_electronico = "correo_invalido"
+        
+        stats = Persona.obtener_estadisticas_generales()
+        self.assertEqual(stats['mayores_de_edad'], 2)
+        self.assertEqual(stats['edad_minima'], 20)
+        self.assertAlmostEqual(stats['edad_promedio'], 25)
+        self.assertEqual(stats['correos_validos'], 1)
+        self.assertIn(persona1, Persona.personas_creadas)
+
+    def test_edad_invalida_no_altera_estadisticas(self):
+        """Test: Una edad rechazada deja la persona y los contadores intactos"""
+        persona = Persona("Ana García", 25, "ana@email.com")
+        Persona("Carlos Pérez", 30, "carlos@email.com")
+        antes = Persona.obtener_estadisticas_generales()
+
+        for edad in (30.5, "40", -1, 200):
+            with self.subTest(edad=edad):
+                with self.assertRaises(ValueError):
+                    persona.edad = edad
+                self.assertEqual(persona.edad, 25)
+                self.assertEqual(Persona.obtener_estadisticas_generales(), antes)
+
+        with self.assertRaises(TypeError):
+            Persona.personas_creadas.actualizar(persona._slot_registro, edad=30.5)
+        self.assertEqual(Persona.obtener_estadisticas_generales(), antes)
+
+        persona.edad = 40
+        self.assertEqual(Persona.obtener_estadisticas_generales()['edad_maxima'], 40)
+
+    def test_personas_liberadas_salen_del_registro(self):
+        """Test: El registro no mantiene vivas a las personas"""
+        import gc
+        persona1 = Persona("Ana García", 25, "ana@email.com")
+        persona2 = Persona("Carlos Pérez", 60, "carlos@email.com")
+        
+        del persona2
+        gc.collect()
+        
+        stats = Persona.obtener_estadisticas_generales()
+        self.assertEqual(stats['total_personas'], 1)
+        self.assertEqual(stats['edad_maxima'], 25)
+        self.assertEqual(list(Persona.personas_creadas), [persona1])
+        
+        # El slot liberado se reutiliza
+        persona3 = Persona("María López", 40, "maria@email.com")
+        self.assertEqual(persona3._slot_registro, 1)
+        self.assertEqual(Persona.obtener_estadisticas_generales()['total_personas'], 2)
+    
+    def test_registro_vacio(self):
+        """Test: Registro sin personas"""
+        import gc
+        Persona("Ana García", 25, "ana@email.com")
+        gc.collect()
+        
+        stats = Persona.obtener_estadisticas_generales()
+        self.assertIn("mensaje", stats)
+
+
+class TestCargaPorLote(unittest.TestCase):
+    """
+    Tests para la creación de personas en lote (Persona.desde_lote)
+    """
+    
+    def setUp(self):
+        """Configuración inicial"""
+        Persona.contador_personas = 0
+        Persona.personas_creadas = []
+    
+    def test_lote_equivale_a_from_dict(self):
+        """Test: desde_lote produce las mismas personas que from_dict"""
+        registros = [
+            {'nombre': '  ana   garcía lópez ', 'edad': 25, 'correo_electronico': 'ana@email.com'},
+            {'nombre': 'CARLOS\tpérez', 'edad': 17, 'correo_electronico': 'carlos@email.com'},
+            {'nombre': 'Ana×Beatriz', 'edad': 40, 'correo_electronico': 'ab@email.com'},
+        ]
+        esperadas = [Persona.from_dict(datos) for datos in registros]
+        
+        personas, rechazos = Persona.desde_lote(registros)
+        
+        self.assertEqual(rechazos, [])
+        self.assertEqual(personas, esperadas)
+        self.assertEqual([p.id_persona for p in personas], [4, 5, 6])
+        self.assertEqual(Persona.contador_personas, 6)
+        self.assertEqual(Persona.obtener_estadisticas_generales()['total_personas'], 6)
+    
+    def test_reporte_de_rechazos(self):
+        """Test: Los registros inválidos se reportan por campo sin detener la carga"""
+        registros = [
+            {'nombre': 'Ana García', 'edad': 25, 'correo_electronico': 'ana@email.com'},
+            {'nombre': 'Ana123', 'edad': -5, 'correo_electronico': 'ana@email.com'},
+            {'nombre': 'Carlos Pérez'},
+            {'nombre': 'María López', 'edad': 30, 'correo_electronico': 'maria..lopez@email.com'},
+        ]
+        
+        personas, rechazos = Persona.desde_lote(registros)
+        
+        self.assertEqual(len(personas), 1)
+        self.assertEqual([r['indice'] for r in rechazos], [1, 2, 3])
+        self.assertEqual(rechazos[0]['errores'], {
+            'nombre': "El nombre solo puede contener letras y espacios",
+            'edad': "La edad no puede ser negativa"
+        })
+        self.assertEqual(set(rechazos[1]['errores']), {'edad', 'correo_electronico'})
+        self.assertEqual(list(rechazos[2]['errores']), ['correo_electronico'])
+        self.assertIs(rechazos[2]['registro'], registros[3])
+    
+    def test_lote_y_constructor_aceptan_lo_mismo(self):
+        """Test: Valores con los separadores internos del lote se validan como en el constructor"""
+        registros = [
+            {'nombre': 'ana\x00luis', 'edad': 30, 'correo_electronico': 'ana@email.com'},
+            {'nombre': 'Pedro Gómez', 'edad': 40, 'correo_electronico': 'pedro@email.com'},
+            {'nombre': 'Luis Díaz', 'edad': 35, 'correo_electronico': 'a@b.com\nc@d.com'},
+            {'nombre': 'Eva Ruiz', 'edad': 28, 'correo_electronico': 'eva@email.com\n'},
+            {'nombre': 'Sol Vega', 'edad': 50, 'correo_electronico': 'sol@email.com'},
+        ]
+        aceptadas, indices_rechazados = [], []
+        for indice, datos in enumerate(registros):
+            try:
+                aceptadas.append(Persona.from_dict(datos))
+            except ValueError:
+                indices_rechazados.append(indice)
+        
+        personas, rechazos = Persona.desde_lote(registros)
+        
+        self.assertEqual(indices_rechazados, [0, 2])
+        self.assertEqual([r['indice'] for r in rechazos], indices_rechazados)
+        self.assertEqual(personas, aceptadas)
+    
+    def test_lote_grande_actualiza_estadisticas(self):
+        """Test: Un lote de varios bloques queda registrado y se libera"""
+        import gc
+        registros = [{'nombre': 'Persona Lote', 'edad': i % 100, 'correo_electronico': f'p{i}@email.com'}
+                     for i in range(3000)]
+        
+        personas, rechazos = Persona.desde_lote(registros)
+        stats = Persona.obtener_estadisticas_generales()
+        
+        self.assertEqual((len(personas), rechazos), (3000, []))
+        self.assertEqual(stats['total_personas'], 3000)
+        self.assertEqual(stats['mayores_de_edad'], sum(1 for i in range(3000) if i % 100 >= 18))
+        self.assertIn(personas[-1], Persona.personas_creadas)
+        
+        del personas[1000:]
+        gc.collect()
+        self.assertEqual(Persona.obtener_estadisticas_generales()['total_personas'], 1000)
+
+
+class TestColeccionPersonas(unittest.TestCase):
+    """
+    Tests para la colección indexada de personas
+    """
+    
+    def setUp(self):
+        """Configuración inicial"""
+        Persona.contador_personas = 0
+        Persona.personas_creadas = []
+        self.coleccion = ColeccionPersonas()
+        self.ana = Persona("Ana García", 25, "ana@email.com")
+        self.carlos = Persona("Carlos Pérez", 35, "carlos@email.com")
+        self.maria = Persona("María López", 40, "maria@email.com")
+        self.luis = Persona("Luis Torres", 70, "luis@email.com")
+        for persona, cumple in ((self.ana, "01/01"), (self.carlos, "30/12"),
+                                (self.maria, "29/02"), (self.luis, None)):
+            self.coleccion.agregar(persona, cumple)
+    
+    def test_rango_edad(self):
+        """Test: Consultas por rango de edad con extremos incluidos"""
+        self.assertEqual(self.coleccion.por_rango_edad(25, 40), [self.ana, self.carlos, self.maria])
+        self.assertEqual(self.coleccion.por_rango_edad(edad_minima=41), [self.luis])
+        self.assertEqual(self.coleccion.por_rango_edad(50, 60), [])
+        self.assertEqual(self.coleccion.contar_rango_edad(30, 40), 2)
+    
+    def test_correo_sin_duplicados(self):
+        """Test: El índice de correo evita duplicados sin distinguir mayúsculas"""
+        repetida = Persona("Ana Gómez", 30, "ANA@Email.com")
+        
+        self.assertFalse(self.coleccion.agregar(repetida))
+        self.assertEqual(len(self.coleccion), 4)
+        self.assertIs(self.coleccion.buscar_por_correo("Ana@EMAIL.com"), self.ana)
+    
+    def test_consulta_combinada(self):
+        """Test: Rango de edad + generación + correo válido"""
+        generacion = self.carlos.obtener_generacion()
+        esperadas = [p for p in (self.ana, self.carlos, self.maria, self.luis)
+                     if 30 <= p.edad <= 40 and p.obtener_generacion() == generacion]
+        
+        self.assertEqual(self.coleccion.consultar(30, 40, generacion, True), esperadas)
+        self.assertEqual(self.coleccion.por_generacion(self.luis.obtener_generacion()), [self.luis])
+        
+        self.carlos.correo_electronico = "correo_invalido"
+        self.coleccion.reindexar(self.carlos)
+        self.assertNotIn(self.carlos, self.coleccion.consultar(30, 40, correo_valido=True))
+        self.assertEqual(self.coleccion.consultar(correo_valido=False), [self.carlos])
+    
+    def test_reindexar_y_eliminar(self):
+        """Test: Los índices siguen los cambios de edad y las bajas"""
+        self.ana.edad = 50
+        self.coleccion.reindexar(self.ana)
+        self.assertEqual(self.coleccion.por_rango_edad(45, 55), [self.ana])
+        
+        self.assertTrue(self.coleccion.eliminar(self.ana))
+        self.assertFalse(self.coleccion.eliminar(self.ana))
+        self.assertNotIn(self.ana, self.coleccion)
+        self.assertIsNone(self.coleccion.buscar_por_correo("ana@email.com"))
+        self.assertEqual(self.coleccion.por_rango_edad(), [self.carlos, self.maria, self.luis])
+    
+    def test_dias_hasta_cumpleanos(self):
+        """Test: Días hasta el cumpleaños de toda la colección"""
+        hoy = date(2023, 12, 29)
+        
+        resultado = self.coleccion.dias_hasta_cumpleanos(hoy)
+        
+        # Igual que Persona.dias_hasta_cumpleanos: el 29/02 solo tiene cuenta
+        # de días si existe en el año de referencia
+        self.assertEqual(resultado, [(self.carlos, 1), (self.ana, 3), (self.maria, None)])
+        self.assertEqual(self.coleccion.dias_hasta_cumpleanos(date(2024, 1, 1)),
+                         [(self.ana, 0), (self.maria, 59), (self.carlos, 364)])
+        
+        self.assertEqual(self.coleccion.proximos_cumpleanos(5, hoy), [(self.carlos, 1), (self.ana, 3)])
+        self.assertEqual(self.coleccion.proximos_cumpleanos(0, date(2023, 12, 30)), [(self.carlos, 0)])
+        self.assertEqual(self.coleccion.proximos_cumpleanos(60, date(2024, 1, 1)),
+                         [(self.ana, 0), (self.maria, 59)])
+    
+    def test_cumpleanos_invalido(self):
+        """Test: Fecha de cumpleaños inválida"""
+        with self.assertRaises(ValueError):
+            self.coleccion.agregar(Persona("Pedro Ruiz", 20, "pedro@email.com"), "31/02")
+
+
 def ejecutar_tests():
     """
     Ejecuta todos los tests con reporte detallado
@@ -422,6 +669,9 @@ def ejecutar_tests():
     # Agregar clases de tests
     suite.addTests(loader.loadTestsFromTestCase(TestClasePersona))
     suite.addTests(loader.loadTestsFromTestCase(TestCasosEspeciales))
+    suite.addTests(loader.loadTestsFromTestCase(TestRegistroPersonas))
+    suite.addTests(loader.loadTestsFromTestCase(TestCargaPorLote))
+    suite.addTests(loader.loadTestsFromTestCase(TestColeccionPersonas))
     
     # Ejecutar tests
     runner = unittest.TextTestRunner(verbosity=2)
@@ -3,8 +3,267 @@
 
 import math
 import logging
+from collections import Counter, deque
 from datetime import datetime
-from typing import Union, Tuple, Optional
+from itertools import islice
+import time
+from typing import Dict, Iterable, List, Sequence, Union, Tuple, Optional
+
+from motor_expresiones import compilar_expresion, evaluar_lote
+from registro_asincrono import configurar_logger_asincrono, activar_nivel, vaciar_logs
+
+
+# ==================== OPERACIONES EN LOTE ====================
+# Cada núcleo recorre las columnas completas con comprensiones y devuelve
+# (resultados, fallas): None en las posiciones inválidas y, por cada una,
+# (indice, tipo de error, mensaje), con los mismos mensajes que realizar_operacion.
+
+MENSAJES_ERROR = {
+    '/': "No se puede dividir por cero",
+    '%': "No se puede calcular módulo con divisor cero",
+    '//': "No se puede hacer división entera por cero",
+    'sqrt': "No se puede calcular la raíz cuadrada de un número negativo",
+    'log': "No se puede calcular logaritmo de un número menor o igual a cero",
+}
+
+
+def _lote_suma(a, b):
+    """Suma elemento a elemento."""
+    return [x + y for x, y in zip(a, b)], []
+
+
+def _lote_resta(a, b):
+    """Resta elemento a elemento."""
+    return [x - y for x, y in zip(a, b)], []
+
+
+def _lote_multiplicacion(a, b):
+    """Multiplicación elemento a elemento."""
+    return [x * y for x, y in zip(a, b)], []
+
+
+def _lote_con_divisor(operacion, operador):
+    """Crea el núcleo de una operación que falla con divisor cero."""
+    mensaje = MENSAJES_ERROR[operador]
+    
+    def nucleo(a, b):
+        resultados = [operacion(x, y) if y != 0 else None for x, y in zip(a, b)]
+        fallas = [(i, ZeroDivisionError, mensaje) for i, y in enumerate(b) if y == 0]
+        return resultados, fallas
+    return nucleo
+
+
+def _lote_potencia(a, b):
+    """Potencia elemento a elemento con las restricciones de realizar_operacion."""
+    resultados, fallas = [], []
+    for i, (x, y) in enumerate(zip(a, b)):
+        if x == 0 and y < 0:
+            fallas.append((i, ZeroDivisionError, "No se puede elevar 0 a una potencia negativa"))
+            resultados.append(None)
+        elif x < 0 and not float(y).is_integer():
+            fallas.append((i, ValueError, "No se puede elevar un número negativo a una potencia decimal"))
+            resultados.append(None)
+        else:
+            try:
+                resultados.append(x ** y)
+            except OverflowError:
+                fallas.append((i, OverflowError, "El resultado es demasiado grande"))
+                resultados.append(None)
+    return resultados, fallas
+
+
+def _lote_raiz(a, b):
+    """Raíz cuadrada de cada elemento de `a`."""
+    mensaje = MENSAJES_ERROR['sqrt']
+    raiz = math.sqrt
+    # Misma condición que las fallas: un NaN se calcula y lo marca la validación final
+    resultados = [None if x < 0 else raiz(x) for x in a]
+    return resultados, [(i, ValueError, mensaje) for i, x in enumerate(a) if x < 0]
+
+
+def _lote_logaritmo(a, b):
+    """Logaritmo natural de cada elemento de `a`."""
+    mensaje = MENSAJES_ERROR['log']
+    log = math.log
+    resultados = [None if x <= 0 else log(x) for x in a]
+    return resultados, [(i, ValueError, mensaje) for i, x in enumerate(a) if x <= 0]
+
+
+OPERACIONES_LOTE = {
+    '+': _lote_suma,
+    '-': _lote_resta,
+    '*': _lote_multiplicacion,
+    '/': _lote_con_divisor(lambda x, y: x / y, '/'),
+    '%': _lote_con_divisor(lambda x, y: x % y, '%'),
+    '//': _lote_con_divisor(lambda x, y: x // y, '//'),
+    '^': _lote_potencia,
+    'sqrt': _lote_raiz,
+    'log': _lote_logaritmo,
+}
+
+
+def _resultados_no_finitos(resultados: List, hay_nulos: bool) -> List[Tuple[int, type, str]]:
+    """Detecta resultados infinitos (overflow) o NaN, como realizar_operacion."""
+    # Si la suma es finita no hay infinitos ni NaN: se evita revisar uno a uno
+    valores = [r for r in resultados if r is not None] if hay_nulos else resultados
+    try:
+        if math.isfinite(sum(valores)):
+            return []
+    except OverflowError:
+        pass  # algún entero no cabe en un flotante: se revisa uno a uno
+    
+    fallas = []
+    for i, r in enumerate(resultados):
+        if r is None:
+            continue
+        try:
+            if math.isinf(r):
+                raise OverflowError
+        except OverflowError:
+            fallas.append((i, OverflowError, "El resultado es demasiado grande"))
+            continue
+        if r != r:
+            fallas.append((i, ValueError, "El resultado no es un número válido"))
+    return fallas
+
+
+# ==================== HISTORIAL ====================
+
+LIMITE_HISTORIAL = 50
+
+# Marcas de cada operador en el texto de una operación, de la más específica
+# a la más general ('//' antes que '/', operadores con espacios antes que sin ellos)
+MARCAS_OPERADOR = (
+    ('√', 'sqrt'), ('sqrt(', 'sqrt'), ('ln(', 'log'), ('log(', 'log'),
+    (' // ', '//'), (' ^ ', '^'), (' % ', '%'), (' * ', '*'), (' / ', '/'),
+    (' + ', '+'), (' - ', '-'),
+    ('//', '//'), ('**', '^'), ('^', '^'), ('%', '%'), ('*', '*'), ('/', '/'),
+    ('+', '+'), ('-', '-'),
+)
+
+
+def extraer_operador(operacion: str) -> Optional[str]:
+    """
+    Obtiene el operador principal del texto de una operación.
+    
+    Args:
+        operacion (str): Texto de la operación (p. ej. "2 + 3 = 5.000000")
+        
+    Returns:
+        str o None: Operador encontrado
+    """
+    for marca, operador in MARCAS_OPERADOR:
+        if marca in operacion:
+            return operador
+    return None
+
+
+class HistorialOperaciones:
+    """
+    Historial de tamaño fijo con contadores de resumen.
+    
+    Las entradas viven en un deque con maxlen, así que agregar es O(1) y las
+    más antiguas se descartan solas. El conteo por operador se actualiza al
+    agregar y al descartar. La suma de resultados se calcula con math.fsum
+    sobre las entradas guardadas (como mucho `limite`): una suma acumulada
+    arrastraría errores de redondeo y quedaría en inf/nan para siempre tras
+    un desbordamiento.
+    """
+    
+    def __init__(self, entradas: Iterable[Dict] = (), limite: int = LIMITE_HISTORIAL):
+        """
+        Args:
+            entradas (iterable): Entradas iniciales (dicts con 'operacion' y 'resultado')
+            limite (int): Número máximo de entradas guardadas
+        """
+        self._entradas = deque(maxlen=limite)
+        self.conteo_operadores = Counter()
+        self.total_registradas = 0
+        for entrada in entradas:
+            self.agregar(entrada)
+    
+    def agregar(self, entrada: Dict):
+        """
+        Agrega una entrada, descartando la más antigua si se llegó al límite.
+        
+        Args:
+            entrada (dict): Entrada con 'operacion' y 'resultado' (y
+                            opcionalmente 'operador')
+        """
+        if entrada.get('operador') is None:
+            entrada['operador'] = extraer_operador(entrada['operacion'])
+        
+        if len(self._entradas) == self._entradas.maxlen:
+            self._descontar(self._entradas[0])
+        self._entradas.append(entrada)
+        
+        if entrada['operador'] is not None:
+            self.conteo_operadores[entrada['operador']] += 1
+        self.total_registradas += 1
+    
+    append = agregar
+    
+    def _descontar(self, entrada: Dict):
+        """Quita de los contadores una entrada que sale del historial."""
+        operador = entrada['operador']
+        if operador is not None:
+            self.conteo_operadores[operador] -= 1
+            if not self.conteo_operadores[operador]:
+                del self.conteo_operadores[operador]
+    
+    @property
+    def suma_resultados(self) -> float:
+        """Suma exacta (math.fsum) de los resultados guardados."""
+        resultados = [entrada['resultado'] for entrada in self._entradas]
+        try:
+            return math.fsum(resultados)
+        except (OverflowError, ValueError):
+            # Desbordamiento intermedio o inf + -inf: la suma común da inf o nan
+            return sum(resultados)
+    
+    def ultimas(self, n: int) -> List[Dict]:
+        """Devuelve las últimas `n` entradas, de la más antigua a la más reciente."""
+        n = min(n, len(self._entradas))
+        return list(islice(self._entradas, len(self._entradas) - n, None))
+    
+    def resumen(self) -> Dict:
+        """
+        Estadísticas de las entradas guardadas.
+        
+        Returns:
+            dict: Total, promedio, máximo y mínimo de los resultados y
+                  conteo por operador (vacío si no hay entradas)
+        """
+        if not self._entradas:
+            return {}
+        resultados = [entrada['resultado'] for entrada in self._entradas]
+        return {
+            'total': len(self._entradas),
+            'promedio': self.suma_resultados / len(self._entradas),
+            'maximo': max(resultados),
+            'minimo': min(resultados),
+            'operadores': dict(self.conteo_operadores.most_common()),
+        }
+    
+    def clear(self):
+        """Vacía el historial y sus contadores."""
+        self._entradas.clear()
+        self.conteo_operadores.clear()
+        self.total_registradas = 0
+    
+    def __len__(self):
+        return len(self._entradas)
+    
+    def __iter__(self):
+        return iter(self._entradas)
+    
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return list(self._entradas)[indice]
+        return self._entradas[indice]
+    
+    def __repr__(self):
+        return f"HistorialOperaciones({len(self)}/{self._entradas.maxlen} entradas)"
 
 
 class CalculadoraAvanzada:
@@ -14,21 +273,39 @@ class CalculadoraAvanzada:
     
     def __init__(self):
         """Inicializa la calculadora con configuración de logging y historial."""
-        self.historial = []
+        self.historial = HistorialOperaciones()
         self.configurar_logging()
         self.operadores_validos = {'+', '-', '*', '/', '^', '%', '//', 'sqrt', 'log'}
     
+    @property
+    def historial(self) -> HistorialOperaciones:
+        """Historial de las últimas operaciones."""
+        return self._historial
+    
+    @historial.setter
+    def historial(self, entradas: Iterable[Dict]):
+        if not isinstance(entradas, HistorialOperaciones):
+            entradas = HistorialOperaciones(entradas)
+        self._historial = entradas
+    
     def configurar_logging(self):
-        """Configura el sistema de logging para registrar operaciones y errores."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('calculadora.log'),
-                logging.StreamHandler()
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
+        """
+        Configura el sistema de logging para registrar operaciones y errores.
+        
+        Las operaciones solo encolan sus registros; un hilo de fondo los
+        escribe en 'calculadora.log' por lotes y en consola.
+        """
+        self.logger = configurar_logger_asincrono(__name__)
+    
+    def activar_log(self, nivel: int, activo: bool = True):
+        """
+        Activa o silencia un nivel de log (logging.INFO, logging.ERROR, ...).
+        
+        Args:
+            nivel (int): Nivel a cambiar
+            activo (bool): True para registrarlo, False para silenciarlo
+        """
+        activar_nivel(self.logger, nivel, activo)
     
     def solicitar_numero(self, mensaje: str) -> float:
         """
@@ -65,7 +342,7 @@ class CalculadoraAvanzada:
                 if math.isnan(numero):
                     raise ValueError("Entrada inválida (NaN)")
                 
-                self.logger.info(f"Número válido ingresado: {numero}")
+                self.logger.info("Número válido ingresado: %s", numero)
                 return numero
                 
             except ValueError as e:
@@ -115,7 +392,7 @@ class CalculadoraAvanzada:
                     operadores_str = ', '.join(sorted(self.operadores_validos))
                     raise ValueError(f"Operador '{operador}' no válido. Usa: {operadores_str}")
                 
-                self.logger.info(f"Operador válido seleccionado: {operador}")
+                self.logger.info("Operador válido seleccionado: %s", operador)
                 return operador
                 
             except ValueError as e:
@@ -161,7 +438,10 @@ class CalculadoraAvanzada:
                     raise ZeroDivisionError("No se puede elevar 0 a una potencia negativa")
                 if num1 < 0 and not num2.is_integer():
                     raise ValueError("No se puede elevar un número negativo a una potencia decimal")
-                resultado = num1 ** num2
+                try:
+                    resultado = num1 ** num2
+                except OverflowError:
+                    raise OverflowError("El resultado es demasiado grande")
                 
             elif operador == "%":
                 if num2 == 0:
@@ -189,13 +469,67 @@ class CalculadoraAvanzada:
             if math.isnan(resultado):
                 raise ValueError("El resultado no es un número válido")
             
-            self.logger.info(f"Operación exitosa: {num1} {operador} {num2} = {resultado}")
+            self.logger.info("Operación exitosa: %s %s %s = %s", num1, operador, num2, resultado)
             return resultado
             
         except (ZeroDivisionError, ValueError, OverflowError) as e:
-            self.logger.error(f"Error en operación: {num1} {operador} {num2} - {e}")
+            self.logger.error("Error en operación: %s %s %s - %s", num1, operador, num2, e)
             raise
     
+    def realizar_operacion_lote(self, a: Sequence[float], b: Optional[Sequence[float]],
+                                operador: str) -> Dict:
+        """
+        Aplica una operación a columnas completas de operandos.
+        
+        Usa una tabla de despacho con un núcleo por operador. Los errores no
+        se lanzan: cada posición inválida queda marcada en la máscara y
+        descrita en el reporte, con los mismos tipos y mensajes que
+        realizar_operacion (división por cero, raíz/log de negativos,
+        overflow). Se registra una sola línea de log por lote.
+        
+        Args:
+            a (sequence): Primeros operandos
+            b (sequence): Segundos operandos (ignorado en sqrt y log; puede ser None)
+            operador (str): Operador matemático
+            
+        Returns:
+            dict: 'resultados' (None en posiciones inválidas), 'validos'
+                  (máscara de booleanos) y 'errores' (lista de dicts con
+                  'indice', 'tipo' y 'mensaje', ordenada por índice)
+            
+        Raises:
+            ValueError: Si el operador no es válido o las columnas no tienen el mismo largo
+        """
+        nucleo = OPERACIONES_LOTE.get(operador)
+        if nucleo is None:
+            operadores_str = ', '.join(sorted(self.operadores_validos))
+            raise ValueError(f"Operador '{operador}' no válido. Usa: {operadores_str}")
+        
+        a = list(a)
+        if operador in ('sqrt', 'log'):
+            b = None
+        else:
+            b = list(b)
+            if len(a) != len(b):
+                raise ValueError("Los operandos deben tener la misma cantidad de valores")
+        
+        resultados, fallas = nucleo(a, b)
+        fallas.extend(_resultados_no_finitos(resultados, bool(fallas)))
+        
+        validos = [True] * len(resultados)
+        errores = []
+        for i, tipo, mensaje in sorted(fallas, key=lambda falla: falla[0]):
+            if validos[i]:
+                validos[i] = False
+                resultados[i] = None
+                errores.append({'indice': i, 'tipo': tipo.__name__, 'mensaje': mensaje})
+        
+        if errores:
+            self.logger.warning("Lote %s: %d operaciones, %d con error", operador, len(resultados), len(errores))
+        else:
+            self.logger.info("Lote %s: %d operaciones exitosas", operador, len(resultados))
+        return {'resultados': resultados, 'validos': validos, 'errores': errores}
+    
     def formatear_resultado(self, num1: float, num2: float, operador: str, resultado: float) -> str:
         """
         Formatea el resultado de manera amigable.
@@ -216,24 +550,22 @@ class CalculadoraAvanzada:
         else:
             return f"{num1} {operador} {num2} = {resultado:.6f}"
     
-    def agregar_al_historial(self, operacion: str, resultado: float):
+    def agregar_al_historial(self, operacion: str, resultado: float, operador: Optional[str] = None):
         """
-        Agrega una operación al historial.
+        Agrega una operación al historial (guarda las últimas 50).
         
         Args:
             operacion (str): Descripción de la operación
             resultado (float): Resultado obtenido
+            operador (str, optional): Operador usado; si no se indica se
+                                      obtiene del texto de la operación
         """
-        entrada_historial = {
+        self.historial.agregar({
             'timestamp': datetime.now(),
             'operacion': operacion,
-            'resultado': resultado
-        }
-        self.historial.append(entrada_historial)
-        
-        # Limitar historial a últimas 50 operaciones
-        if len(self.historial) > 50:
-            self.historial.pop(0)
+            'resultado': resultado,
+            'operador': operador
+        })
     
     def mostrar_historial(self):
         """Muestra el historial de operaciones."""
@@ -244,7 +576,7 @@ class CalculadoraAvanzada:
         print(f"\n📋 HISTORIAL DE OPERACIONES ({len(self.historial)} entradas)")
         print("=" * 60)
         
-        for i, entrada in enumerate(self.historial[-10:], 1):  # Últimas 10
+        for i, entrada in enumerate(self.historial.ultimas(10), 1):
             timestamp = entrada['timestamp'].strftime("%H:%M:%S")
             print(f"{i:2d}. [{timestamp}] {entrada['operacion']} = {entrada['resultado']:.6f}")
     
@@ -281,19 +613,19 @@ class CalculadoraAvanzada:
             print(f"   {operacion_str}")
             
             # Agregar al historial
-            self.agregar_al_historial(operacion_str, resultado)
+            self.agregar_al_historial(operacion_str, resultado, operador)
             
         except ValueError as ve:
             print(f"\n❌ Error de valor: {ve}")
-            self.logger.error(f"ValueError: {ve}")
+            self.logger.error("ValueError: %s", ve)
             
         except ZeroDivisionError as zde:
             print(f"\n❌ Error de división: {zde}")
-            self.logger.error(f"ZeroDivisionError: {zde}")
+            self.logger.error("ZeroDivisionError: %s", zde)
             
         except OverflowError as oe:
             print(f"\n❌ Error de overflow: {oe}")
-            self.logger.error(f"OverflowError: {oe}")
+            self.logger.error("OverflowError: %s", oe)
             
         except KeyboardInterrupt:
             print(f"\n⏹️ Operación cancelada por el usuario")
@@ -301,7 +633,7 @@ class CalculadoraAvanzada:
             
         except Exception as e:
             print(f"\n❌ Error inesperado: {e}")
-            self.logger.error(f"Error inesperado: {e}")
+            self.logger.error("Error inesperado: %s", e)
             
         finally:
             print("\n🔚 Operación finalizada.")
@@ -350,6 +682,7 @@ class CalculadoraAvanzada:
                             print("\n👋 ¡Gracias por usar la calculadora!")
                             print(f"📊 Total de operaciones realizadas: {operacion_numero}")
                             if self.historial:
+                                vaciar_logs()
                                 print("📋 Tu historial se ha guardado en 'calculadora.log'")
                             return
                         else:
@@ -365,9 +698,53 @@ class CalculadoraAvanzada:
                 return
             except Exception as e:
                 print(f"\n❌ Error crítico: {e}")
-                self.logger.critical(f"Error crítico en calculadora_con_repeticion: {e}")
+                self.logger.critical("Error crítico en calculadora_con_repeticion: %s", e)
                 continue
     
+    def evaluar_expresion(self, expresion: str, **variables: float) -> float:
+        """
+        Evalúa una expresión matemática de forma segura (sin eval).
+        
+        La expresión se valida contra una lista blanca de elementos y se
+        compila una sola vez; las compilaciones quedan en caché.
+        
+        Args:
+            expresion (str): Expresión con + - * / ^ % //, sqrt() y log()
+            **variables: Valores de las variables usadas en la expresión
+            
+        Returns:
+            float: Resultado de la expresión
+            
+        Raises:
+            SyntaxError: Si la sintaxis no es válida
+            ValueError: Para elementos no permitidos u operaciones inválidas
+            ZeroDivisionError: Para divisiones por cero
+            OverflowError: Para resultados demasiado grandes
+        """
+        try:
+            resultado = compilar_expresion(expresion).evaluar(**variables)
+            self.logger.info("Expresión evaluada: %s = %s", expresion, resultado)
+            return resultado
+        except (SyntaxError, ZeroDivisionError, ValueError, OverflowError) as e:
+            self.logger.error("Error en expresión: %s - %s", expresion, e)
+            raise
+    
+    def evaluar_lote(self, expresion: str, variables: Dict[str, Sequence[float]]) -> Dict:
+        """
+        Evalúa una expresión sobre columnas de valores (una fila por posición).
+        
+        Args:
+            expresion (str): Expresión a evaluar
+            variables (dict): Nombre de variable -> lista de valores
+            
+        Returns:
+            dict: 'resultados', 'validos' (máscara) y 'errores' por fila
+        """
+        reporte = evaluar_lote(expresion, variables)
+        if reporte['errores']:
+            self.logger.warning("Lote '%s': %d filas con error", expresion, len(reporte['errores']))
+        return reporte
+    
     def modo_evaluacion_expresiones(self):
         """
         Modo avanzado que permite evaluar expresiones matemáticas completas.
@@ -375,8 +752,8 @@ class CalculadoraAvanzada:
         print("🧠 MODO EVALUACIÓN DE EXPRESIONES")
         print("=" * 40)
         print("Evalúa expresiones matemáticas completas")
-        print("Ejemplo: 2 + 3 * 4, (5 + 3) / 2, etc.")
-        print("⚠️ ADVERTENCIA: Solo usa expresiones matemáticas simples")
+        print("Ejemplo: 2 + 3 * 4, (5 + 3) / 2, 2 ^ 10, sqrt(16) + log(e)")
+        print("🔒 Solo se aceptan números, paréntesis, + - * / ^ % //, sqrt() y log()")
         
         while True:
             try:
@@ -389,22 +766,17 @@ class CalculadoraAvanzada:
                     print("❌ Debes ingresar una expresión")
                     continue
                 
-                # Validar caracteres permitidos (solo números, operadores y paréntesis)
-                caracteres_permitidos = set("0123456789+-*/()%. ")
-                if not all(c in caracteres_permitidos for c in expresion):
-                    raise ValueError("La expresión contiene caracteres no permitidos")
-                
-                # Evaluar la expresión
-                resultado = eval(expresion)
+                # Evaluar la expresión (validada y compilada, sin eval)
+                resultado = self.evaluar_expresion(expresion)
                 
                 print(f"✅ {expresion} = {resultado:.6f}")
                 self.agregar_al_historial(expresion, resultado)
                 
-            except ZeroDivisionError:
-                print("❌ Error: División por cero en la expresión")
+            except ZeroDivisionError as e:
+                print(f"❌ Error: División por cero en la expresión ({e})")
             except SyntaxError:
                 print("❌ Error: Sintaxis inválida en la expresión")
-            except ValueError as e:
+            except (ValueError, OverflowError) as e:
                 print(f"❌ Error: {e}")
             except Exception as e:
                 print(f"❌ Error al evaluar: {e}")
@@ -418,29 +790,17 @@ class CalculadoraAvanzada:
         print(f"\n📊 ESTADÍSTICAS DE USO")
         print("=" * 30)
         
-        # Contar operadores usados
-        operadores_count = {}
-        resultados = []
-        
-        for entrada in self.historial:
-            operacion = entrada['operacion']
-            resultado = entrada['resultado']
-            resultados.append(resultado)
-            
-            # Extraer operador (simplificado)
-            for op in self.operadores_validos:
-                if op in operacion:
-                    operadores_count[op] = operadores_count.get(op, 0) + 1
-                    break
+        # Los contadores se mantienen al agregar al historial
+        resumen = self.historial.resumen()
         
-        print(f"📈 Total de operaciones: {len(self.historial)}")
-        print(f"📊 Promedio de resultados: {sum(resultados)/len(resultados):.2f}")
-        print(f"🔝 Resultado máximo: {max(resultados):.2f}")
-        print(f"🔻 Resultado mínimo: {min(resultados):.2f}")
+        print(f"📈 Total de operaciones: {resumen['total']}")
+        print(f"📊 Promedio de resultados: {resumen['promedio']:.2f}")
+        print(f"🔝 Resultado máximo: {resumen['maximo']:.2f}")
+        print(f"🔻 Resultado mínimo: {resumen['minimo']:.2f}")
         
-        if operadores_count:
+        if resumen['operadores']:
             print(f"\n🔢 Operadores más usados:")
-            for op, count in sorted(operadores_count.items(), key=lambda x: x[1], reverse=True):
+            for op, count in resumen['operadores'].items():
                 print(f"   {op}: {count} veces")
 
 
@@ -487,6 +847,49 @@ def demo_manejo_excepciones():
             print(f"   ❌ Error: {e}")
 
 
+def comparar_rendimiento_lote(n: int = 100_000, operador: str = "/") -> Dict[str, float]:
+    """
+    Compara realizar_operacion_lote contra un bucle de realizar_operacion.
+    
+    El bucle escalar se mide con el log desactivado para comparar solo el
+    cálculo y la validación.
+    
+    Args:
+        n (int): Cantidad de pares de operandos
+        operador (str): Operador a comparar
+        
+    Returns:
+        dict: Segundos de cada versión y la aceleración obtenida
+    """
+    calc = CalculadoraAvanzada()
+    a = [float(i % 1000) - 100 for i in range(n)]
+    b = [float(i % 17) for i in range(n)]
+    
+    inicio = time.perf_counter()
+    calc.realizar_operacion_lote(a, b, operador)
+    tiempo_lote = time.perf_counter() - inicio
+    
+    nivel_anterior = calc.logger.level
+    calc.logger.setLevel(logging.CRITICAL)
+    try:
+        inicio = time.perf_counter()
+        for x, y in zip(a, b):
+            try:
+                calc.realizar_operacion(x, y, operador)
+            except (ZeroDivisionError, ValueError, OverflowError):
+                pass
+        tiempo_escalar = time.perf_counter() - inicio
+    finally:
+        calc.logger.setLevel(nivel_anterior)
+    
+    return {
+        'operaciones': n,
+        'segundos_lote': tiempo_lote,
+        'segundos_escalar': tiempo_escalar,
+        'aceleracion': tiempo_escalar / tiempo_lote if tiempo_lote > 0 else float('inf')
+    }
+
+
 def menu_principal():
     """
     Menú principal de la calculadora con todas las opciones.
@@ -516,6 +919,7 @@ def menu_principal():
             if opcion == "0":
                 print("\n👋 ¡Gracias por usar la calculadora avanzada!")
                 if calc.historial:
+                    vaciar_logs()
                     print("📋 Tu historial se guardó automáticamente")
                 break
                 
@@ -0,0 +1,296 @@
+# Motor de expresiones seguro para la calculadora
+# Analiza la expresión con `ast`, acepta solo una lista blanca de nodos y la
+# compila una vez a una función de Python; las compilaciones se guardan en
+# una caché LRU indexada por el texto de la expresión.
+
+import ast
+import math
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple, Union
+
+
+Numero = Union[int, float]
+
+LONGITUD_MAXIMA = 500
+TAMANO_CACHE = 256
+
+CONSTANTES = {'pi': math.pi, 'e': math.e}
+
+
+# ---------- Operaciones con las validaciones de realizar_operacion ----------
+
+def _dividir(num1: Numero, num2: Numero) -> float:
+    """División con validación de divisor cero."""
+    if num2 == 0:
+        raise ZeroDivisionError("No se puede dividir por cero")
+    return num1 / num2
+
+
+def _modulo(num1: Numero, num2: Numero) -> Numero:
+    """Módulo con validación de divisor cero."""
+    if num2 == 0:
+        raise ZeroDivisionError("No se puede calcular módulo con divisor cero")
+    return num1 % num2
+
+
+def _division_entera(num1: Numero, num2: Numero) -> Numero:
+    """División entera con validación de divisor cero."""
+    if num2 == 0:
+        raise ZeroDivisionError("No se puede hacer división entera por cero")
+    return num1 // num2
+
+
+def _potencia(num1: Numero, num2: Numero) -> float:
+    """Potencia con las restricciones de la calculadora (en flotante)."""
+    if num1 == 0 and num2 < 0:
+        raise ZeroDivisionError("No se puede elevar 0 a una potencia negativa")
+    if num1 < 0 and not float(num2).is_integer():
+        raise ValueError("No se puede elevar un número negativo a una potencia decimal")
+    try:
+        # En flotante para no construir enteros gigantes (9 ^ 9 ^ 9)
+        return float(num1) ** num2
+    except OverflowError:
+        raise OverflowError("El resultado es demasiado grande")
+
+
+def _raiz(num: Numero) -> float:
+    """Raíz cuadrada de números no negativos."""
+    if num < 0:
+        raise ValueError("No se puede calcular la raíz cuadrada de un número negativo")
+    return math.sqrt(num)
+
+
+def _logaritmo(num: Numero) -> float:
+    """Logaritmo natural de números positivos."""
+    if num <= 0:
+        raise ValueError("No se puede calcular logaritmo de un número menor o igual a cero")
+    return math.log(num)
+
+
+def _verificar(resultado: Numero) -> Numero:
+    """Rechaza resultados infinitos o NaN."""
+    if isinstance(resultado, float):
+        if math.isinf(resultado):
+            raise OverflowError("El resultado es demasiado grande")
+        if math.isnan(resultado):
+            raise ValueError("El resultado no es un número válido")
+    return resultado
+
+
+OPERADORES_AUXILIARES = {
+    ast.Div: '_dividir',
+    ast.Mod: '_modulo',
+    ast.FloorDiv: '_division_entera',
+    ast.Pow: '_potencia',
+}
+OPERADORES_NATIVOS = (ast.Add, ast.Sub, ast.Mult)
+FUNCIONES = {'sqrt': '_raiz', 'log': '_logaritmo'}
+
+ENTORNO = {
+    '__builtins__': {},
+    '_dividir': _dividir,
+    '_modulo': _modulo,
+    '_division_entera': _division_entera,
+    '_potencia': _potencia,
+    '_raiz': _raiz,
+    '_logaritmo': _logaritmo,
+    '_verificar': _verificar,
+}
+
+
+class _Traductor(ast.NodeTransformer):
+    """
+    Recorre el árbol de la expresión aceptando solo nodos permitidos.
+
+    Las operaciones que pueden fallar se reemplazan por llamadas a las
+    funciones auxiliares; las variables se anotan en orden de aparición.
+    """
+
+    def __init__(self):
+        self.variables: List[str] = []
+
+    def generic_visit(self, nodo):
+        raise ValueError(f"Elemento no permitido en la expresión: {type(nodo).__name__}")
+
+    def visit_Expression(self, nodo):
+        nodo.body = self.visit(nodo.body)
+        return nodo
+
+    def visit_Constant(self, nodo):
+        if isinstance(nodo.value, bool) or not isinstance(nodo.value, (int, float)):
+            raise ValueError(f"Valor no permitido en la expresión: {nodo.value!r}")
+        return nodo
+
+    def visit_Name(self, nodo):
+        if nodo.id in CONSTANTES:
+            return ast.copy_location(ast.Constant(CONSTANTES[nodo.id]), nodo)
+        if nodo.id in FUNCIONES or nodo.id.startswith('_'):
+            raise ValueError(f"Nombre no permitido en la expresión: '{nodo.id}'")
+        if nodo.id not in self.variables:
+            self.variables.append(nodo.id)
+        return ast.copy_location(ast.Name(id=nodo.id, ctx=ast.Load()), nodo)
+
+    def visit_UnaryOp(self, nodo):
+        if not isinstance(nodo.op, (ast.UAdd, ast.USub)):
+            raise ValueError(f"Operador no permitido: {type(nodo.op).__name__}")
+        nodo.operand = self.visit(nodo.operand)
+        return nodo
+
+    def visit_BinOp(self, nodo):
+        izquierda, derecha = self.visit(nodo.left), self.visit(nodo.right)
+        if isinstance(nodo.op, OPERADORES_NATIVOS):
+            nodo.left, nodo.right = izquierda, derecha
+            return nodo
+        auxiliar = OPERADORES_AUXILIARES.get(type(nodo.op))
+        if auxiliar is None:
+            raise ValueError(f"Operador no permitido: {type(nodo.op).__name__}")
+        return ast.copy_location(self._llamar(auxiliar, izquierda, derecha), nodo)
+
+    def visit_Call(self, nodo):
+        nombre = nodo.func.id if isinstance(nodo.func, ast.Name) else None
+        if nombre not in FUNCIONES:
+            raise ValueError(f"Función no permitida: {nombre or ast.unparse(nodo.func)}")
+        if len(nodo.args) != 1 or nodo.keywords:
+            raise ValueError(f"La función '{nombre}' recibe exactamente un argumento")
+        return ast.copy_location(self._llamar(FUNCIONES[nombre], self.visit(nodo.args[0])), nodo)
+
+    @staticmethod
+    def _llamar(funcion: str, *argumentos):
+        return ast.Call(func=ast.Name(id=funcion, ctx=ast.Load()), args=list(argumentos), keywords=[])
+
+
+class ExpresionCompilada:
+    """
+    Expresión validada y compilada a una función de Python.
+
+    Attributes:
+        texto (str): Expresión original
+        variables (tuple): Variables libres, en orden de aparición
+        funcion (callable): Recibe los valores de las variables en ese orden
+    """
+
+    def __init__(self, texto: str, variables: Tuple[str, ...], funcion):
+        self.texto = texto
+        self.variables = variables
+        self.funcion = funcion
+
+    def evaluar(self, **valores: Numero) -> Numero:
+        """
+        Evalúa la expresión con los valores dados.
+
+        Raises:
+            ValueError: Si falta una variable o el resultado no es válido
+            ZeroDivisionError: Para divisiones por cero
+            OverflowError: Para resultados demasiado grandes
+        """
+        faltantes = [nombre for nombre in self.variables if nombre not in valores]
+        if faltantes:
+            raise ValueError(f"Faltan valores para: {', '.join(faltantes)}")
+        return self.funcion(*(valores[nombre] for nombre in self.variables))
+
+    def __repr__(self):
+        return f"ExpresionCompilada({self.texto!r})"
+
+
+@lru_cache(maxsize=TAMANO_CACHE)
+def compilar_expresion(expresion: str) -> ExpresionCompilada:
+    """
+    Valida y compila una expresión (con caché LRU por texto).
+
+    Se aceptan números, variables, las constantes pi y e, paréntesis, los
+    operadores + - * / ^ (o **) % // y las funciones sqrt() y log().
+
+    Args:
+        expresion (str): Expresión a compilar
+
+    Returns:
+        ExpresionCompilada: Expresión lista para evaluar
+
+    Raises:
+        SyntaxError: Si la expresión no es sintácticamente válida
+        ValueError: Si está vacía, es demasiado larga o usa elementos no permitidos
+    """
+    texto = expresion.strip()
+    if not texto:
+        raise ValueError("Debes ingresar una expresión")
+    if len(texto) > LONGITUD_MAXIMA:
+        raise ValueError(f"La expresión no puede tener más de {LONGITUD_MAXIMA} caracteres")
+
+    # '^' es potencia, como en realizar_operacion; como '**' conserva la
+    # precedencia y la asociatividad matemáticas (2 * 3 ^ 2 = 18)
+    arbol = ast.parse(texto.replace('^', '**'), mode='eval')
+    traductor = _Traductor()
+    arbol = traductor.visit(arbol)
+
+    # lambda <variables>: _verificar(<expresión>)
+    funcion = ast.Expression(body=ast.Lambda(
+        args=ast.arguments(posonlyargs=[], args=[ast.arg(arg=nombre) for nombre in traductor.variables],
+                           kwonlyargs=[], kw_defaults=[], defaults=[]),
+        body=_Traductor._llamar('_verificar', arbol.body)
+    ))
+    codigo = compile(ast.fix_missing_locations(funcion), '<expresion>', 'eval')
+    return ExpresionCompilada(texto, tuple(traductor.variables), eval(codigo, dict(ENTORNO)))
+
+
+def evaluar_expresion(expresion: str, **valores: Numero) -> Numero:
+    """
+    Evalúa una expresión de forma segura.
+
+    Args:
+        expresion (str): Expresión a evaluar
+        **valores: Valores de las variables de la expresión
+
+    Returns:
+        int o float: Resultado
+
+    Raises:
+        SyntaxError, ValueError, ZeroDivisionError, OverflowError
+    """
+    return compilar_expresion(expresion).evaluar(**valores)
+
+
+def evaluar_lote(expresion: str, variables: Dict[str, Sequence[Numero]]) -> Dict:
+    """
+    Evalúa una expresión sobre columnas de valores, fila por fila.
+
+    La expresión se compila una sola vez; los errores de cada fila no
+    interrumpen el lote y quedan en el reporte.
+
+    Args:
+        expresion (str): Expresión a evaluar
+        variables (dict): Nombre de variable -> secuencia de valores
+                          (todas del mismo largo)
+
+    Returns:
+        dict: 'resultados' (None en las filas con error), 'validos'
+              (máscara de filas correctas) y 'errores' (lista de dicts
+              con 'indice', 'tipo' y 'mensaje')
+
+    Raises:
+        SyntaxError: Si la expresión no es sintácticamente válida
+        ValueError: Si la expresión no es válida, falta una variable o las
+                    columnas tienen distinto largo
+    """
+    compilada = compilar_expresion(expresion)
+    faltantes = [nombre for nombre in compilada.variables if nombre not in variables]
+    if faltantes:
+        raise ValueError(f"Faltan valores para: {', '.join(faltantes)}")
+
+    columnas = [variables[nombre] for nombre in compilada.variables]
+    largos = {len(columna) for columna in columnas}
+    if len(largos) > 1:
+        raise ValueError("Todas las variables deben tener la misma cantidad de valores")
+    filas = largos.pop() if largos else 1
+
+    funcion = compilada.funcion
+    resultados: List = [None] * filas
+    validos = [True] * filas
+    errores = []
+    for i, fila in enumerate(zip(*columnas) if columnas else [()] * filas):
+        try:
+            resultados[i] = funcion(*fila)
+        except (ZeroDivisionError, ValueError, OverflowError, TypeError) as e:
+            validos[i] = False
+            errores.append({'indice': i, 'tipo': type(e).__name__, 'mensaje': str(e)})
+
+    return {'resultados': resultados, 'validos': validos, 'errores': errores}
@@ -0,0 +1,145 @@
+# Logging no bloqueante para la calculadora
+# Las operaciones solo encolan el registro (QueueHandler); un hilo de fondo
+# (QueueListener) escribe al archivo por lotes (MemoryHandler) y a consola.
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import threading
+from typing import Iterable, Optional, Set
+
+
+FORMATO_LOG = '%(asctime)s - %(levelname)s - %(message)s'
+ARCHIVO_LOG = 'calculadora.log'
+TAMANO_LOTE_ARCHIVO = 100  # registros acumulados antes de escribir a disco
+
+
+class FiltroNiveles(logging.Filter):
+    """
+    Deja pasar solo los niveles activos.
+
+    Se instala en el logger, así que activar o desactivar un nivel no
+    requiere cambiar las llamadas a logger.info/error del código.
+    """
+
+    def __init__(self, desactivados: Optional[Iterable[int]] = None):
+        super().__init__()
+        self.desactivados: Set[int] = set(desactivados or ())
+
+    def filter(self, registro: logging.LogRecord) -> bool:
+        return registro.levelno not in self.desactivados
+
+
+class _Canalizacion:
+    """Cola, hilo escritor y manejadores compartidos por todos los loggers configurados."""
+
+    def __init__(self, archivo: str, consola: bool):
+        self.cola: queue.SimpleQueue = queue.SimpleQueue()
+        formato = logging.Formatter(FORMATO_LOG)
+
+        manejador_archivo = logging.FileHandler(archivo, delay=True, encoding='utf-8')
+        manejador_archivo.setFormatter(formato)
+        # Acumula registros y los escribe juntos; los errores se escriben al momento
+        self.lote_archivo = logging.handlers.MemoryHandler(
+            TAMANO_LOTE_ARCHIVO, flushLevel=logging.ERROR, target=manejador_archivo
+        )
+        manejadores = [self.lote_archivo]
+        if consola:
+            manejador_consola = logging.StreamHandler()
+            manejador_consola.setFormatter(formato)
+            manejadores.append(manejador_consola)
+
+        self.manejadores = manejadores
+        self.oyente = logging.handlers.QueueListener(self.cola, *manejadores, respect_handler_level=True)
+        self.oyente.start()
+
+    def detener(self):
+        """Vacía la cola, escribe lo pendiente y cierra los manejadores."""
+        self.oyente.stop()
+        archivo = self.lote_archivo.target
+        for manejador in self.manejadores:
+            manejador.close()  # MemoryHandler escribe lo pendiente al cerrarse
+        archivo.close()
+
+
+_canalizacion: Optional[_Canalizacion] = None
+_cerrojo = threading.Lock()
+
+
+def configurar_logger_asincrono(nombre: str, nivel: int = logging.INFO,
+                                archivo: str = ARCHIVO_LOG, consola: bool = True) -> logging.Logger:
+    """
+    Configura un logger que solo encola sus registros.
+
+    La cola y el hilo escritor se crean una sola vez y se comparten; llamar
+    de nuevo con el mismo nombre no duplica manejadores.
+
+    Args:
+        nombre (str): Nombre del logger
+        nivel (int): Nivel mínimo a registrar
+        archivo (str): Archivo de log (se abre al primer registro)
+        consola (bool): Si también se muestra en consola
+
+    Returns:
+        logging.Logger: Logger configurado
+    """
+    global _canalizacion
+    with _cerrojo:
+        if _canalizacion is None:
+            _canalizacion = _Canalizacion(archivo, consola)
+            atexit.register(detener_logging)
+        canalizacion = _canalizacion
+
+    logger = logging.getLogger(nombre)
+    encolados = [m for m in logger.handlers if isinstance(m, logging.handlers.QueueHandler)]
+    if any(m.queue is canalizacion.cola for m in encolados):
+        return logger
+
+    # Primera configuración (o la canalización anterior se detuvo)
+    for manejador in encolados:
+        logger.removeHandler(manejador)
+    logger.addHandler(logging.handlers.QueueHandler(canalizacion.cola))
+    if not any(isinstance(f, FiltroNiveles) for f in logger.filters):
+        logger.addFilter(FiltroNiveles())
+    logger.propagate = False
+    logger.setLevel(nivel)
+    return logger
+
+
+def activar_nivel(logger: logging.Logger, nivel: int, activo: bool = True):
+    """
+    Activa o desactiva un nivel concreto de un logger configurado.
+
+    Args:
+        logger (logging.Logger): Logger devuelto por configurar_logger_asincrono
+        nivel (int): Nivel (logging.INFO, logging.ERROR, ...)
+        activo (bool): True para activarlo, False para silenciarlo
+    """
+    filtro = next((f for f in logger.filters if isinstance(f, FiltroNiveles)), None)
+    if filtro is None:
+        filtro = FiltroNiveles()
+        logger.addFilter(filtro)
+    if activo:
+        filtro.desactivados.discard(nivel)
+    else:
+        filtro.desactivados.add(nivel)
+
+
+def vaciar_logs():
+    """Espera a que se procese la cola y escribe a disco los registros acumulados."""
+    if _canalizacion is None:
+        return
+    # Reiniciar el oyente procesa todo lo encolado hasta ahora
+    _canalizacion.oyente.stop()
+    _canalizacion.lote_archivo.flush()
+    _canalizacion.oyente.start()
+
+
+def detener_logging():
+    """Detiene el hilo escritor dejando todo escrito (se llama al salir)."""
+    global _canalizacion
+    with _cerrojo:
+        if _canalizacion is not None:
+            _canalizacion.detener()
+            _canalizacion = None
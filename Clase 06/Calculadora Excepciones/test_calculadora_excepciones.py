@@ -3,11 +3,14 @@
 
 import unittest
 import math
+import logging
+import logging.handlers
 import sys
 import os
 from io import StringIO
 from unittest.mock import patch, mock_open
-from calculadora_excepciones import CalculadoraAvanzada
+from calculadora_excepciones import CalculadoraAvanzada, HistorialOperaciones
+from motor_expresiones import compilar_expresion
 
 
 class TestCalculadoraExcepciones(unittest.TestCase):
@@ -401,6 +404,244 @@ class TestIntegracion(unittest.TestCase):
         self.assertIn("Operación cancelada", output)
 
 
+class TestMotorExpresiones(unittest.TestCase):
+    """
+    Tests para el evaluador seguro de expresiones
+    """
+    
+    def setUp(self):
+        """Configuración inicial"""
+        self.calc = CalculadoraAvanzada()
+        self.calc.historial = []
+    
+    def test_expresiones_validas(self):
+        """Test: Operadores, precedencia y funciones permitidas"""
+        casos = [
+            ("2 + 3 * 4", 14),
+            ("(5 + 3) / 2", 4.0),
+            ("2 * 3 ^ 2", 18),      # ^ es potencia y tiene mayor precedencia
+            ("2 ^ 3 ^ 2", 512),     # asociativa por la derecha
+            ("-2 ^ 2", -4),
+            ("10 // 3 + 10 % 3", 4),
+            ("sqrt(16) + log(e)", 5.0),
+            ("2 * pi", 2 * math.pi),
+        ]
+        for expresion, esperado in casos:
+            with self.subTest(expresion=expresion):
+                self.assertAlmostEqual(self.calc.evaluar_expresion(expresion), esperado, places=6)
+    
+    def test_mismos_errores_que_realizar_operacion(self):
+        """Test: Los errores coinciden con los de realizar_operacion"""
+        casos = [
+            ("1 / 0", ZeroDivisionError),
+            ("5 % (2 - 2)", ZeroDivisionError),
+            ("0 ^ -1", ZeroDivisionError),
+            ("sqrt(-4)", ValueError),
+            ("log(0)", ValueError),
+            ("(-8) ^ 0.5", ValueError),
+            ("9 ^ 9 ^ 9", OverflowError),
+            ("1e308 * 10", OverflowError),
+        ]
+        for expresion, excepcion in casos:
+            with self.subTest(expresion=expresion):
+                with self.assertRaises(excepcion):
+                    self.calc.evaluar_expresion(expresion)
+    
+    def test_elementos_no_permitidos(self):
+        """Test: Se rechaza todo lo que no esté en la lista blanca"""
+        for expresion in ["__import__('os').system('ls')", "x.real", "(lambda: 1)()",
+                          "'texto'", "2 & 3", "[1, 2]", "True + 1", "_verificar(1)"]:
+            with self.subTest(expresion=expresion):
+                with self.assertRaises(ValueError):
+                    self.calc.evaluar_expresion(expresion, x=1)
+        
+        with self.assertRaises(SyntaxError):
+            self.calc.evaluar_expresion("2 +")
+    
+    def test_variables_y_cache(self):
+        """Test: Variables con nombre y caché de compilaciones"""
+        self.assertEqual(self.calc.evaluar_expresion("precio * (1 + iva)", precio=100, iva=0.5), 150)
+        self.assertIs(compilar_expresion("precio * (1 + iva)"), compilar_expresion("precio * (1 + iva)"))
+        
+        with self.assertRaises(ValueError):
+            self.calc.evaluar_expresion("precio * (1 + iva)", precio=100)
+    
+    def test_evaluar_lote(self):
+        """Test: Evaluación por columnas con reporte de errores por fila"""
+        reporte = self.calc.evaluar_lote("x / y + sqrt(x)", {'x': [4, 9, -1], 'y': [2, 0, 1]})
+        
+        self.assertEqual(reporte['resultados'], [4.0, None, None])
+        self.assertEqual(reporte['validos'], [True, False, False])
+        self.assertEqual([(e['indice'], e['tipo']) for e in reporte['errores']],
+                         [(1, 'ZeroDivisionError'), (2, 'ValueError')])
+        
+        with self.assertRaises(ValueError):
+            self.calc.evaluar_lote("x + y", {'x': [1, 2], 'y': [1]})
+    
+    @patch('builtins.input')
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_modo_evaluacion_expresiones(self, mock_stdout, mock_input):
+        """Test: El modo interactivo usa el evaluador seguro"""
+        mock_input.side_effect = ["2 ^ 10", "__import__('os')", "salir"]
+        
+        self.calc.modo_evaluacion_expresiones()
+        
+        output = mock_stdout.getvalue()
+        self.assertIn("2 ^ 10 = 1024.000000", output)
+        self.assertIn("no permitida", output)
+        self.assertEqual(len(self.calc.historial), 1)
+
+
+class TestOperacionesLote(unittest.TestCase):
+    """
+    Tests para las operaciones en lote
+    """
+    
+    def setUp(self):
+        """Configuración inicial"""
+        self.calc = CalculadoraAvanzada()
+        self.calc.historial = []
+    
+    def test_equivale_a_realizar_operacion(self):
+        """Test: Cada posición coincide con realizar_operacion (valor o error)"""
+        a = [10.0, -4.0, 0.0, 2.0, 1e308, 9.0, -8.0, float('nan'), 5.0]
+        b = [3.0, 0.0, -1.0, 0.5, 10.0, 2.0, 2.0, 1.0, float('nan')]
+        
+        for operador in ['+', '-', '*', '/', '%', '//', '^', 'sqrt', 'log']:
+            reporte = self.calc.realizar_operacion_lote(a, b, operador)
+            errores = {e['indice']: e for e in reporte['errores']}
+            for i, (x, y) in enumerate(zip(a, b)):
+                with self.subTest(operador=operador, num1=x, num2=y):
+                    try:
+                        esperado = self.calc.realizar_operacion(x, y, operador)
+                    except (ZeroDivisionError, ValueError, OverflowError) as e:
+                        self.assertFalse(reporte['validos'][i])
+                        self.assertIsNone(reporte['resultados'][i])
+                        self.assertEqual(errores[i]['tipo'], type(e).__name__)
+                        self.assertEqual(errores[i]['mensaje'], str(e))
+                    else:
+                        self.assertTrue(reporte['validos'][i])
+                        self.assertAlmostEqual(reporte['resultados'][i], esperado, places=6)
+    
+    def test_operaciones_unarias_sin_segundo_operando(self):
+        """Test: sqrt y log no necesitan la segunda columna"""
+        reporte = self.calc.realizar_operacion_lote([16, -1, math.e], None, "sqrt")
+        self.assertEqual(reporte['validos'], [True, False, True])
+        
+        reporte = self.calc.realizar_operacion_lote([math.e, 0], None, "log")
+        self.assertAlmostEqual(reporte['resultados'][0], 1.0)
+        self.assertEqual(reporte['errores'][0]['indice'], 1)
+        
+        for operador in ('sqrt', 'log'):
+            reporte = self.calc.realizar_operacion_lote([4.0, float('nan')], None, operador)
+            self.assertEqual(reporte['validos'], [True, False])
+            self.assertEqual(reporte['errores'][0]['tipo'], 'ValueError')
+    
+    def test_validaciones_del_lote(self):
+        """Test: Operador inválido y columnas de distinto largo"""
+        with self.assertRaises(ValueError):
+            self.calc.realizar_operacion_lote([1, 2], [1, 2], "&")
+        with self.assertRaises(ValueError):
+            self.calc.realizar_operacion_lote([1, 2], [1], "+")
+
+
+class TestRegistroYHistorial(unittest.TestCase):
+    """
+    Tests para el logging en cola y el historial con contadores
+    """
+    
+    def setUp(self):
+        """Configuración inicial"""
+        self.calc = CalculadoraAvanzada()
+        self.calc.historial = []
+    
+    def tearDown(self):
+        """Reactiva los niveles silenciados"""
+        self.calc.activar_log(logging.INFO)
+    
+    def test_logger_solo_encola(self):
+        """Test: El logger no escribe a disco directamente y no se duplica"""
+        CalculadoraAvanzada()
+        manejadores = self.calc.logger.handlers
+        encolados = [m for m in manejadores if isinstance(m, logging.handlers.QueueHandler)]
+        self.assertEqual(len(encolados), 1)
+        self.assertFalse(any(isinstance(m, logging.FileHandler) for m in manejadores))
+        self.assertFalse(self.calc.logger.propagate)
+    
+    def test_silenciar_nivel(self):
+        """Test: Un nivel desactivado no se registra y los demás sí"""
+        self.calc.activar_log(logging.INFO, False)
+        with self.assertLogs(self.calc.logger, level='INFO') as registro:
+            self.calc.realizar_operacion(2, 3, "+")
+            with self.assertRaises(ZeroDivisionError):
+                self.calc.realizar_operacion(1, 0, "/")
+        self.assertEqual([r.levelname for r in registro.records], ['ERROR'])
+        
+        self.calc.activar_log(logging.INFO)
+        with self.assertLogs(self.calc.logger, level='INFO') as registro:
+            self.calc.realizar_operacion(2, 3, "+")
+        self.assertIn("2 + 3 = 5", registro.output[0])
+    
+    def test_contadores_del_historial(self):
+        """Test: Los contadores descuentan las entradas que salen del historial"""
+        historial = HistorialOperaciones(limite=3)
+        for operacion, resultado in [("1 + 1 = 2", 2), ("8 / 2 = 4", 4),
+                                     ("√9 = 3", 3), ("2 ^ 3 = 8", 8)]:
+            historial.agregar({'operacion': operacion, 'resultado': resultado})
+        
+        self.assertEqual(len(historial), 3)
+        self.assertEqual(historial.total_registradas, 4)
+        self.assertEqual(historial.suma_resultados, 15)
+        self.assertEqual(historial.resumen()['operadores'], {'/': 1, 'sqrt': 1, '^': 1})
+        self.assertEqual([e['resultado'] for e in historial.ultimas(2)], [3, 8])
+        
+        historial.clear()
+        self.assertEqual(historial.resumen(), {})
+        self.assertEqual(historial.total_registradas, 0)
+        historial.agregar({'operacion': "2 + 3 = 5", 'resultado': 5})
+        self.assertEqual(historial.total_registradas, 1)
+    
+    def test_suma_del_historial_sin_error_acumulado(self):
+        """Test: La suma no arrastra redondeos ni desbordamientos de entradas descartadas"""
+        historial = HistorialOperaciones(limite=2)
+        for resultado in [1e16, 1.0, -1e16, 0.1, 0.2]:
+            historial.agregar({'operacion': "x", 'resultado': resultado, 'operador': '+'})
+        self.assertEqual(historial.suma_resultados, math.fsum([0.1, 0.2]))
+        
+        for resultado in [1e308, 1e308, 4.0, 6.0]:
+            historial.agregar({'operacion': "x", 'resultado': resultado, 'operador': '*'})
+        self.assertEqual(historial.resumen()['promedio'], 5.0)
+        
+        historial.agregar({'operacion': "x", 'resultado': math.inf, 'operador': '*'})
+        historial.agregar({'operacion': "x", 'resultado': -math.inf, 'operador': '*'})
+        self.assertTrue(math.isnan(historial.suma_resultados))
+        historial.agregar({'operacion': "x", 'resultado': 1.5, 'operador': '*'})
+        historial.agregar({'operacion': "x", 'resultado': 2.5, 'operador': '*'})
+        self.assertEqual(historial.resumen()['promedio'], 2.0)
+    
+    def test_operador_del_historial(self):
+        """Test: Se guarda el operador indicado o el extraído del texto"""
+        self.calc.agregar_al_historial("10 // 3 = 3.000000", 3)
+        self.calc.agregar_al_historial("5 - -2 = 7.000000", 7)
+        self.calc.agregar_al_historial("ln(1) = 0.000000", 0)
+        self.calc.agregar_al_historial("x", 1, operador="*")
+        self.assertEqual([e['operador'] for e in self.calc.historial], ['//', '-', 'log', '*'])
+    
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_mostrar_estadisticas(self, mock_stdout):
+        """Test: Las estadísticas salen de los contadores del historial"""
+        self.calc.agregar_al_historial("2 + 3 = 5.000000", 5, "+")
+        self.calc.agregar_al_historial("4 + 4 = 8.000000", 8, "+")
+        self.calc.agregar_al_historial("9 / 3 = 3.000000", 3, "/")
+        self.calc.mostrar_estadisticas()
+        
+        output = mock_stdout.getvalue()
+        self.assertIn("Total de operaciones: 3", output)
+        self.assertIn("Promedio de resultados: 5.33", output)
+        self.assertIn("+: 2 veces", output)
+        self.assertIn("/: 1 veces", output)
+
+
 def ejecutar_tests_completos():
     """
     Ejecuta todos los tests con reporte detallado
@@ -416,6 +657,9 @@ def ejecutar_tests_completos():
     suite.addTests(loader.loadTestsFromTestCase(TestCalculadoraExcepciones))
     suite.addTests(loader.loadTestsFromTestCase(TestCasosEspeciales))
     suite.addTests(loader.loadTestsFromTestCase(TestIntegracion))
+    suite.addTests(loader.loadTestsFromTestCase(TestMotorExpresiones))
+    suite.addTests(loader.loadTestsFromTestCase(TestOperacionesLote))
+    suite.addTests(loader.loadTestsFromTestCase(TestRegistroYHistorial))
     
     # Ejecutar tests con reporte detallado
     runner = unittest.TextTestRunner(verbosity=2)
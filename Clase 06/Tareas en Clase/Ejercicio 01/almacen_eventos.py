@@ -0,0 +1,296 @@
+# Almacén persistente de eventos y préstamos de la biblioteca
+# Registro append-only en SQLite con índices por usuario, título y fecha,
+# más una instantánea del catálogo para reconstruir el estado al reiniciar.
+
+import json
+import sqlite3
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+CAMPOS_FECHA = ('timestamp', 'fecha_prestamo', 'fecha_devolucion_esperada',
+                'fecha_devolucion_real', 'fecha_devolucion')
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS eventos (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    tipo TEXT NOT NULL,
+    titulo TEXT,
+    usuario TEXT,
+    descripcion TEXT NOT NULL,
+    datos TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_eventos_timestamp ON eventos (timestamp);
+CREATE INDEX IF NOT EXISTS idx_eventos_titulo ON eventos (titulo);
+CREATE INDEX IF NOT EXISTS idx_eventos_usuario ON eventos (usuario);
+
+CREATE TABLE IF NOT EXISTS prestamos (
+    titulo TEXT NOT NULL,
+    id_prestamo INTEGER NOT NULL,
+    usuario TEXT NOT NULL,
+    fecha_prestamo TEXT NOT NULL,
+    fecha_devolucion_esperada TEXT NOT NULL,
+    fecha_devolucion_real TEXT,
+    devuelto INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (titulo, id_prestamo)
+);
+CREATE INDEX IF NOT EXISTS idx_prestamos_usuario ON prestamos (usuario);
+CREATE INDEX IF NOT EXISTS idx_prestamos_fecha ON prestamos (fecha_prestamo);
+
+CREATE TABLE IF NOT EXISTS snapshot_meta (
+    clave TEXT PRIMARY KEY,
+    valor TEXT
+);
+CREATE TABLE IF NOT EXISTS snapshot_libros (
+    titulo TEXT PRIMARY KEY,
+    datos TEXT NOT NULL
+);
+"""
+
+
+def _serializar(valor):
+    """Convierte fechas a ISO 8601 para guardarlas como JSON."""
+    if isinstance(valor, datetime):
+        return valor.isoformat()
+    raise TypeError(f"Tipo no serializable: {type(valor).__name__}")
+
+
+def _restaurar_fechas(registro: Dict) -> Dict:
+    """Convierte de vuelta a datetime los campos de fecha conocidos."""
+    for campo in CAMPOS_FECHA:
+        valor = registro.get(campo)
+        if isinstance(valor, str):
+            registro[campo] = datetime.fromisoformat(valor)
+    return registro
+
+
+def _fecha_texto(fecha: Optional[datetime]) -> Optional[str]:
+    """Formatea una fecha opcional como texto ISO."""
+    return fecha.isoformat() if fecha is not None else None
+
+
+class AlmacenEventos:
+    """
+    Almacén append-only de eventos y préstamos respaldado por SQLite.
+
+    Las escrituras se confirman por lotes (cada `lote_commit` operaciones)
+    y siempre al guardar una instantánea o al cerrar el almacén.
+    """
+
+    def __init__(self, ruta: str = ":memory:", ventana: int = 100, lote_commit: int = 100):
+        """
+        Abre (o crea) el almacén.
+
+        Args:
+            ruta (str): Ruta del archivo SQLite (":memory:" para pruebas)
+            ventana (int): Eventos/préstamos recientes a conservar en RAM
+            lote_commit (int): Operaciones entre confirmaciones a disco
+
+        Raises:
+            ValueError: Si la ventana o el lote no son positivos
+        """
+        if ventana <= 0:
+            raise ValueError("La ventana debe ser mayor que cero")
+        if lote_commit <= 0:
+            raise ValueError("El lote de confirmación debe ser mayor que cero")
+
+        self.ruta = ruta
+        self.ventana = ventana
+        self.lote_commit = lote_commit
+        self._pendientes = 0
+        # La conexión se comparte entre hilos; Biblioteca serializa las escrituras
+        self._conexion = sqlite3.connect(ruta, check_same_thread=False)
+        self._conexion.row_factory = sqlite3.Row
+        self._conexion.executescript(ESQUEMA)
+
+    # ---------- Escritura ----------
+
+    def registrar_evento(self, timestamp: datetime, tipo: str, descripcion: str,
+                         titulo: Optional[str] = None, usuario: Optional[str] = None,
+                         datos: Optional[Dict] = None) -> int:
+        """
+        Agrega un evento al registro.
+
+        Returns:
+            int: Identificador secuencial del evento
+        """
+        cursor = self._conexion.execute(
+            "INSERT INTO eventos (timestamp, tipo, titulo, usuario, descripcion, datos) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (timestamp.isoformat(), tipo, titulo, usuario, descripcion,
+             json.dumps(datos, default=_serializar) if datos is not None else None)
+        )
+        self._tras_escritura()
+        return cursor.lastrowid
+
+    def registrar_prestamo(self, titulo: str, prestamo: Dict):
+        """Guarda (o actualiza) el registro de un préstamo."""
+        self._conexion.execute(
+            "INSERT OR REPLACE INTO prestamos (titulo, id_prestamo, usuario, fecha_prestamo, "
+            "fecha_devolucion_esperada, fecha_devolucion_real, devuelto) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (titulo, prestamo['id_prestamo'], prestamo['usuario'],
+             prestamo['fecha_prestamo'].isoformat(),
+             prestamo['fecha_devolucion_esperada'].isoformat(),
+             _fecha_texto(prestamo.get('fecha_devolucion_real')),
+             int(prestamo['devuelto']))
+        )
+        self._tras_escritura()
+
+    def registrar_devolucion(self, titulo: str, id_prestamo: int, fecha_devolucion: datetime):
+        """Marca un préstamo guardado como devuelto."""
+        self._conexion.execute(
+            "UPDATE prestamos SET devuelto = 1, fecha_devolucion_real = ? "
+            "WHERE titulo = ? AND id_prestamo = ?",
+            (fecha_devolucion.isoformat(), titulo, id_prestamo)
+        )
+        self._tras_escritura()
+
+    def guardar_snapshot(self, nombre: str, usuarios: List[str], libros: Iterable[Dict]):
+        """
+        Guarda una instantánea del catálogo y la posición del registro.
+
+        Args:
+            nombre (str): Nombre de la biblioteca
+            usuarios (list): Usuarios registrados
+            libros (iterable): Estado serializable de cada libro
+        """
+        ultimo = self._conexion.execute("SELECT COALESCE(MAX(id), 0) FROM eventos").fetchone()[0]
+        with self._conexion:
+            self._conexion.execute("DELETE FROM snapshot_libros")
+            self._conexion.executemany(
+                "INSERT INTO snapshot_libros (titulo, datos) VALUES (?, ?)",
+                ((libro['titulo'], json.dumps(libro, default=_serializar)) for libro in libros)
+            )
+            self._conexion.executemany(
+                "INSERT OR REPLACE INTO snapshot_meta (clave, valor) VALUES (?, ?)",
+                [('nombre', nombre),
+                 ('usuarios', json.dumps(usuarios)),
+                 ('ultimo_evento', str(ultimo)),
+                 ('fecha', datetime.now().isoformat())]
+            )
+        self._pendientes = 0
+
+    def confirmar(self):
+        """Confirma a disco las escrituras pendientes."""
+        self._conexion.commit()
+        self._pendientes = 0
+
+    def cerrar(self):
+        """Confirma las escrituras pendientes y cierra el almacén."""
+        self.confirmar()
+        self._conexion.close()
+
+    # ---------- Lectura ----------
+
+    def cargar_snapshot(self) -> Optional[Dict]:
+        """
+        Carga la última instantánea guardada.
+
+        Returns:
+            dict o None: nombre, usuarios, ultimo_evento y un iterador de libros
+        """
+        meta = dict(self._conexion.execute("SELECT clave, valor FROM snapshot_meta").fetchall())
+        if not meta:
+            return None
+
+        def libros() -> Iterator[Dict]:
+            for fila in self._conexion.execute("SELECT datos FROM snapshot_libros"):
+                libro = json.loads(fila['datos'])
+                libro['prestamos_activos'] = [_restaurar_fechas(p) for p in libro['prestamos_activos']]
+                yield libro
+
+        return {
+            'nombre': meta['nombre'],
+            'usuarios': json.loads(meta['usuarios']),
+            'ultimo_evento': int(meta['ultimo_evento']),
+            'libros': libros()
+        }
+
+    def eventos_desde(self, id_evento: int) -> Iterator[Dict]:
+        """Recorre, en orden, los eventos posteriores a un identificador."""
+        cursor = self._conexion.execute(
+            "SELECT * FROM eventos WHERE id > ? ORDER BY id", (id_evento,)
+        )
+        for fila in cursor:
+            yield self._fila_evento(fila)
+
+    def eventos_recientes(self, limite: int) -> List[Dict]:
+        """Obtiene los últimos eventos, del más antiguo al más reciente."""
+        filas = self._conexion.execute(
+            "SELECT * FROM eventos ORDER BY id DESC LIMIT ?", (limite,)
+        ).fetchall()
+        return [self._fila_evento(fila) for fila in reversed(filas)]
+
+    def consultar_eventos(self, titulo: Optional[str] = None, usuario: Optional[str] = None,
+                          desde: Optional[datetime] = None, hasta: Optional[datetime] = None,
+                          tipo: Optional[str] = None, limite: Optional[int] = None) -> List[Dict]:
+        """
+        Consulta eventos por título, usuario, tipo y/o rango de fechas.
+
+        Returns:
+            list: Eventos en orden cronológico
+        """
+        condiciones, parametros = self._filtros(titulo=titulo, usuario=usuario, tipo=tipo,
+                                                campo_fecha='timestamp', desde=desde, hasta=hasta)
+        consulta = "SELECT * FROM eventos" + condiciones + " ORDER BY id"
+        if limite is not None:
+            consulta += " LIMIT ?"
+            parametros.append(limite)
+        return [self._fila_evento(fila) for fila in self._conexion.execute(consulta, parametros)]
+
+    def consultar_prestamos(self, titulo: Optional[str] = None, usuario: Optional[str] = None,
+                            desde: Optional[datetime] = None, hasta: Optional[datetime] = None,
+                            limite: Optional[int] = None) -> List[Dict]:
+        """
+        Consulta préstamos por título, usuario y/o rango de fecha de préstamo.
+
+        Returns:
+            list: Préstamos ordenados por fecha de préstamo
+        """
+        condiciones, parametros = self._filtros(titulo=titulo, usuario=usuario, tipo=None,
+                                                campo_fecha='fecha_prestamo', desde=desde, hasta=hasta)
+        consulta = "SELECT * FROM prestamos" + condiciones + " ORDER BY fecha_prestamo, id_prestamo"
+        if limite is not None:
+            consulta += " LIMIT ?"
+            parametros.append(limite)
+
+        resultado = []
+        for fila in self._conexion.execute(consulta, parametros):
+            prestamo = _restaurar_fechas(dict(fila))
+            prestamo['devuelto'] = bool(prestamo['devuelto'])
+            resultado.append(prestamo)
+        return resultado
+
+    # ---------- Auxiliares ----------
+
+    def _tras_escritura(self):
+        """Confirma a disco cada `lote_commit` escrituras."""
+        self._pendientes += 1
+        if self._pendientes >= self.lote_commit:
+            self.confirmar()
+
+    @staticmethod
+    def _filtros(titulo, usuario, tipo, campo_fecha, desde, hasta):
+        """Construye la cláusula WHERE y sus parámetros."""
+        condiciones, parametros = [], []
+        for columna, valor in (('titulo', titulo), ('usuario', usuario), ('tipo', tipo)):
+            if valor is not None:
+                condiciones.append(f"{columna} = ?")
+                parametros.append(valor)
+        if desde is not None:
+            condiciones.append(f"{campo_fecha} >= ?")
+            parametros.append(desde.isoformat())
+        if hasta is not None:
+            condiciones.append(f"{campo_fecha} < ?")
+            parametros.append(hasta.isoformat())
+        clausula = " WHERE " + " AND ".join(condiciones) if condiciones else ""
+        return clausula, parametros
+
+    @staticmethod
+    def _fila_evento(fila: sqlite3.Row) -> Dict:
+        """Convierte una fila de la tabla de eventos en diccionario."""
+        evento = dict(fila)
+        evento['timestamp'] = datetime.fromisoformat(evento['timestamp'])
+        evento['datos'] = _restaurar_fechas(json.loads(evento['datos'])) if evento['datos'] else None
+        return evento
@@ -0,0 +1,263 @@
+# Índice de búsqueda para el catálogo de la biblioteca
+# Índice invertido de tokens (título y autor), autocompletado por prefijo
+# y búsqueda aproximada con un BK-tree sobre distancia de edición.
+
+import re
+import threading
+import unicodedata
+from bisect import bisect_left
+from typing import Dict, List, Optional, Set
+
+
+PATRON_TOKEN = re.compile(r"\w+")
+CAMPOS = ('titulo', 'autor')
+
+
+def normalizar_texto(texto: str) -> str:
+    """
+    Elimina tildes y normaliza mayúsculas/minúsculas.
+
+    Args:
+        texto (str): Texto a normalizar
+
+    Returns:
+        str: Texto sin acentos y en minúsculas ("Márquez" -> "marquez")
+    """
+    if texto.isascii():
+        return texto.lower()
+    descompuesto = unicodedata.normalize('NFKD', texto)
+    sin_acentos = ''.join(c for c in descompuesto if not unicodedata.combining(c))
+    return sin_acentos.casefold()
+
+
+def tokenizar(texto: str) -> List[str]:
+    """Divide un texto normalizado en tokens alfanuméricos."""
+    return PATRON_TOKEN.findall(normalizar_texto(texto))
+
+
+def distancia_edicion(a: str, b: str, maximo: Optional[int] = None) -> int:
+    """
+    Calcula la distancia de Levenshtein entre dos cadenas.
+
+    Args:
+        a (str): Primera cadena
+        b (str): Segunda cadena
+        maximo (int, optional): Cota; si se supera se devuelve maximo + 1
+
+    Returns:
+        int: Número mínimo de ediciones (o maximo + 1 si se supera la cota)
+    """
+    if maximo is not None and abs(len(a) - len(b)) > maximo:
+        return maximo + 1
+    if len(a) < len(b):
+        a, b = b, a
+
+    anterior = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        actual = [i]
+        for j, cb in enumerate(b, 1):
+            actual.append(min(anterior[j] + 1,
+                              actual[j - 1] + 1,
+                              anterior[j - 1] + (ca != cb)))
+        if maximo is not None and min(actual) > maximo:
+            return maximo + 1
+        anterior = actual
+    return anterior[-1]
+
+
+class BKTree:
+    """
+    Árbol BK para encontrar palabras a distancia de edición acotada.
+    """
+
+    def __init__(self):
+        """Inicializa un árbol vacío."""
+        self._raiz = None  # (palabra, {distancia: nodo})
+
+    def agregar(self, palabra: str):
+        """Agrega una palabra al árbol (las repetidas se ignoran)."""
+        if self._raiz is None:
+            self._raiz = (palabra, {})
+            return
+
+        nodo = self._raiz
+        while True:
+            palabra_nodo, hijos = nodo
+            distancia = distancia_edicion(palabra, palabra_nodo)
+            if distancia == 0:
+                return
+            if distancia not in hijos:
+                hijos[distancia] = (palabra, {})
+                return
+            nodo = hijos[distancia]
+
+    def buscar(self, palabra: str, max_distancia: int) -> List[str]:
+        """
+        Busca palabras a distancia menor o igual a max_distancia.
+
+        Args:
+            palabra (str): Palabra de consulta
+            max_distancia (int): Distancia de edición máxima permitida
+
+        Returns:
+            list: Palabras encontradas
+        """
+        if self._raiz is None:
+            return []
+
+        resultados = []
+        pendientes = [self._raiz]
+        while pendientes:
+            palabra_nodo, hijos = pendientes.pop()
+            distancia = distancia_edicion(palabra, palabra_nodo)
+            if distancia <= max_distancia:
+                resultados.append(palabra_nodo)
+            for d in range(distancia - max_distancia, distancia + max_distancia + 1):
+                if d in hijos:
+                    pendientes.append(hijos[d])
+        return resultados
+
+
+class IndiceBusqueda:
+    """
+    Índice invertido sobre título y autor de los libros del catálogo.
+
+    Cada token apunta al conjunto de claves del catálogo (títulos
+    normalizados) que lo contienen, separado por campo.
+
+    La lista ordenada de tokens y el BK-tree se ponen al día de forma
+    diferida al consultar; un cerrojo protege esa reconstrucción (y las
+    altas) para que varios hilos puedan buscar a la vez.
+    """
+
+    def __init__(self):
+        """Inicializa el índice vacío."""
+        self._postings: Dict[str, Dict[str, Set[str]]] = {campo: {} for campo in CAMPOS}
+        self._tokens_ordenados: List[str] = []
+        self._tokens_pendientes: Set[str] = set()
+        # El BK-tree se construye de forma diferida en la primera búsqueda aproximada
+        self._bk_tree = BKTree()
+        self._pendientes_bk: List[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Número de tokens distintos indexados."""
+        return len(self._tokens_ordenados) + len(self._tokens_pendientes)
+
+    def agregar(self, clave: str, titulo: str, autor: str):
+        """
+        Indexa un libro.
+
+        Args:
+            clave (str): Clave del libro en el catálogo
+            titulo (str): Título del libro
+            autor (str): Autor del libro
+        """
+        tokens = [(campo, tokenizar(texto)) for campo, texto in (('titulo', titulo), ('autor', autor))]
+        with self._lock:
+            for campo, tokens_campo in tokens:
+                postings = self._postings[campo]
+                for token in tokens_campo:
+                    if token not in postings:
+                        if not self._existe_token(token):
+                            self._tokens_pendientes.add(token)
+                            self._pendientes_bk.append(token)
+                        postings[token] = set()
+                    postings[token].add(clave)
+
+    def buscar(self, consulta: str, campo: Optional[str] = None,
+               max_errores: int = 0, prefijo: bool = True) -> Set[str]:
+        """
+        Busca libros cuyos campos contengan todos los tokens de la consulta.
+
+        Args:
+            consulta (str): Texto a buscar
+            campo (str, optional): 'titulo', 'autor' o None para ambos
+            max_errores (int): Distancia de edición tolerada por token
+            prefijo (bool): Si el último token se trata como prefijo
+
+        Returns:
+            set: Claves del catálogo que coinciden
+
+        Raises:
+            ValueError: Si el campo no es válido
+        """
+        if campo is not None and campo not in CAMPOS:
+            raise ValueError(f"Campo no válido: '{campo}'. Use {CAMPOS}")
+
+        tokens = tokenizar(consulta)
+        if not tokens:
+            return set()
+
+        campos = (campo,) if campo else CAMPOS
+        conjuntos = []
+        for posicion, token in enumerate(tokens):
+            variantes = {token}
+            if max_errores > 0:
+                variantes.update(self._arbol_bk().buscar(token, max_errores))
+            if prefijo and posicion == len(tokens) - 1:
+                variantes.update(self.tokens_con_prefijo(token))
+
+            claves = set()
+            for nombre_campo in campos:
+                postings = self._postings[nombre_campo]
+                for variante in variantes:
+                    claves.update(postings.get(variante, ()))
+            if not claves:
+                return set()
+            conjuntos.append(claves)
+
+        # Intersectar empezando por el conjunto más pequeño
+        conjuntos.sort(key=len)
+        resultado = conjuntos[0]
+        for claves in conjuntos[1:]:
+            resultado = resultado & claves
+            if not resultado:
+                break
+        return resultado
+
+    def tokens_con_prefijo(self, prefijo: str, limite: Optional[int] = None) -> List[str]:
+        """
+        Devuelve los tokens indexados que empiezan por un prefijo.
+
+        Args:
+            prefijo (str): Prefijo a completar
+            limite (int, optional): Número máximo de tokens
+
+        Returns:
+            list: Tokens en orden alfabético
+        """
+        prefijo = normalizar_texto(prefijo)
+        if not prefijo:
+            return []
+
+        tokens = self._ordenados()
+        resultado = []
+        i = bisect_left(tokens, prefijo)
+        while i < len(tokens) and tokens[i].startswith(prefijo):
+            resultado.append(tokens[i])
+            if limite is not None and len(resultado) >= limite:
+                break
+            i += 1
+        return resultado
+
+    def _existe_token(self, token: str) -> bool:
+        """Indica si el token ya está en algún campo del índice."""
+        return any(token in postings for postings in self._postings.values())
+
+    def _arbol_bk(self) -> BKTree:
+        """Devuelve el BK-tree, incorporando los tokens pendientes."""
+        with self._lock:
+            for token in self._pendientes_bk:
+                self._bk_tree.agregar(token)
+            self._pendientes_bk.clear()
+            return self._bk_tree
+
+    def _ordenados(self) -> List[str]:
+        """Devuelve la lista ordenada de tokens, incorporando los pendientes."""
+        with self._lock:
+            if self._tokens_pendientes:
+                # Lista nueva: quien esté recorriendo la anterior no la ve cambiar
+                self._tokens_ordenados = sorted(self._tokens_ordenados + list(self._tokens_pendientes))
+                self._tokens_pendientes.clear()
+            return self._tokens_ordenados
@@ -0,0 +1,160 @@
+# Planificador de vencimientos de préstamos
+# Montículo mínimo (heapq) ordenado por fecha de devolución esperada
+# para consultar préstamos vencidos y próximos vencimientos.
+
+import heapq
+from datetime import datetime
+from itertools import count
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+MULTA_POR_DIA = 0.50  # $0.50 por día de retraso
+
+
+def calcular_multa(dias_retraso: int) -> float:
+    """Calcula la multa correspondiente a los días de retraso."""
+    return dias_retraso * MULTA_POR_DIA
+
+
+class PlanificadorVencimientos:
+    """
+    Mantiene todos los préstamos activos en un montículo mínimo.
+
+    Los préstamos devueltos no se eliminan del montículo al momento: se
+    descartan al consultarlos (marcados con 'devuelto') y el montículo se
+    compacta cuando las entradas obsoletas superan a las activas.
+    """
+
+    def __init__(self):
+        """Inicializa el planificador vacío."""
+        # Entradas: (fecha_devolucion_esperada, secuencia, titulo, prestamo)
+        self._heap: List[Tuple[datetime, int, str, Dict]] = []
+        self._secuencia = count()
+        self._obsoletas = 0
+
+    def __len__(self) -> int:
+        """Número de préstamos activos registrados."""
+        return len(self._heap) - self._obsoletas
+
+    def registrar(self, titulo: str, prestamo: Dict):
+        """
+        Registra un préstamo activo.
+
+        Args:
+            titulo (str): Título del libro prestado
+            prestamo (dict): Registro del préstamo (se comparte, no se copia)
+        """
+        entrada = (prestamo['fecha_devolucion_esperada'], next(self._secuencia), titulo, prestamo)
+        heapq.heappush(self._heap, entrada)
+
+    def registrar_devolucion(self):
+        """Anota que un préstamo registrado fue devuelto."""
+        self._obsoletas += 1
+        if self._obsoletas > len(self._heap) // 2:
+            self._compactar()
+
+    def vencidos(self, fecha: Optional[datetime] = None) -> List[Dict]:
+        """
+        Obtiene los préstamos vencidos a una fecha, del más antiguo al más reciente.
+
+        Recorre solo la parte del montículo con fecha anterior a la indicada,
+        por lo que el costo es O(k log k) para k resultados.
+
+        Args:
+            fecha (datetime, optional): Fecha de corte (por defecto, ahora)
+
+        Returns:
+            list: Registros con 'titulo' y los datos del préstamo
+        """
+        fecha = fecha or datetime.now()
+        resultado = []
+        for vencimiento, titulo, prestamo in self._recorrer_en_orden():
+            if vencimiento >= fecha:
+                break
+            resultado.append(self._como_registro(titulo, prestamo))
+        return resultado
+
+    def proximos(self, n: int = 10) -> List[Dict]:
+        """
+        Obtiene los n préstamos activos con vencimiento más cercano.
+
+        Args:
+            n (int): Número de préstamos a devolver
+
+        Returns:
+            list: Registros con 'titulo' y los datos del préstamo
+        """
+        resultado = []
+        if n <= 0:
+            return resultado
+        for _, titulo, prestamo in self._recorrer_en_orden():
+            resultado.append(self._como_registro(titulo, prestamo))
+            if len(resultado) >= n:
+                break
+        return resultado
+
+    def procesar_multas(self, fecha: Optional[datetime] = None) -> List[Dict]:
+        """
+        Acumula la multa de todos los préstamos vencidos en una sola pasada.
+
+        Actualiza 'dias_retraso' y 'multa_acumulada' en cada préstamo vencido
+        y genera un recordatorio por préstamo.
+
+        Args:
+            fecha (datetime, optional): Fecha de corte (por defecto, ahora)
+
+        Returns:
+            list: Recordatorios (titulo, usuario, id_prestamo, fecha límite,
+                  días de retraso y multa acumulada)
+        """
+        fecha = fecha or datetime.now()
+        recordatorios = []
+        for vencimiento, titulo, prestamo in self._recorrer_en_orden():
+            if vencimiento >= fecha:
+                break
+            dias_retraso = (fecha - vencimiento).days
+            prestamo['dias_retraso'] = dias_retraso
+            prestamo['multa_acumulada'] = calcular_multa(dias_retraso)
+            recordatorios.append({
+                'titulo': titulo,
+                'usuario': prestamo['usuario'],
+                'id_prestamo': prestamo['id_prestamo'],
+                'fecha_devolucion_esperada': vencimiento,
+                'dias_retraso': dias_retraso,
+                'multa': prestamo['multa_acumulada'],
+                'fecha_recordatorio': fecha
+            })
+        return recordatorios
+
+    def _recorrer_en_orden(self) -> Iterator[Tuple[datetime, str, Dict]]:
+        """
+        Recorre el montículo en orden de vencimiento sin modificarlo.
+
+        Usa un montículo auxiliar de índices: solo se visitan los hijos
+        de los nodos ya entregados, así que obtener k elementos cuesta
+        O(k log k) en lugar de ordenar todo el montículo.
+        """
+        heap = self._heap
+        if not heap:
+            return
+        frontera = [(heap[0], 0)]
+        while frontera:
+            (vencimiento, _, titulo, prestamo), i = heapq.heappop(frontera)
+            if not prestamo['devuelto']:
+                yield vencimiento, titulo, prestamo
+            for hijo in (2 * i + 1, 2 * i + 2):
+                if hijo < len(heap):
+                    heapq.heappush(frontera, (heap[hijo], hijo))
+
+    def _compactar(self):
+        """Elimina las entradas de préstamos ya devueltos."""
+        self._heap = [entrada for entrada in self._heap if not entrada[3]['devuelto']]
+        heapq.heapify(self._heap)
+        self._obsoletas = 0
+
+    @staticmethod
+    def _como_registro(titulo: str, prestamo: Dict) -> Dict:
+        """Combina el título con los datos del préstamo."""
+        registro = dict(prestamo)
+        registro['titulo'] = titulo
+        return registro
@@ -0,0 +1,221 @@
+# Servicio concurrente de préstamos para la biblioteca
+# Préstamos seguros entre hilos, API asyncio y lista de espera por título
+# que entrega los ejemplares devueltos directamente al siguiente en la fila.
+
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Dict, List, Set, Tuple
+
+from sistema_biblioteca import (
+    Biblioteca, LibroNoDisponibleError, LibroNoEncontradoError
+)
+
+
+class ServicioPrestamos:
+    """
+    Capa de préstamos concurrente sobre una Biblioteca.
+
+    Toda operación sobre un título se hace con el cerrojo de ese libro, de
+    modo que verificar stock, prestar y atender la lista de espera ocurren
+    de forma atómica. Títulos distintos no se bloquean entre sí.
+
+    El servicio se registra como lista de espera de la biblioteca: los
+    préstamos y devoluciones hechos directamente con Biblioteca.prestar_libro
+    y Biblioteca.devolver_libro también respetan y atienden la fila.
+    """
+
+    def __init__(self, biblioteca: Biblioteca):
+        """
+        Inicializa el servicio.
+
+        Args:
+            biblioteca (Biblioteca): Biblioteca sobre la que se opera
+        """
+        self.biblioteca = biblioteca
+        # Lista de espera por título: (usuario, futuro que recibirá el préstamo)
+        self._esperas: Dict[str, Deque[Tuple[str, Future]]] = {}
+        # Títulos cuya fila se está atendiendo (con el cerrojo del libro tomado)
+        self._atendiendo: Set[str] = set()
+        biblioteca.lista_espera = self
+
+    # ---------- API síncrona (segura entre hilos) ----------
+
+    def prestar(self, titulo: str, usuario: str) -> Dict:
+        """
+        Presta un ejemplar si hay stock y nadie espera antes en la fila.
+
+        Returns:
+            dict: Información del préstamo
+
+        Raises:
+            LibroNoEncontradoError: Si el libro no existe
+            LibroNoDisponibleError: Si no hay ejemplares libres
+        """
+        return self.biblioteca.prestar_libro(titulo, usuario)
+
+    def reservar(self, titulo: str, usuario: str) -> Future:
+        """
+        Presta un ejemplar o, si no hay, deja al usuario en la lista de espera.
+
+        Args:
+            titulo (str): Título del libro
+            usuario (str): Nombre del usuario
+
+        Returns:
+            Future: Se resuelve con el préstamo cuando el usuario recibe el libro
+
+        Raises:
+            LibroNoEncontradoError: Si el libro no existe
+        """
+        libro = self._obtener_libro(titulo)
+        futuro: Future = Future()
+        with libro.lock:
+            espera = self._esperas.get(libro.titulo)
+            if not espera and libro.esta_disponible():
+                futuro.set_result(self.biblioteca.prestar_libro(libro.titulo, usuario))
+            else:
+                self._esperas.setdefault(libro.titulo, deque()).append((usuario, futuro))
+        return futuro
+
+    def devolver(self, titulo: str, usuario: str) -> Dict:
+        """
+        Devuelve un ejemplar y lo entrega al siguiente usuario en espera.
+
+        Returns:
+            dict: Información de la devolución
+
+        Raises:
+            LibroNoEncontradoError: Si el libro no existe
+            ValueError: Si el usuario no tiene el libro prestado
+        """
+        return self.biblioteca.devolver_libro(titulo, usuario)
+
+    def cancelar_reserva(self, titulo: str, usuario: str) -> bool:
+        """
+        Retira al usuario de la lista de espera de un título.
+
+        Returns:
+            bool: True si el usuario estaba en espera
+        """
+        libro = self._obtener_libro(titulo)
+        usuario = usuario.strip().title()
+        with libro.lock:
+            espera = self._esperas.get(libro.titulo, deque())
+            for i, (en_espera, futuro) in enumerate(espera):
+                if en_espera.strip().title() == usuario:
+                    del espera[i]
+                    futuro.cancel()
+                    return True
+        return False
+
+    def usuarios_en_espera(self, titulo: str) -> List[str]:
+        """Lista los usuarios en espera de un título, en orden de llegada."""
+        libro = self._obtener_libro(titulo)
+        with libro.lock:
+            return [usuario for usuario, _ in self._esperas.get(libro.titulo, ())]
+
+    # ---------- API asyncio ----------
+
+    async def prestar_async(self, titulo: str, usuario: str) -> Dict:
+        """Versión asyncio de prestar (no bloquea el bucle de eventos)."""
+        return await asyncio.to_thread(self.prestar, titulo, usuario)
+
+    async def reservar_async(self, titulo: str, usuario: str) -> Dict:
+        """Espera (sin bloquear el bucle) hasta recibir el préstamo."""
+        return await asyncio.wrap_future(self.reservar(titulo, usuario))
+
+    async def devolver_async(self, titulo: str, usuario: str) -> Dict:
+        """Versión asyncio de devolver."""
+        return await asyncio.to_thread(self.devolver, titulo, usuario)
+
+    # ---------- Auxiliares ----------
+
+    def _obtener_libro(self, titulo: str):
+        """Busca el libro o lanza LibroNoEncontradoError."""
+        libro = self.biblioteca.buscar_libro(titulo)
+        if libro is None:
+            raise LibroNoEncontradoError(titulo)
+        return libro
+
+    # ---------- Lista de espera (llamada por Biblioteca con el cerrojo del libro) ----------
+
+    def hay_espera(self, titulo: str) -> bool:
+        """Indica si otros usuarios esperan el título antes que un préstamo nuevo."""
+        return titulo not in self._atendiendo and bool(self._esperas.get(titulo))
+
+    def atender_espera(self, titulo: str):
+        """Entrega los ejemplares libres a los usuarios en espera."""
+        espera = self._esperas.get(titulo)
+        if not espera:
+            return
+        libro = self.biblioteca.catalogo[titulo]
+        self._atendiendo.add(titulo)
+        try:
+            while espera and libro.esta_disponible():
+                usuario, futuro = espera.popleft()
+                if not futuro.set_running_or_notify_cancel():
+                    continue
+                try:
+                    futuro.set_result(self.biblioteca.prestar_libro(titulo, usuario))
+                except Exception as e:
+                    futuro.set_exception(e)
+        finally:
+            self._atendiendo.discard(titulo)
+        if not espera:
+            del self._esperas[titulo]
+
+
+# ==================== PRUEBA DE CARGA ====================
+
+def prueba_de_carga(usuarios: int = 2000, hilos: int = 16, stock: int = 25) -> Dict:
+    """
+    Simula muchos usuarios pidiendo el mismo título a la vez.
+
+    Args:
+        usuarios (int): Número de solicitudes simultáneas
+        hilos (int): Hilos del pool de trabajo
+        stock (int): Ejemplares del título disputado
+
+    Returns:
+        dict: Préstamos concedidos, rechazos, stock final y solicitudes/segundo
+    """
+    biblioteca = Biblioteca("Biblioteca Carga")
+    biblioteca.agregar_libro("Cien Años de Soledad", "Gabriel García Márquez", stock)
+    servicio = ServicioPrestamos(biblioteca)
+
+    def solicitar(i: int) -> bool:
+        try:
+            servicio.prestar("Cien Años de Soledad", f"Usuario {i}")
+            return True
+        except LibroNoDisponibleError:
+            return False
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=hilos) as pool:
+        resultados = list(pool.map(solicitar, range(usuarios)))
+    duracion = time.perf_counter() - inicio
+
+    libro = biblioteca.buscar_libro("Cien Años de Soledad")
+    return {
+        'concedidos': sum(resultados),
+        'rechazados': usuarios - sum(resultados),
+        'stock_disponible': libro.stock_disponible,
+        'solicitudes_por_segundo': usuarios / duracion if duracion > 0 else float('inf')
+    }
+
+
+if __name__ == "__main__":
+    print("⚙️ PRUEBA DE CARGA: PRÉSTAMOS CONCURRENTES")
+    print("=" * 45)
+    resultado = prueba_de_carga()
+    for clave, valor in resultado.items():
+        if isinstance(valor, float):
+            print(f"   {clave}: {valor:,.0f}")
+        else:
+            print(f"   {clave}: {valor}")
+    if resultado['stock_disponible'] < 0:
+        print("❌ Sobreasignación detectada")
+    else:
+        print("✅ Sin sobreasignación de ejemplares")
@@ -1,9 +1,20 @@
 # Sistema de Biblioteca con Préstamo Simple y Manejo de Excepciones
 # Aplicación práctica de POO y excepciones personalizadas
 
+from collections import deque
+from contextlib import ExitStack
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from itertools import islice
+from typing import Any, IO, Iterable, Iterator, List, Dict, Optional, Tuple, Union
+import csv
 import json
+import os
+import threading
+
+from almacen_eventos import AlmacenEventos
+
+from indice_busqueda import IndiceBusqueda
+from planificador_vencimientos import PlanificadorVencimientos, calcular_multa
 
 
 # ==================== EXCEPCIONES PERSONALIZADAS ====================
@@ -46,6 +57,15 @@ class UsuarioNoValidoError(BibliotecaError):
         super().__init__(mensaje)
 
 
+# ==================== CONFIGURACIÓN ====================
+
+# Extensiones reconocidas por Biblioteca.cargar_catalogo
+FORMATOS_CATALOGO = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+
+# Máximo de errores detallados que se guardan en el resumen de una carga
+MAX_ERRORES_CARGA = 100
+
+
 # ==================== CLASES PRINCIPALES ====================
 
 class Libro:
@@ -53,7 +73,8 @@ class Libro:
     Clase que representa un libro en la biblioteca.
     """
     
-    def __init__(self, titulo: str, autor: str, stock: int = 1):
+    def __init__(self, titulo: str, autor: str, stock: int = 1,
+                 limite_historial: Optional[int] = None):
         """
         Inicializa un libro con título, autor y stock.
         
@@ -61,19 +82,42 @@ class Libro:
             titulo (str): Título del libro
             autor (str): Autor del libro
             stock (int): Cantidad de ejemplares disponibles
+            limite_historial (int, optional): Préstamos recientes a conservar
+                en memoria (None = historial completo)
             
         Raises:
             ValueError: Si algún parámetro no es válido
         """
-        self.titulo = self._validar_titulo(titulo)
-        self.autor = self._validar_autor(autor)
-        self.stock_total = self._validar_stock(stock)
+        self._inicializar(self._validar_titulo(titulo), self._validar_autor(autor),
+                          self._validar_stock(stock), limite_historial)
+    
+    @classmethod
+    def _desde_validados(cls, titulo: str, autor: str, stock: int,
+                         limite_historial: Optional[int] = None) -> 'Libro':
+        """Crea un libro con datos ya validados y normalizados (carga masiva)."""
+        libro = cls.__new__(cls)
+        libro._inicializar(titulo, autor, stock, limite_historial)
+        return libro
+    
+    def _inicializar(self, titulo: str, autor: str, stock: int,
+                     limite_historial: Optional[int]):
+        """Inicializa el estado interno del libro."""
+        self.titulo = titulo
+        self.autor = autor
+        self.stock_total = stock
         self.stock_disponible = self.stock_total
-        self.prestamos_activos = []
-        self.historial_prestamos = []
+        # Préstamos activos indexados por id_prestamo y por usuario.
+        # El historial guarda el mismo registro (por referencia), no una copia.
+        self.prestamos_activos: Dict[int, Dict] = {}
+        self._activos_por_usuario: Dict[str, Dict[int, Dict]] = {}
+        self.historial_prestamos = deque(maxlen=limite_historial) if limite_historial else []
+        self.total_prestamos = 0
         self.fecha_agregado = datetime.now()
+        # Cerrojo por título: verificar y descontar stock es una sola operación
+        self.lock = threading.RLock()
     
-    def _validar_titulo(self, titulo: str) -> str:
+    @staticmethod
+    def _validar_titulo(titulo: str) -> str:
         """Valida y formatea el título del libro."""
         if not isinstance(titulo, str):
             raise ValueError("El título debe ser una cadena de texto")
@@ -87,7 +131,8 @@ class Libro:
         
         return titulo.title()
     
-    def _validar_autor(self, autor: str) -> str:
+    @staticmethod
+    def _validar_autor(autor: str) -> str:
         """Valida y formatea el autor del libro."""
         if not isinstance(autor, str):
             raise ValueError("El autor debe ser una cadena de texto")
@@ -101,7 +146,8 @@ class Libro:
         
         return autor.title()
     
-    def _validar_stock(self, stock: int) -> int:
+    @staticmethod
+    def _validar_stock(stock: int) -> int:
         """Valida el stock del libro."""
         if not isinstance(stock, int):
             raise ValueError("El stock debe ser un número entero")
@@ -123,12 +169,13 @@ class Libro:
         """
         return self.stock_disponible > 0
     
-    def prestar(self, usuario: str) -> Dict:
+    def prestar(self, usuario: str, fecha_prestamo: Optional[datetime] = None) -> Dict:
         """
         Presta un ejemplar del libro a un usuario.
         
         Args:
             usuario (str): Nombre del usuario que solicita el préstamo
+            fecha_prestamo (datetime, optional): Fecha del préstamo (por defecto, ahora)
             
         Returns:
             dict: Información del préstamo realizado
@@ -143,32 +190,41 @@ class Libro:
         
         usuario = usuario.strip().title()
         
-        # Verificar disponibilidad
-        if not self.esta_disponible():
-            raise LibroNoDisponibleError(self.titulo, self.stock_disponible)
+        with self.lock:
+            # Verificar disponibilidad
+            if not self.esta_disponible():
+                raise LibroNoDisponibleError(self.titulo, self.stock_disponible)
+            
+            # Realizar préstamo
+            fecha_prestamo = fecha_prestamo or datetime.now()
+            prestamo = {
+                'usuario': usuario,
+                'fecha_prestamo': fecha_prestamo,
+                'fecha_devolucion_esperada': fecha_prestamo + timedelta(days=14),
+                'devuelto': False,
+                'id_prestamo': self.total_prestamos + 1
+            }
+            self._restaurar_prestamo(prestamo)
         
-        # Realizar préstamo
+        return prestamo
+    
+    def _restaurar_prestamo(self, prestamo: Dict):
+        """Registra un préstamo activo ya construido y descuenta el stock."""
         self.stock_disponible -= 1
+        self.total_prestamos = max(self.total_prestamos, prestamo['id_prestamo'])
         
-        prestamo = {
-            'usuario': usuario,
-            'fecha_prestamo': datetime.now(),
-            'fecha_devolucion_esperada': datetime.now() + timedelta(days=14),
-            'devuelto': False,
-            'id_prestamo': len(self.historial_prestamos) + 1
-        }
-        
-        self.prestamos_activos.append(prestamo)
-        self.historial_prestamos.append(prestamo.copy())
-        
-        return prestamo
+        id_prestamo = prestamo['id_prestamo']
+        self.prestamos_activos[id_prestamo] = prestamo
+        self._activos_por_usuario.setdefault(prestamo['usuario'], {})[id_prestamo] = prestamo
+        self.historial_prestamos.append(prestamo)
     
-    def devolver(self, usuario: str) -> Dict:
+    def devolver(self, usuario: str, fecha_devolucion: Optional[datetime] = None) -> Dict:
         """
         Devuelve un ejemplar del libro.
         
         Args:
             usuario (str): Nombre del usuario que devuelve el libro
+            fecha_devolucion (datetime, optional): Fecha de devolución (por defecto, ahora)
             
         Returns:
             dict: Información de la devolución
@@ -178,38 +234,35 @@ class Libro:
         """
         usuario = usuario.strip().title()
         
-        # Buscar préstamo activo del usuario
-        prestamo_activo = None
-        for i, prestamo in enumerate(self.prestamos_activos):
-            if prestamo['usuario'] == usuario:
-                prestamo_activo = prestamo
-                del self.prestamos_activos[i]
-                break
-        
-        if not prestamo_activo:
-            raise ValueError(f"El usuario '{usuario}' no tiene préstamos activos de '{self.titulo}'")
-        
-        # Procesar devolución
-        self.stock_disponible += 1
-        fecha_devolucion = datetime.now()
+        with self.lock:
+            # Buscar el préstamo activo más antiguo del usuario (O(1))
+            activos_usuario = self._activos_por_usuario.get(usuario)
+            if not activos_usuario:
+                raise ValueError(f"El usuario '{usuario}' no tiene préstamos activos de '{self.titulo}'")
+            
+            id_prestamo = next(iter(activos_usuario))
+            prestamo_activo = activos_usuario.pop(id_prestamo)
+            if not activos_usuario:
+                del self._activos_por_usuario[usuario]
+            del self.prestamos_activos[id_prestamo]
+            
+            # Procesar devolución
+            self.stock_disponible += 1
+        fecha_devolucion = fecha_devolucion or datetime.now()
         
-        # Actualizar historial
-        for prestamo in self.historial_prestamos:
-            if (prestamo['usuario'] == usuario and 
-                prestamo['id_prestamo'] == prestamo_activo['id_prestamo'] and
-                not prestamo['devuelto']):
-                prestamo['devuelto'] = True
-                prestamo['fecha_devolucion_real'] = fecha_devolucion
-                break
+        # Actualizar historial (el registro es compartido con el historial)
+        prestamo_activo['devuelto'] = True
+        prestamo_activo['fecha_devolucion_real'] = fecha_devolucion
         
         # Calcular días de retraso
         dias_retraso = max(0, (fecha_devolucion - prestamo_activo['fecha_devolucion_esperada']).days)
         
         return {
             'usuario': usuario,
+            'id_prestamo': id_prestamo,
             'fecha_devolucion': fecha_devolucion,
             'dias_retraso': dias_retraso,
-            'multa': dias_retraso * 0.50  # $0.50 por día de retraso
+            'multa': calcular_multa(dias_retraso)
         }
     
     def obtener_info(self) -> Dict:
@@ -225,7 +278,7 @@ class Libro:
             'stock_total': self.stock_total,
             'stock_disponible': self.stock_disponible,
             'prestamos_activos': len(self.prestamos_activos),
-            'total_prestamos': len(self.historial_prestamos),
+            'total_prestamos': self.total_prestamos,
             'disponible': self.esta_disponible(),
             'fecha_agregado': self.fecha_agregado.strftime('%d/%m/%Y')
         }
@@ -245,18 +298,49 @@ class Biblioteca:
     Clase que representa una biblioteca con sistema de préstamos.
     """
     
-    def __init__(self, nombre: str = "Biblioteca Central"):
+    def __init__(self, nombre: str = "Biblioteca Central",
+                 almacen: Optional[AlmacenEventos] = None):
         """
         Inicializa la biblioteca.
         
         Args:
             nombre (str): Nombre de la biblioteca
+            almacen (AlmacenEventos, optional): Almacén persistente de eventos y
+                préstamos. Si se indica, en memoria solo se conserva una ventana
+                reciente y el historial completo se consulta en el almacén.
         """
         self.nombre = nombre
         self.catalogo: Dict[str, Libro] = {}
         self.usuarios_registrados = set()
-        self.historial_sistema = []
+        self.almacen = almacen
+        self._limite_historial = almacen.ventana if almacen else None
+        self._reproduciendo = False
+        self.historial_sistema = deque(maxlen=almacen.ventana if almacen else 100)
         self.fecha_creacion = datetime.now()
+        self.indice = IndiceBusqueda()
+        
+        # Índice de disponibilidad (títulos con stock > 0, en orden de alta)
+        # y contadores globales mantenidos en cada operación. Un título que
+        # vuelve a tener stock se agrega al final; si eso rompe el orden de
+        # alta, se reordena al listar (ver listar_libros_disponibles).
+        self._disponibles: Dict[str, Libro] = {}
+        self._orden_alta: Dict[str, int] = {}
+        self._disponibles_desordenados = False
+        self._total_ejemplares = 0
+        self._ejemplares_disponibles = 0
+        self._total_prestamos = 0
+        
+        # Préstamos activos ordenados por fecha de devolución esperada
+        self.vencimientos = PlanificadorVencimientos()
+        
+        # Lista de espera por título (ServicioPrestamos). Si hay una, todo
+        # préstamo la respeta y toda devolución la atiende, aunque se llame
+        # directamente a prestar_libro o devolver_libro.
+        self.lista_espera = None
+        
+        # Protege el catálogo, los índices y los contadores compartidos.
+        # Orden de adquisición: primero libro.lock, después este cerrojo.
+        self._lock = threading.RLock()
     
     def agregar_libro(self, titulo: str, autor: str, stock: int = 1) -> Libro:
         """
@@ -276,26 +360,70 @@ class Biblioteca:
         try:
             titulo_normalizado = titulo.strip().title()
             
-            if titulo_normalizado in self.catalogo:
-                # Si el libro ya existe, agregar al stock
-                libro_existente = self.catalogo[titulo_normalizado]
-                libro_existente.stock_total += stock
-                libro_existente.stock_disponible += stock
+            with self._lock:
+                libro_existente = self.catalogo.get(titulo_normalizado)
+                if libro_existente is None:
+                    # Crear nuevo libro
+                    nuevo_libro = Libro(titulo, autor, stock, self._limite_historial)
+                    self._alta_libro(titulo_normalizado, nuevo_libro)
+                    
+                    self._registrar_evento(f"Libro agregado: '{titulo_normalizado}' por {autor}",
+                                           tipo='alta', titulo=titulo_normalizado,
+                                           datos={'titulo': titulo, 'autor': autor, 'stock': stock})
+                    return nuevo_libro
+            
+            # Si el libro ya existe, agregar al stock
+            with libro_existente.lock, self._lock:
+                self._sumar_stock(titulo_normalizado, libro_existente, stock)
                 
-                self._registrar_evento(f"Stock actualizado para '{titulo_normalizado}': +{stock} ejemplares")
+                self._registrar_evento(f"Stock actualizado para '{titulo_normalizado}': +{stock} ejemplares",
+                                       tipo='stock', titulo=titulo_normalizado,
+                                       datos={'titulo': titulo, 'autor': autor, 'stock': stock})
+                self._atender_espera(titulo_normalizado)
                 return libro_existente
-            else:
-                # Crear nuevo libro
-                nuevo_libro = Libro(titulo, autor, stock)
-                self.catalogo[titulo_normalizado] = nuevo_libro
-                
-                self._registrar_evento(f"Libro agregado: '{titulo_normalizado}' por {autor}")
-                return nuevo_libro
                 
         except ValueError as e:
             self._registrar_evento(f"Error al agregar libro: {e}")
             raise
     
+    def cargar_catalogo(self, fuente: Union[str, IO, Iterable[Dict]], formato: Optional[str] = None,
+                        tamano_lote: int = 10000) -> Dict:
+        """
+        Carga masivamente libros desde un CSV, un archivo JSON-lines o registros en memoria.
+        
+        Los registros se leen en streaming y se procesan por lotes: cada lote
+        se valida con las mismas reglas que Libro, fusiona títulos repetidos
+        sumando su stock y deja un único evento de resumen en el historial.
+        
+        Args:
+            fuente: Ruta del archivo, archivo abierto o iterable de diccionarios
+                con las claves 'titulo', 'autor' y 'stock' (opcional, 1 por defecto)
+            formato (str, optional): 'csv' o 'jsonl' (se deduce de la extensión)
+            tamano_lote (int): Registros por lote
+            
+        Returns:
+            dict: Resumen con leídos, nuevos, actualizados, rechazados, lotes y errores
+            
+        Raises:
+            ValueError: Si el formato no es válido o el tamaño de lote no es positivo
+        """
+        if tamano_lote <= 0:
+            raise ValueError("El tamaño de lote debe ser mayor que cero")
+        
+        resumen = {'leidos': 0, 'nuevos': 0, 'actualizados': 0,
+                   'rechazados': 0, 'lotes': 0, 'errores': []}
+        lote = []
+        for registro in self._leer_registros(fuente, formato):
+            resumen['leidos'] += 1
+            lote.append((resumen['leidos'], registro))
+            if len(lote) >= tamano_lote:
+                self._procesar_lote_catalogo(lote, resumen)
+                lote = []
+        if lote:
+            self._procesar_lote_catalogo(lote, resumen)
+        
+        return resumen
+    
     def prestar_libro(self, titulo: str, usuario: str) -> Dict:
         """
         Presta un libro a un usuario.
@@ -309,7 +437,8 @@ class Biblioteca:
             
         Raises:
             LibroNoEncontradoError: Si el libro no existe
-            LibroNoDisponibleError: Si el libro no está disponible
+            LibroNoDisponibleError: Si el libro no está disponible o hay
+                usuarios en su lista de espera
             UsuarioNoValidoError: Si el usuario no es válido
         """
         try:
@@ -321,13 +450,21 @@ class Biblioteca:
             
             # Registrar usuario si es nuevo
             usuario_normalizado = usuario.strip().title()
-            self.usuarios_registrados.add(usuario_normalizado)
             
-            # Realizar préstamo
+            # Realizar préstamo (el cerrojo del título evita prestar dos veces el último ejemplar)
             libro = self.catalogo[titulo_normalizado]
-            prestamo = libro.prestar(usuario_normalizado)
-            
-            self._registrar_evento(f"Préstamo realizado: '{titulo_normalizado}' a {usuario_normalizado}")
+            with libro.lock:
+                if self.lista_espera is not None and self.lista_espera.hay_espera(titulo_normalizado):
+                    raise LibroNoDisponibleError(titulo_normalizado, libro.stock_disponible)
+                prestamo = libro.prestar(usuario_normalizado)
+                with self._lock:
+                    self.usuarios_registrados.add(usuario_normalizado)
+                    self._tras_prestamo(titulo_normalizado, libro, prestamo)
+                    
+                    self._registrar_evento(f"Préstamo realizado: '{titulo_normalizado}' a {usuario_normalizado}",
+                                           tipo='prestamo', titulo=titulo_normalizado, usuario=usuario_normalizado,
+                                           datos={'id_prestamo': prestamo['id_prestamo'],
+                                                  'fecha_prestamo': prestamo['fecha_prestamo']})
             
             return prestamo
             
@@ -339,6 +476,8 @@ class Biblioteca:
         """
         Procesa la devolución de un libro.
         
+        Si hay lista de espera, el ejemplar se entrega al siguiente usuario.
+        
         Args:
             titulo (str): Título del libro a devolver
             usuario (str): Nombre del usuario
@@ -360,13 +499,22 @@ class Biblioteca:
             
             # Procesar devolución
             libro = self.catalogo[titulo_normalizado]
-            devolucion = libro.devolver(usuario_normalizado)
-            
-            mensaje_evento = f"Devolución: '{titulo_normalizado}' por {usuario_normalizado}"
-            if devolucion['dias_retraso'] > 0:
-                mensaje_evento += f" (Retraso: {devolucion['dias_retraso']} días, Multa: ${devolucion['multa']:.2f})"
-            
-            self._registrar_evento(mensaje_evento)
+            with libro.lock:
+                devolucion = libro.devolver(usuario_normalizado)
+                with self._lock:
+                    self._tras_devolucion(titulo_normalizado, libro, devolucion)
+                    
+                    mensaje_evento = f"Devolución: '{titulo_normalizado}' por {usuario_normalizado}"
+                    if devolucion['dias_retraso'] > 0:
+                        mensaje_evento += f" (Retraso: {devolucion['dias_retraso']} días, Multa: ${devolucion['multa']:.2f})"
+                    
+                    self._registrar_evento(mensaje_evento,
+                                           tipo='devolucion', titulo=titulo_normalizado, usuario=usuario_normalizado,
+                                           datos={'id_prestamo': devolucion['id_prestamo'],
+                                                  'fecha_devolucion': devolucion['fecha_devolucion']})
+                
+                # El ejemplar devuelto pasa al siguiente en la lista de espera
+                self._atender_espera(titulo_normalizado)
             
             return devolucion
             
@@ -387,14 +535,60 @@ class Biblioteca:
         titulo_normalizado = titulo.strip().title()
         return self.catalogo.get(titulo_normalizado)
     
+    def buscar_libros(self, consulta: str, campo: Optional[str] = None,
+                      max_errores: int = 0, limite: Optional[int] = None) -> List[Libro]:
+        """
+        Busca libros por palabras del título y/o del autor.
+        
+        La búsqueda ignora tildes y mayúsculas, trata la última palabra
+        como prefijo y admite errores tipográficos con max_errores.
+        
+        Args:
+            consulta (str): Palabras a buscar (ej: "garcia marq")
+            campo (str, optional): 'titulo', 'autor' o None para ambos
+            max_errores (int): Distancia de edición tolerada por palabra
+            limite (int, optional): Número máximo de resultados
+            
+        Returns:
+            list: Libros encontrados, ordenados por título
+            
+        Raises:
+            ValueError: Si el campo no es válido
+        """
+        claves = sorted(self.indice.buscar(consulta, campo, max_errores))
+        if limite is not None:
+            claves = claves[:limite]
+        return [self.catalogo[clave] for clave in claves]
+    
+    def autocompletar(self, prefijo: str, limite: int = 10) -> List[str]:
+        """
+        Sugiere palabras del catálogo que empiezan por un prefijo.
+        
+        Args:
+            prefijo (str): Texto escrito por el usuario
+            limite (int): Número máximo de sugerencias
+            
+        Returns:
+            list: Palabras sugeridas (normalizadas, sin tildes)
+        """
+        return self.indice.tokens_con_prefijo(prefijo, limite)
+    
     def listar_libros_disponibles(self) -> List[Libro]:
         """
         Lista todos los libros disponibles para préstamo.
         
+        Se lee del índice de disponibilidad, sin recorrer el catálogo.
+        
         Returns:
-            list: Lista de libros disponibles
+            list: Lista de libros disponibles, en orden de alta en el catálogo
         """
-        return [libro for libro in self.catalogo.values() if libro.esta_disponible()]
+        with self._lock:
+            if self._disponibles_desordenados:
+                orden = self._orden_alta
+                self._disponibles = dict(sorted(self._disponibles.items(),
+                                                key=lambda item: orden[item[0]]))
+                self._disponibles_desordenados = False
+            return list(self._disponibles.values())
     
     def listar_todos_los_libros(self) -> List[Libro]:
         """
@@ -413,10 +607,10 @@ class Biblioteca:
             dict: Estadísticas detalladas
         """
         total_libros = len(self.catalogo)
-        total_ejemplares = sum(libro.stock_total for libro in self.catalogo.values())
-        ejemplares_disponibles = sum(libro.stock_disponible for libro in self.catalogo.values())
+        total_ejemplares = self._total_ejemplares
+        ejemplares_disponibles = self._ejemplares_disponibles
         ejemplares_prestados = total_ejemplares - ejemplares_disponibles
-        total_prestamos = sum(len(libro.historial_prestamos) for libro in self.catalogo.values())
+        total_prestamos = self._total_prestamos
         
         return {
             'nombre_biblioteca': self.nombre,
@@ -429,17 +623,388 @@ class Biblioteca:
             'porcentaje_ocupacion': (ejemplares_prestados / total_ejemplares * 100) if total_ejemplares > 0 else 0
         }
     
-    def _registrar_evento(self, descripcion: str):
-        """Registra un evento en el historial del sistema."""
+    def obtener_prestamos_vencidos(self, fecha: Optional[datetime] = None) -> List[Dict]:
+        """
+        Obtiene los préstamos activos vencidos, del más atrasado al más reciente.
+        
+        Args:
+            fecha (datetime, optional): Fecha de corte (por defecto, ahora)
+            
+        Returns:
+            list: Préstamos vencidos con su título
+        """
+        with self._lock:
+            return self.vencimientos.vencidos(fecha)
+    
+    def obtener_proximos_vencimientos(self, n: int = 10) -> List[Dict]:
+        """
+        Obtiene los n préstamos activos con vencimiento más cercano.
+        
+        Args:
+            n (int): Número de préstamos a devolver
+            
+        Returns:
+            list: Préstamos con su título, ordenados por fecha límite
+        """
+        with self._lock:
+            return self.vencimientos.proximos(n)
+    
+    def procesar_multas_vencidas(self, fecha: Optional[datetime] = None) -> List[Dict]:
+        """
+        Acumula las multas de todos los préstamos vencidos y genera recordatorios.
+        
+        Args:
+            fecha (datetime, optional): Fecha de corte (por defecto, ahora)
+            
+        Returns:
+            list: Recordatorios generados, uno por préstamo vencido
+        """
+        with self._lock:
+            recordatorios = self.vencimientos.procesar_multas(fecha)
+            if recordatorios:
+                total_multas = sum(r['multa'] for r in recordatorios)
+                self._registrar_evento(
+                    f"Multas procesadas: {len(recordatorios)} préstamos vencidos, total ${total_multas:.2f}"
+                )
+        return recordatorios
+    
+    # ---------- Historial persistente ----------
+    
+    def consultar_historial(self, titulo: Optional[str] = None, usuario: Optional[str] = None,
+                            desde: Optional[datetime] = None, hasta: Optional[datetime] = None,
+                            tipo: Optional[str] = None, limite: Optional[int] = None) -> List[Dict]:
+        """
+        Consulta el historial completo de eventos en el almacén persistente.
+        
+        Args:
+            titulo (str, optional): Filtrar por título
+            usuario (str, optional): Filtrar por usuario
+            desde (datetime, optional): Fecha inicial (inclusive)
+            hasta (datetime, optional): Fecha final (exclusiva)
+            tipo (str, optional): 'alta', 'stock', 'prestamo', 'devolucion' o 'info'
+            limite (int, optional): Número máximo de eventos
+            
+        Returns:
+            list: Eventos en orden cronológico
+            
+        Raises:
+            BibliotecaError: Si la biblioteca no tiene almacén configurado
+        """
+        almacen = self._requerir_almacen()
+        return almacen.consultar_eventos(
+            titulo=titulo.strip().title() if titulo else None,
+            usuario=usuario.strip().title() if usuario else None,
+            desde=desde, hasta=hasta, tipo=tipo, limite=limite
+        )
+    
+    def consultar_prestamos(self, titulo: Optional[str] = None, usuario: Optional[str] = None,
+                            desde: Optional[datetime] = None, hasta: Optional[datetime] = None,
+                            limite: Optional[int] = None) -> List[Dict]:
+        """
+        Consulta el historial completo de préstamos en el almacén persistente.
+        
+        Args:
+            titulo (str, optional): Filtrar por título
+            usuario (str, optional): Filtrar por usuario
+            desde (datetime, optional): Fecha de préstamo inicial (inclusive)
+            hasta (datetime, optional): Fecha de préstamo final (exclusiva)
+            limite (int, optional): Número máximo de préstamos
+            
+        Returns:
+            list: Préstamos ordenados por fecha de préstamo
+            
+        Raises:
+            BibliotecaError: Si la biblioteca no tiene almacén configurado
+        """
+        almacen = self._requerir_almacen()
+        return almacen.consultar_prestamos(
+            titulo=titulo.strip().title() if titulo else None,
+            usuario=usuario.strip().title() if usuario else None,
+            desde=desde, hasta=hasta, limite=limite
+        )
+    
+    def guardar_snapshot(self):
+        """
+        Guarda una instantánea del catálogo en el almacén.
+        
+        Al restaurar solo se reproducen los eventos posteriores a ella.
+        
+        El estado de los libros y la posición del registro se toman juntos:
+        con los cerrojos de todos los libros (en orden de título) y después
+        el de la biblioteca, el mismo orden que usan préstamos y devoluciones.
+        
+        Raises:
+            BibliotecaError: Si la biblioteca no tiene almacén configurado
+        """
+        almacen = self._requerir_almacen()
+        while True:
+            with self._lock:
+                claves = sorted(self.catalogo)
+            with ExitStack() as cerrojos:
+                for clave in claves:
+                    cerrojos.enter_context(self.catalogo[clave].lock)
+                cerrojos.enter_context(self._lock)
+                if len(self.catalogo) != len(claves):
+                    continue  # se agregó un libro mientras se tomaban los cerrojos
+                libros = [{
+                    'titulo': libro.titulo,
+                    'autor': libro.autor,
+                    'stock_total': libro.stock_total,
+                    'total_prestamos': libro.total_prestamos,
+                    'fecha_agregado': libro.fecha_agregado,
+                    'prestamos_activos': list(libro.prestamos_activos.values())
+                } for libro in self.catalogo.values()]
+                almacen.guardar_snapshot(self.nombre, sorted(self.usuarios_registrados), libros)
+                return
+    
+    @classmethod
+    def restaurar(cls, almacen: AlmacenEventos, nombre: Optional[str] = None) -> 'Biblioteca':
+        """
+        Reconstruye una biblioteca desde la última instantánea y el registro posterior.
+        
+        Args:
+            almacen (AlmacenEventos): Almacén con los eventos guardados
+            nombre (str, optional): Nombre de la biblioteca (por defecto, el de la instantánea)
+            
+        Returns:
+            Biblioteca: Biblioteca con el catálogo y los préstamos activos restaurados
+        """
+        snapshot = almacen.cargar_snapshot()
+        if nombre is None:
+            nombre = snapshot['nombre'] if snapshot else "Biblioteca Central"
+        biblioteca = cls(nombre, almacen)
+        biblioteca._reproduciendo = True
+        try:
+            ultimo_evento = 0
+            if snapshot:
+                ultimo_evento = snapshot['ultimo_evento']
+                biblioteca.usuarios_registrados.update(snapshot['usuarios'])
+                for datos in snapshot['libros']:
+                    biblioteca._restaurar_libro(datos)
+            
+            for evento in almacen.eventos_desde(ultimo_evento):
+                biblioteca._aplicar_evento(evento)
+        finally:
+            biblioteca._reproduciendo = False
+        
+        biblioteca.historial_sistema.extend(
+            {'timestamp': evento['timestamp'], 'descripcion': evento['descripcion']}
+            for evento in almacen.eventos_recientes(almacen.ventana)
+        )
+        return biblioteca
+    
+    def _restaurar_libro(self, datos: Dict):
+        """Recrea un libro (con sus préstamos activos) a partir de la instantánea."""
+        libro = Libro(datos['titulo'], datos['autor'], 0, self._limite_historial)
+        libro.stock_total = libro.stock_disponible = datos['stock_total']
+        libro.fecha_agregado = datetime.fromisoformat(datos['fecha_agregado'])
+        for prestamo in datos['prestamos_activos']:
+            libro._restaurar_prestamo(prestamo)
+        libro.total_prestamos = datos['total_prestamos']
+        
+        self._alta_libro(libro.titulo, libro)
+        self._total_prestamos += libro.total_prestamos
+        for prestamo in datos['prestamos_activos']:
+            self.vencimientos.registrar(libro.titulo, prestamo)
+    
+    def _aplicar_evento(self, evento: Dict):
+        """Reproduce un evento del registro sobre el estado en memoria."""
+        tipo, datos = evento['tipo'], evento['datos']
+        if tipo in ('alta', 'stock'):
+            self.agregar_libro(datos['titulo'], datos['autor'], datos['stock'])
+        elif tipo == 'carga':
+            self._aplicar_lote_catalogo(datos['libros'])
+        elif tipo == 'prestamo':
+            libro = self.catalogo[evento['titulo']]
+            self.usuarios_registrados.add(evento['usuario'])
+            prestamo = libro.prestar(evento['usuario'], datos['fecha_prestamo'])
+            self._tras_prestamo(evento['titulo'], libro, prestamo)
+        elif tipo == 'devolucion':
+            libro = self.catalogo[evento['titulo']]
+            devolucion = libro.devolver(evento['usuario'], datos['fecha_devolucion'])
+            self._tras_devolucion(evento['titulo'], libro, devolucion)
+    
+    # ---------- Carga masiva ----------
+    
+    @staticmethod
+    def _leer_registros(fuente, formato: Optional[str]) -> Iterator[Any]:
+        """Recorre los registros de la fuente sin cargarla completa en memoria."""
+        if isinstance(fuente, (str, os.PathLike)):
+            if formato is None:
+                extension = os.path.splitext(str(fuente))[1].lower()
+                formato = FORMATOS_CATALOGO.get(extension)
+            Biblioteca._validar_formato(formato)
+            with open(fuente, encoding='utf-8', newline='') as archivo:
+                yield from Biblioteca._leer_archivo(archivo, formato)
+        elif hasattr(fuente, 'read'):
+            Biblioteca._validar_formato(formato)
+            yield from Biblioteca._leer_archivo(fuente, formato)
+        else:
+            yield from fuente
+    
+    @staticmethod
+    def _validar_formato(formato: Optional[str]):
+        """Verifica que el formato de carga sea conocido."""
+        if formato not in ('csv', 'jsonl'):
+            raise ValueError(f"Formato de catálogo no válido: {formato!r}. Use 'csv' o 'jsonl'")
+    
+    @staticmethod
+    def _leer_archivo(archivo: IO, formato: str) -> Iterator[Any]:
+        """Produce diccionarios (CSV) o líneas sin decodificar (JSON-lines)."""
+        if formato == 'csv':
+            yield from csv.DictReader(archivo)
+        else:
+            for linea in archivo:
+                if linea.strip():
+                    yield linea
+    
+    def _procesar_lote_catalogo(self, lote: List[Tuple[int, Any]], resumen: Dict):
+        """Valida, fusiona y aplica un lote de registros de catálogo."""
+        fusionados: Dict[str, List] = {}
+        rechazados = 0
+        for numero, registro in lote:
+            try:
+                if isinstance(registro, str):
+                    registro = json.loads(registro)
+                titulo = Libro._validar_titulo(registro.get('titulo'))
+                autor = Libro._validar_autor(registro.get('autor'))
+                stock = Libro._validar_stock(_a_entero(registro.get('stock', 1)))
+            except (ValueError, TypeError, AttributeError) as e:
+                rechazados += 1
+                if len(resumen['errores']) < MAX_ERRORES_CARGA:
+                    resumen['errores'].append({'registro': numero, 'error': str(e)})
+                continue
+            
+            if titulo in fusionados:
+                fusionados[titulo][2] += stock
+            else:
+                fusionados[titulo] = [titulo, autor, stock]
+        
+        libros = list(fusionados.values())
+        nuevos, actualizados = self._aplicar_lote_catalogo(libros)
+        
+        resumen['lotes'] += 1
+        resumen['nuevos'] += nuevos
+        resumen['actualizados'] += actualizados
+        resumen['rechazados'] += rechazados
+        self._registrar_evento(
+            f"Carga de catálogo (lote {resumen['lotes']}): {nuevos} nuevos, "
+            f"{actualizados} actualizados, {rechazados} rechazados",
+            tipo='carga', datos={'libros': libros}
+        )
+        if self.lista_espera is not None:
+            for titulo, _, _ in libros:
+                self._atender_espera(titulo)
+    
+    def _aplicar_lote_catalogo(self, libros: List[List]) -> Tuple[int, int]:
+        """
+        Agrega al catálogo libros ya validados y fusionados.
+        
+        Returns:
+            tuple: (libros nuevos, libros existentes con stock actualizado)
+        """
+        existentes = []
+        with self._lock:
+            for titulo, autor, stock in libros:
+                libro = self.catalogo.get(titulo)
+                if libro is None:
+                    self._alta_libro(titulo, Libro._desde_validados(titulo, autor, stock,
+                                                                    self._limite_historial))
+                else:
+                    existentes.append((libro, stock))
+        
+        for libro, stock in existentes:
+            with libro.lock, self._lock:
+                self._sumar_stock(libro.titulo, libro, stock)
+        
+        return len(libros) - len(existentes), len(existentes)
+    
+    def _requerir_almacen(self) -> AlmacenEventos:
+        """Devuelve el almacén configurado o lanza un error si no hay."""
+        if self.almacen is None:
+            raise BibliotecaError("La biblioteca no tiene un almacén de eventos configurado")
+        return self.almacen
+    
+    def _persistir(self) -> bool:
+        """Indica si las operaciones deben escribirse en el almacén."""
+        return self.almacen is not None and not self._reproduciendo
+    
+    # ---------- Mantenimiento de índices ----------
+    
+    def _alta_libro(self, clave: str, libro: Libro):
+        """Agrega un libro nuevo al catálogo, al índice de búsqueda y a los contadores."""
+        self.catalogo[clave] = libro
+        self._orden_alta[clave] = len(self._orden_alta)
+        self.indice.agregar(clave, libro.titulo, libro.autor)
+        self._total_ejemplares += libro.stock_total
+        self._ejemplares_disponibles += libro.stock_disponible
+        self._actualizar_disponibilidad(clave, libro)
+    
+    def _sumar_stock(self, clave: str, libro: Libro, stock: int):
+        """Suma ejemplares a un libro existente (con los cerrojos tomados)."""
+        libro.stock_total += stock
+        libro.stock_disponible += stock
+        self._total_ejemplares += stock
+        self._ejemplares_disponibles += stock
+        self._actualizar_disponibilidad(clave, libro)
+    
+    def _tras_prestamo(self, clave: str, libro: Libro, prestamo: Dict):
+        """Actualiza contadores, índices y almacén tras un préstamo."""
+        self._ejemplares_disponibles -= 1
+        self._total_prestamos += 1
+        self._actualizar_disponibilidad(clave, libro)
+        self.vencimientos.registrar(clave, prestamo)
+        if self._persistir():
+            self.almacen.registrar_prestamo(clave, prestamo)
+    
+    def _tras_devolucion(self, clave: str, libro: Libro, devolucion: Dict):
+        """Actualiza contadores, índices y almacén tras una devolución."""
+        self._ejemplares_disponibles += 1
+        self._actualizar_disponibilidad(clave, libro)
+        self.vencimientos.registrar_devolucion()
+        if self._persistir():
+            self.almacen.registrar_devolucion(clave, devolucion['id_prestamo'],
+                                              devolucion['fecha_devolucion'])
+    
+    def _actualizar_disponibilidad(self, clave: str, libro: Libro):
+        """Agrega o quita el libro del índice de disponibles según su stock."""
+        if libro.esta_disponible():
+            if clave not in self._disponibles:
+                if (self._disponibles and
+                        self._orden_alta[clave] < self._orden_alta[next(reversed(self._disponibles))]):
+                    self._disponibles_desordenados = True
+                self._disponibles[clave] = libro
+        else:
+            self._disponibles.pop(clave, None)
+    
+    def _atender_espera(self, clave: str):
+        """Entrega los ejemplares libres a la lista de espera, si hay una (tras registrar el evento)."""
+        if self.lista_espera is not None:
+            with self.catalogo[clave].lock:
+                self.lista_espera.atender_espera(clave)
+    
+    def _registrar_evento(self, descripcion: str, tipo: str = 'info',
+                          titulo: Optional[str] = None, usuario: Optional[str] = None,
+                          datos: Optional[Dict] = None):
+        """
+        Registra un evento en el historial del sistema.
+        
+        En memoria solo se conserva una ventana de eventos recientes; si hay
+        almacén configurado, el evento también se agrega al registro persistente.
+        """
+        if self._reproduciendo:
+            return
+        
         evento = {
             'timestamp': datetime.now(),
             'descripcion': descripcion
         }
-        self.historial_sistema.append(evento)
-        
-        # Mantener solo los últimos 100 eventos
-        if len(self.historial_sistema) > 100:
-            self.historial_sistema.pop(0)
+        with self._lock:
+            self.historial_sistema.append(evento)
+            
+            if self.almacen is not None:
+                self.almacen.registrar_evento(evento['timestamp'], tipo, descripcion,
+                                              titulo=titulo, usuario=usuario, datos=datos)
     
     def mostrar_historial(self, limite: int = 10):
         """
@@ -455,12 +1020,24 @@ class Biblioteca:
         print(f"\n📋 HISTORIAL DE EVENTOS ({self.nombre})")
         print("=" * 50)
         
-        eventos_recientes = self.historial_sistema[-limite:]
-        for evento in reversed(eventos_recientes):
+        if self.almacen is not None and limite > len(self.historial_sistema):
+            # La ventana en memoria no alcanza: leer del almacén
+            eventos_recientes = reversed(self.almacen.eventos_recientes(limite))
+        else:
+            eventos_recientes = islice(reversed(self.historial_sistema), limite)
+        
+        for evento in eventos_recientes:
             timestamp = evento['timestamp'].strftime("%d/%m/%Y %H:%M:%S")
             print(f"[{timestamp}] {evento['descripcion']}")
 
 
+def _a_entero(valor: Any) -> Any:
+    """Convierte a entero los números leídos como texto (ej: desde CSV)."""
+    if isinstance(valor, str) and valor.strip().lstrip('-').isdigit():
+        return int(valor)
+    return valor
+
+
 # ==================== FUNCIONES DE DEMOSTRACIÓN ====================
 
 def demo_basica_biblioteca():
@@ -585,16 +1162,15 @@ def sistema_interactivo():
     
     # Agregar algunos libros de ejemplo
     libros_iniciales = [
-        ("El Principito", "Antoine de Saint-Exupéry", 2),
-        ("Cien Años de Soledad", "Gabriel García Márquez", 1),
-        ("1984", "George Orwell", 3),
-        ("To Kill a Mockingbird", "Harper Lee", 2),
-        ("The Great Gatsby", "F. Scott Fitzgerald", 1)
+        {'titulo': "El Principito", 'autor': "Antoine de Saint-Exupéry", 'stock': 2},
+        {'titulo': "Cien Años de Soledad", 'autor': "Gabriel García Márquez", 'stock': 1},
+        {'titulo': "1984", 'autor': "George Orwell", 'stock': 3},
+        {'titulo': "To Kill a Mockingbird", 'autor': "Harper Lee", 'stock': 2},
+        {'titulo': "The Great Gatsby", 'autor': "F. Scott Fitzgerald", 'stock': 1}
     ]
     
     print("📚 Inicializando biblioteca con libros de ejemplo...")
-    for titulo, autor, stock in libros_iniciales:
-        biblioteca.agregar_libro(titulo, autor, stock)
+    biblioteca.cargar_catalogo(libros_iniciales)
     
     while True:
         print(f"\n" + "="*60)
@@ -668,7 +1244,13 @@ def sistema_interactivo():
                     print(f"   Stock: {info['stock_disponible']}/{info['stock_total']}")
                     print(f"   Estado: {'Disponible' if info['disponible'] else 'No disponible'}")
                 else:
-                    print(f"❌ Libro no encontrado: '{titulo}'")
+                    coincidencias = biblioteca.buscar_libros(titulo, max_errores=1, limite=5)
+                    if coincidencias:
+                        print(f"🔎 Sin coincidencia exacta. Quizás buscabas:")
+                        for coincidencia in coincidencias:
+                            print(f"   {coincidencia}")
+                    else:
+                        print(f"❌ Libro no encontrado: '{titulo}'")
                     
             elif opcion == "4":
                 libros_disponibles = biblioteca.listar_libros_disponibles()
@@ -0,0 +1,530 @@
+# Tests unitarios para el sistema de biblioteca
+# Clase 06: Manejo de Excepciones en Python
+
+import unittest
+import asyncio
+import sys
+import os
+import io
+import tempfile
+from datetime import datetime, timedelta
+from almacen_eventos import AlmacenEventos
+from servicio_prestamos import ServicioPrestamos, prueba_de_carga
+from planificador_vencimientos import PlanificadorVencimientos
+from sistema_biblioteca import (
+    Biblioteca, BibliotecaError, Libro, LibroNoDisponibleError, LibroNoEncontradoError
+)
+
+
+class TestPrestamosIndexados(unittest.TestCase):
+    """
+    Suite de tests para el registro indexado de préstamos de un Libro
+    """
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.libro = Libro("Cien Años de Soledad", "Gabriel García Márquez", 3)
+
+    def test_prestamo_compartido_con_historial(self):
+        """Test: El historial guarda el mismo registro que el préstamo activo"""
+        prestamo = self.libro.prestar("ana garcía")
+
+        self.assertIs(self.libro.historial_prestamos[0], prestamo)
+        self.assertIs(self.libro.prestamos_activos[prestamo['id_prestamo']], prestamo)
+        self.assertEqual(self.libro.stock_disponible, 2)
+
+    def test_devolver_marca_historial(self):
+        """Test: Devolver marca el registro del historial como devuelto"""
+        prestamo = self.libro.prestar("Ana García")
+        devolucion = self.libro.devolver("Ana García")
+
+        self.assertTrue(self.libro.historial_prestamos[0]['devuelto'])
+        self.assertIn('fecha_devolucion_real', prestamo)
+        self.assertEqual(devolucion['dias_retraso'], 0)
+        self.assertEqual(len(self.libro.prestamos_activos), 0)
+        self.assertEqual(self.libro.stock_disponible, 3)
+
+    def test_devolver_prestamo_mas_antiguo_del_usuario(self):
+        """Test: Con varios préstamos del mismo usuario se devuelve el más antiguo"""
+        primero = self.libro.prestar("Ana García")
+        self.libro.prestar("Carlos López")
+        segundo = self.libro.prestar("Ana García")
+
+        self.libro.devolver("Ana García")
+
+        self.assertTrue(primero['devuelto'])
+        self.assertFalse(segundo['devuelto'])
+        self.assertEqual(list(self.libro.prestamos_activos), [2, 3])
+
+    def test_devolver_sin_prestamo(self):
+        """Test: Devolver sin préstamo activo lanza ValueError"""
+        self.libro.prestar("Ana García")
+        self.libro.devolver("Ana García")
+
+        with self.assertRaises(ValueError):
+            self.libro.devolver("Ana García")
+
+
+class TestBiblioteca(unittest.TestCase):
+    """
+    Suite de tests para las operaciones de la Biblioteca
+    """
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.biblioteca = Biblioteca("Biblioteca Test")
+        self.biblioteca.agregar_libro("Don Quijote", "Miguel de Cervantes", 1)
+
+    def test_prestar_y_devolver(self):
+        """Test: Préstamo y devolución a través de la biblioteca"""
+        self.biblioteca.prestar_libro("don quijote", "Ana García")
+
+        with self.assertRaises(LibroNoDisponibleError):
+            self.biblioteca.prestar_libro("Don Quijote", "Carlos López")
+
+        self.biblioteca.devolver_libro("Don Quijote", "Ana García")
+        stats = self.biblioteca.obtener_estadisticas()
+        self.assertEqual(stats['ejemplares_disponibles'], 1)
+        self.assertEqual(stats['total_prestamos_historicos'], 1)
+
+    def test_libro_no_encontrado(self):
+        """Test: Prestar un libro inexistente lanza LibroNoEncontradoError"""
+        with self.assertRaises(LibroNoEncontradoError):
+            self.biblioteca.prestar_libro("El Hobbit", "Ana García")
+
+
+class TestDisponibilidadYEstadisticas(unittest.TestCase):
+    """
+    Suite de tests para el índice de disponibilidad y los contadores
+    """
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.biblioteca = Biblioteca("Biblioteca Test")
+        self.biblioteca.agregar_libro("Don Quijote", "Miguel de Cervantes", 1)
+        self.biblioteca.agregar_libro("1984", "George Orwell", 2)
+        self.biblioteca.agregar_libro("Rayuela", "Julio Cortázar", 0)
+
+    def titulos_disponibles(self):
+        return sorted(libro.titulo for libro in self.biblioteca.listar_libros_disponibles())
+
+    def test_disponibles_tras_prestar_y_devolver(self):
+        """Test: El índice de disponibles sigue a préstamos y devoluciones"""
+        self.assertEqual(self.titulos_disponibles(), ["1984", "Don Quijote"])
+
+        self.biblioteca.prestar_libro("Don Quijote", "Ana García")
+        self.assertEqual(self.titulos_disponibles(), ["1984"])
+
+        self.biblioteca.devolver_libro("Don Quijote", "Ana García")
+        self.biblioteca.agregar_libro("Rayuela", "Julio Cortázar", 1)
+        self.assertEqual(self.titulos_disponibles(), ["1984", "Don Quijote", "Rayuela"])
+
+    def test_disponibles_en_orden_de_alta(self):
+        """Test: Un título devuelto vuelve a su lugar en el orden del catálogo"""
+        self.biblioteca.agregar_libro("Ficciones", "Jorge Luis Borges", 1)
+        self.biblioteca.prestar_libro("Don Quijote", "Ana García")
+        self.biblioteca.devolver_libro("Don Quijote", "Ana García")
+
+        titulos = [libro.titulo for libro in self.biblioteca.listar_libros_disponibles()]
+        self.assertEqual(titulos, ["Don Quijote", "1984", "Ficciones"])
+
+        self.biblioteca.agregar_libro("Rayuela", "Julio Cortázar", 1)
+        titulos = [libro.titulo for libro in self.biblioteca.listar_libros_disponibles()]
+        self.assertEqual(titulos, ["Don Quijote", "1984", "Rayuela", "Ficciones"])
+
+    def test_estadisticas_coinciden_con_catalogo(self):
+        """Test: Los contadores coinciden con un recorrido completo del catálogo"""
+        self.biblioteca.prestar_libro("1984", "Ana García")
+        self.biblioteca.prestar_libro("1984", "Carlos López")
+        self.biblioteca.devolver_libro("1984", "Ana García")
+        self.biblioteca.agregar_libro("Don Quijote", "Miguel de Cervantes", 2)
+
+        libros = self.biblioteca.listar_todos_los_libros()
+        stats = self.biblioteca.obtener_estadisticas()
+        self.assertEqual(stats['total_ejemplares'], sum(l.stock_total for l in libros))
+        self.assertEqual(stats['ejemplares_disponibles'], sum(l.stock_disponible for l in libros))
+        self.assertEqual(stats['total_prestamos_historicos'],
+                         sum(len(l.historial_prestamos) for l in libros))
+        self.assertEqual(stats['ejemplares_prestados'], 1)
+
+
+class TestVencimientos(unittest.TestCase):
+    """
+    Suite de tests para el planificador de vencimientos
+    """
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.biblioteca = Biblioteca("Biblioteca Test")
+        self.biblioteca.agregar_libro("Don Quijote", "Miguel de Cervantes", 2)
+        self.biblioteca.agregar_libro("1984", "George Orwell", 1)
+
+        # Préstamos con fechas límite escalonadas
+        self.p1 = self.biblioteca.prestar_libro("Don Quijote", "Ana García")
+        self.p2 = self.biblioteca.prestar_libro("1984", "Carlos López")
+        self.p3 = self.biblioteca.prestar_libro("Don Quijote", "María Rodríguez")
+        base = self.p1['fecha_devolucion_esperada']
+        self.biblioteca.vencimientos = PlanificadorVencimientos()
+        for titulo, prestamo, dias in (("Don Quijote", self.p1, -5),
+                                       ("1984", self.p2, -2),
+                                       ("Don Quijote", self.p3, 3)):
+            prestamo['fecha_devolucion_esperada'] = base + timedelta(days=dias)
+            self.biblioteca.vencimientos.registrar(titulo, prestamo)
+        self.corte = base
+
+    def test_prestamos_vencidos_en_orden(self):
+        """Test: Los vencidos se devuelven del más atrasado al más reciente"""
+        vencidos = self.biblioteca.obtener_prestamos_vencidos(self.corte)
+        self.assertEqual([v['usuario'] for v in vencidos], ["Ana García", "Carlos López"])
+        self.assertEqual(vencidos[1]['titulo'], "1984")
+
+    def test_devueltos_no_aparecen(self):
+        """Test: Un préstamo devuelto deja de figurar como vencido"""
+        self.biblioteca.devolver_libro("Don Quijote", "Ana García")
+        vencidos = self.biblioteca.obtener_prestamos_vencidos(self.corte)
+        self.assertEqual([v['usuario'] for v in vencidos], ["Carlos López"])
+
+        proximos = self.biblioteca.obtener_proximos_vencimientos(5)
+        self.assertEqual([p['usuario'] for p in proximos], ["Carlos López", "María Rodríguez"])
+
+    def test_procesar_multas(self):
+        """Test: Procesar multas acumula la multa y genera recordatorios"""
+        recordatorios = self.biblioteca.procesar_multas_vencidas(self.corte)
+
+        self.assertEqual(len(recordatorios), 2)
+        self.assertEqual(recordatorios[0]['dias_retraso'], 5)
+        self.assertAlmostEqual(recordatorios[0]['multa'], 2.5)
+        self.assertAlmostEqual(self.p2['multa_acumulada'], 1.0)
+        self.assertNotIn('multa_acumulada', self.p3)
+
+
+class TestAlmacenEventos(unittest.TestCase):
+    """
+    Suite de tests para el almacén persistente de eventos
+    """
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "biblioteca.db")
+        self.almacen = AlmacenEventos(self.ruta, ventana=3)
+        self.biblioteca = Biblioteca("Biblioteca Persistente", self.almacen)
+        self.biblioteca.agregar_libro("Don Quijote", "Miguel de Cervantes", 2)
+        self.biblioteca.agregar_libro("1984", "George Orwell", 1)
+
+    def tearDown(self):
+        """Limpieza de archivos temporales"""
+        self.directorio.cleanup()
+
+    def reiniciar(self):
+        """Cierra el almacén y reconstruye la biblioteca desde disco"""
+        self.almacen.cerrar()
+        self.almacen = AlmacenEventos(self.ruta, ventana=3)
+        return Biblioteca.restaurar(self.almacen, "Biblioteca Persistente")
+
+    def test_memoria_acotada(self):
+        """Test: En memoria solo se conserva la ventana reciente"""
+        for _ in range(5):
+            self.biblioteca.prestar_libro("1984", "Ana García")
+            self.biblioteca.devolver_libro("1984", "Ana García")
+
+        libro = self.biblioteca.buscar_libro("1984")
+        self.assertEqual(len(self.biblioteca.historial_sistema), 3)
+        self.assertEqual(len(libro.historial_prestamos), 3)
+        self.assertEqual(libro.total_prestamos, 5)
+        self.assertEqual(len(self.biblioteca.consultar_prestamos(titulo="1984")), 5)
+
+    def test_consultas_historicas(self):
+        """Test: Consultas por usuario, título y rango de fechas"""
+        inicio = datetime.now()
+        self.biblioteca.prestar_libro("Don Quijote", "Ana García")
+        self.biblioteca.prestar_libro("1984", "Ana García")
+        self.biblioteca.prestar_libro("Don Quijote", "Carlos López")
+        self.biblioteca.devolver_libro("Don Quijote", "Ana García")
+
+        prestamos = self.biblioteca.consultar_prestamos(usuario="ana garcía")
+        self.assertEqual([p['titulo'] for p in prestamos], ["Don Quijote", "1984"])
+        self.assertTrue(prestamos[0]['devuelto'])
+        self.assertFalse(prestamos[1]['devuelto'])
+
+        eventos = self.biblioteca.consultar_historial(titulo="Don Quijote", desde=inicio)
+        self.assertEqual([e['tipo'] for e in eventos], ['prestamo', 'prestamo', 'devolucion'])
+
+    def test_restaurar_desde_registro(self):
+        """Test: Reinicio sin instantánea reproduce todo el registro"""
+        self.biblioteca.prestar_libro("Don Quijote", "Ana García")
+        self.biblioteca.prestar_libro("1984", "Carlos López")
+        self.biblioteca.devolver_libro("Don Quijote", "Ana García")
+
+        restaurada = self.reiniciar()
+        self.assertEqual(restaurada.obtener_estadisticas(), self.biblioteca.obtener_estadisticas())
+        self.assertEqual([p['usuario'] for p in restaurada.obtener_proximos_vencimientos()],
+                         ["Carlos López"])
+
+    def test_restaurar_desde_snapshot_y_cola(self):
+        """Test: Reinicio desde instantánea más los eventos posteriores"""
+        prestamo = self.biblioteca.prestar_libro("Don Quijote", "Ana García")
+        self.biblioteca.guardar_snapshot()
+        self.biblioteca.prestar_libro("Don Quijote", "Carlos López")
+        self.biblioteca.devolver_libro("Don Quijote", "Ana García")
+        self.biblioteca.agregar_libro("Rayuela", "Julio Cortázar", 1)
+
+        restaurada = self.reiniciar()
+        self.assertEqual(restaurada.obtener_estadisticas(), self.biblioteca.obtener_estadisticas())
+        libro = restaurada.buscar_libro("Don Quijote")
+        self.assertEqual(libro.total_prestamos, 2)
+        self.assertEqual([p['usuario'] for p in libro.prestamos_activos.values()], ["Carlos López"])
+        self.assertEqual(restaurada.consultar_prestamos(usuario="Ana García")[0]['fecha_prestamo'],
+                         prestamo['fecha_prestamo'])
+
+    def test_snapshot_durante_prestamos_concurrentes(self):
+        """Test: Una instantánea tomada mientras otros hilos prestan no pierde ni repite eventos"""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        self.biblioteca.agregar_libro("Rayuela", "Julio Cortázar", 2)
+        parar = threading.Event()
+
+        def circular(i):
+            titulo = ("Don Quijote", "1984", "Rayuela")[i % 3]
+            while not parar.is_set():
+                try:
+                    self.biblioteca.prestar_libro(titulo, f"Usuario {i}")
+                    self.biblioteca.devolver_libro(titulo, f"Usuario {i}")
+                except LibroNoDisponibleError:
+                    pass
+
+        # Cambios de hilo muy frecuentes para que la carrera aparezca si existe
+        intervalo = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=6) as pool:
+                futuros = [pool.submit(circular, i) for i in range(6)]
+                for _ in range(30):
+                    self.biblioteca.guardar_snapshot()
+                parar.set()
+                for futuro in futuros:
+                    futuro.result()
+        finally:
+            sys.setswitchinterval(intervalo)
+        self.biblioteca.prestar_libro("Rayuela", "Ana García")
+
+        restaurada = self.reiniciar()
+        self.assertEqual(restaurada.obtener_estadisticas(), self.biblioteca.obtener_estadisticas())
+        for libro in self.biblioteca.listar_todos_los_libros():
+            self.assertEqual(restaurada.buscar_libro(libro.titulo).total_prestamos, libro.total_prestamos)
+
+    def test_sin_almacen(self):
+        """Test: Las consultas históricas requieren un almacén"""
+        with self.assertRaises(BibliotecaError):
+            Biblioteca("Sin almacén").consultar_prestamos()
+
+
+class TestCargaCatalogo(unittest.TestCase):
+    """
+    Suite de tests para la carga masiva del catálogo
+    """
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.biblioteca = Biblioteca("Biblioteca Test")
+        self.biblioteca.agregar_libro("Don Quijote", "Miguel de Cervantes", 1)
+
+    def test_carga_csv_fusiona_duplicados(self):
+        """Test: CSV con títulos repetidos suma el stock y rechaza filas inválidas"""
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "catalogo.csv")
+            with open(ruta, "w", encoding="utf-8", newline="") as archivo:
+                archivo.write("titulo,autor,stock\n"
+                              "1984,George Orwell,2\n"
+                              "  1984 ,George Orwell,3\n"
+                              "don quijote,Miguel de Cervantes,4\n"
+                              "X,Autor Corto,1\n"
+                              "Rayuela,Julio Cortázar,muchos\n")
+            resumen = self.biblioteca.cargar_catalogo(ruta, tamano_lote=2)
+
+        self.assertEqual(resumen['leidos'], 5)
+        self.assertEqual(resumen['rechazados'], 2)
+        self.assertEqual(resumen['lotes'], 3)
+        self.assertEqual([e['registro'] for e in resumen['errores']], [4, 5])
+        self.assertEqual(self.biblioteca.buscar_libro("1984").stock_total, 5)
+        self.assertEqual(self.biblioteca.buscar_libro("Don Quijote").stock_disponible, 5)
+        self.assertEqual(self.biblioteca.obtener_estadisticas()['total_ejemplares'], 10)
+        self.assertEqual(len(self.biblioteca.buscar_libros("orwell")), 1)
+
+    def test_carga_jsonl_un_evento_por_lote(self):
+        """Test: JSON-lines se procesa por lotes con un evento de resumen por lote"""
+        lineas = "\n".join(
+            '{"titulo": "Libro %d", "autor": "Autor %d", "stock": 1}' % (i, i % 7)
+            for i in range(250)
+        )
+        eventos_antes = len(self.biblioteca.historial_sistema)
+        resumen = self.biblioteca.cargar_catalogo(io.StringIO(lineas + "\n{roto"),
+                                                  formato="jsonl", tamano_lote=100)
+
+        self.assertEqual(resumen['nuevos'], 250)
+        self.assertEqual(resumen['rechazados'], 1)
+        self.assertEqual(len(self.biblioteca.historial_sistema) - eventos_antes, 3)
+        self.assertEqual(len(self.biblioteca.listar_libros_disponibles()), 251)
+
+    def test_formato_desconocido(self):
+        """Test: Un archivo abierto sin formato lanza ValueError"""
+        with self.assertRaises(ValueError):
+            self.biblioteca.cargar_catalogo(io.StringIO("titulo,autor\n"))
+
+    def test_carga_se_reproduce_al_restaurar(self):
+        """Test: Las cargas masivas se reconstruyen desde el almacén"""
+        almacen = AlmacenEventos(ventana=10)
+        biblioteca = Biblioteca("Biblioteca Persistente", almacen)
+        biblioteca.cargar_catalogo([{'titulo': "1984", 'autor': "George Orwell", 'stock': 2},
+                                    {'titulo': "Rayuela", 'autor': "Julio Cortázar"}])
+
+        restaurada = Biblioteca.restaurar(almacen, "Biblioteca Persistente")
+        self.assertEqual(restaurada.obtener_estadisticas(), biblioteca.obtener_estadisticas())
+
+
+class TestServicioPrestamos(unittest.TestCase):
+    """
+    Suite de tests para el servicio concurrente de préstamos
+    """
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.biblioteca = Biblioteca("Biblioteca Test")
+        self.biblioteca.agregar_libro("1984", "George Orwell", 1)
+        self.servicio = ServicioPrestamos(self.biblioteca)
+
+    def test_sin_sobreasignacion_bajo_carga(self):
+        """Test: Muchos hilos no pueden llevarse más ejemplares que el stock"""
+        resultado = prueba_de_carga(usuarios=500, hilos=16, stock=7)
+
+        self.assertEqual(resultado['concedidos'], 7)
+        self.assertEqual(resultado['rechazados'], 493)
+        self.assertEqual(resultado['stock_disponible'], 0)
+
+    def test_lista_de_espera_recibe_devolucion(self):
+        """Test: Al devolver, el ejemplar pasa al primero en la lista de espera"""
+        self.servicio.prestar("1984", "Ana García")
+        reserva_carlos = self.servicio.reservar("1984", "Carlos López")
+        reserva_maria = self.servicio.reservar("1984", "María Rodríguez")
+        self.assertFalse(reserva_carlos.done())
+
+        # Nadie puede saltarse la fila
+        with self.assertRaises(LibroNoDisponibleError):
+            self.servicio.prestar("1984", "Pedro Martín")
+
+        self.servicio.devolver("1984", "Ana García")
+        self.assertEqual(reserva_carlos.result(timeout=1)['usuario'], "Carlos López")
+        self.assertFalse(reserva_maria.done())
+        self.assertEqual(self.servicio.usuarios_en_espera("1984"), ["María Rodríguez"])
+        self.assertEqual(self.biblioteca.buscar_libro("1984").stock_disponible, 0)
+
+    def test_cancelar_reserva(self):
+        """Test: Una reserva cancelada no recibe el ejemplar"""
+        self.servicio.prestar("1984", "Ana García")
+        reserva = self.servicio.reservar("1984", "Carlos López")
+
+        self.assertTrue(self.servicio.cancelar_reserva("1984", "carlos lópez"))
+        self.servicio.devolver("1984", "Ana García")
+        self.assertTrue(reserva.cancelled())
+        self.assertEqual(self.biblioteca.buscar_libro("1984").stock_disponible, 1)
+
+    def test_llamadas_directas_respetan_la_espera(self):
+        """Test: prestar_libro y devolver_libro directos también respetan la fila"""
+        self.servicio.prestar("1984", "Ana García")
+        reserva = self.servicio.reservar("1984", "Carlos López")
+
+        self.biblioteca.devolver_libro("1984", "Ana García")
+        self.assertEqual(reserva.result(timeout=1)['usuario'], "Carlos López")
+
+        # Nadie se salta la fila llamando directamente a la biblioteca
+        reserva_maria = self.servicio.reservar("1984", "María Rodríguez")
+        with self.assertRaises(LibroNoDisponibleError):
+            self.biblioteca.prestar_libro("1984", "Pedro Martín")
+
+        # Los ejemplares nuevos también se entregan a la fila
+        self.biblioteca.agregar_libro("1984", "George Orwell", 1)
+        self.assertEqual(reserva_maria.result(timeout=1)['usuario'], "María Rodríguez")
+        self.assertEqual(self.servicio.usuarios_en_espera("1984"), [])
+
+    def test_api_asyncio(self):
+        """Test: Reservas asyncio esperan la devolución sin bloquear el bucle"""
+        async def escenario():
+            await self.servicio.prestar_async("1984", "Ana García")
+            espera = asyncio.ensure_future(self.servicio.reservar_async("1984", "Carlos López"))
+            await asyncio.sleep(0)
+            self.assertFalse(espera.done())
+            await self.servicio.devolver_async("1984", "Ana García")
+            return await asyncio.wait_for(espera, timeout=1)
+
+        prestamo = asyncio.run(escenario())
+        self.assertEqual(prestamo['usuario'], "Carlos López")
+
+
+class TestBusquedaCatalogo(unittest.TestCase):
+    """
+    Suite de tests para el índice de búsqueda del catálogo
+    """
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.biblioteca = Biblioteca("Biblioteca Test")
+        self.biblioteca.agregar_libro("Cien Años de Soledad", "Gabriel García Márquez", 2)
+        self.biblioteca.agregar_libro("El Amor en los Tiempos del Cólera", "Gabriel García Márquez", 1)
+        self.biblioteca.agregar_libro("1984", "George Orwell", 1)
+
+    def titulos(self, libros):
+        return [libro.titulo for libro in libros]
+
+    def test_busqueda_por_autor_sin_tildes(self):
+        """Test: Búsqueda por autor ignorando tildes y mayúsculas"""
+        resultado = self.biblioteca.buscar_libros("garcia MARQUEZ", campo='autor')
+        self.assertEqual(self.titulos(resultado),
+                         ["Cien Años De Soledad", "El Amor En Los Tiempos Del Cólera"])
+
+    def test_busqueda_por_prefijo(self):
+        """Test: La última palabra de la consulta se trata como prefijo"""
+        resultado = self.biblioteca.buscar_libros("soled")
+        self.assertEqual(self.titulos(resultado), ["Cien Años De Soledad"])
+
+    def test_busqueda_aproximada(self):
+        """Test: Búsqueda tolerante a errores tipográficos"""
+        self.assertEqual(self.biblioteca.buscar_libros("owrell"), [])
+        resultado = self.biblioteca.buscar_libros("owrell", max_errores=2)
+        self.assertEqual(self.titulos(resultado), ["1984"])
+
+    def test_autocompletar(self):
+        """Test: Autocompletado de palabras del catálogo"""
+        self.assertEqual(self.biblioteca.autocompletar("ga"), ["gabriel", "garcia"])
+
+    def test_busquedas_concurrentes_con_altas(self):
+        """Test: Buscar y autocompletar desde varios hilos mientras se agregan libros"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        def alta(i):
+            self.biblioteca.agregar_libro(f"Novela {i}", f"Autora Numero{i}", 1)
+
+        def consulta(i):
+            self.biblioteca.autocompletar("nu")
+            return self.biblioteca.buscar_libros("numer", max_errores=1)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futuros = []
+            for i in range(200):
+                futuros.append(pool.submit(alta, i))
+                futuros.append(pool.submit(consulta, i))
+            for futuro in futuros:
+                futuro.result()  # relanza cualquier excepción de un hilo
+
+        self.assertEqual(len(self.biblioteca.buscar_libros("novela")), 200)
+        self.assertEqual(len(self.biblioteca.autocompletar("numero", limite=None)), 200)
+        self.assertEqual(len(self.biblioteca.indice._arbol_bk().buscar("numero0", 0)), 1)
+
+    def test_campo_invalido(self):
+        """Test: Un campo de búsqueda desconocido lanza ValueError"""
+        with self.assertRaises(ValueError):
+            self.biblioteca.buscar_libros("soledad", campo='editorial')
+
+
+if __name__ == "__main__":
+    resultado = unittest.main(exit=False, verbosity=2).result
+    sys.exit(0 if resultado.wasSuccessful() else 1)